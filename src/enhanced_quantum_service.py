@@ -1,6 +1,7 @@
 import asyncio
 import hashlib
 import json
+import os
 import random
 import time
 import sqlite3
@@ -15,6 +16,8 @@ from braket.aws import AwsDevice
 from braket.circuits import Circuit
 from braket.devices import LocalSimulator
 import math
+from collections import Counter
+from dataclasses import dataclass
 import numpy as np
 from typing import Dict, Tuple, Optional
 # AHS imports (current SDK style)
@@ -30,6 +33,48 @@ from braket.timings.time_series import TimeSeries
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+BELL_STATES = ('00', '01', '10', '11')
+
+# Small circuits on the local path are simulated directly with NumPy instead of
+# going through the Braket LocalSimulator dispatch
+NUMPY_SIM_MAX_QUBITS = 10
+_H_GATE = np.array([[1, 1], [1, -1]], dtype=np.complex128) / math.sqrt(2)
+_CNOT_GATE = np.array([
+    [1, 0, 0, 0],
+    [0, 1, 0, 0],
+    [0, 0, 0, 1],
+    [0, 0, 1, 0]
+], dtype=np.complex128).reshape(2, 2, 2, 2)
+
+
+def _ry_gate(angle: float) -> np.ndarray:
+    c, s = math.cos(angle / 2), math.sin(angle / 2)
+    return np.array([[c, -s], [s, c]], dtype=np.complex128)
+
+
+@dataclass(slots=True, frozen=True)
+class DeviceInfo:
+    """Immutable view of the device fields read on the signature hot paths"""
+    name: str
+    type: str
+    arn: str
+    region: str
+    max_qubits: int
+    supports_bell_states: bool
+    async_required: bool
+
+    @classmethod
+    def from_dict(cls, device: Dict[str, Any]) -> 'DeviceInfo':
+        return cls(
+            name=device['name'],
+            type=device['type'],
+            arn=device['arn'],
+            region=device['region'],
+            max_qubits=device['max_qubits'],
+            supports_bell_states=device['supports_bell_states'],
+            async_required=device['async_required']
+        )
+
 
 class QuantumDeviceManager:
     """Manages different quantum devices and their capabilities"""
@@ -109,11 +154,19 @@ class QuantumDeviceManager:
                 'async_required': True
             }
         }
+        self._device_records = {
+            device_id: DeviceInfo.from_dict(device)
+            for device_id, device in self.devices.items()
+        }
 
     def get_device_info(self, device_id: str) -> Dict[str, Any]:
         """Get information about a specific device"""
         return self.devices.get(device_id, {})
 
+    def get_device_record(self, device_id: str) -> Optional[DeviceInfo]:
+        """Get the prebuilt DeviceInfo record for a device (None if unknown)"""
+        return self._device_records.get(device_id)
+
     def get_available_devices(self) -> Dict[str, Dict[str, Any]]:
         """Get all available devices"""
         return self.devices
@@ -157,6 +210,9 @@ class AsyncQuantumJobManager:
                     estimated_completion DATETIME
                 )
             """)
+            # Status and per-device job counts are answered from these indexes alone
+            conn.execute("CREATE INDEX IF NOT EXISTS idx_quantum_jobs_status ON quantum_jobs(status)")
+            conn.execute("CREATE INDEX IF NOT EXISTS idx_quantum_jobs_device_id ON quantum_jobs(device_id)")
             conn.commit()
 
     def create_job(self, device_id: str, device_arn: str, user_name: str, user_message: str) -> str:
@@ -393,19 +449,64 @@ class AsyncQuantumJobManager:
 class EnhancedQuantumService:
     """Enhanced quantum service with multi-device support"""
 
+    # Occupancy grid covering the 0-100% wall at 0.5% resolution
+    _OCCUPANCY_RESOLUTION_PCT = 0.5
+    _OCCUPANCY_CELLS = 200
+
+    # Seconds a successful availability check stays valid
+    AVAILABILITY_TTL_SIMULATOR = 300
+    AVAILABILITY_TTL_QPU = 30
+
+    # Simulated QPU availability, out of 256 (devices not listed are always available)
+    SIMULATED_AVAILABILITY_THRESHOLDS = {
+        'ionq_forte': 192,    # 75% available
+        'iqm_garnet': 171,    # 67% available
+        'quera_aquila': 128,  # 50% available
+        'rigetti_ankaa': 192  # 75% available
+    }
+
     def __init__(self):
         self.local_simulator = LocalSimulator()
         self.device_manager = QuantumDeviceManager()
         self.job_manager = AsyncQuantumJobManager()
         self._circuit_cache = {}
+        # The Bell state circuit is the same for every device, so build it once
+        self._bell_circuit = Circuit().h(0).cnot(0, 1).measure(0).measure(1)
         self._aws_devices = {}
         self._aws_session = None
+        # Artificial queue/execution delays are only useful for demos; off by default
+        self.simulate_waits = os.getenv("SIMULATE_QPU_WAIT", "false").lower() == "true"
+        # Signature crypto/database helpers, created lazily (signature_wall_system imports this module)
+        self._crypto_service = None
+        self._signature_database = None
+        self._np_rng = np.random.default_rng()
+        # device_id -> (checked_at, status); only successful checks are cached
+        self._availability_cache: Dict[str, Tuple[float, Dict[str, Any]]] = {}
         self._initialize_aws_session()
 
+    def _get_crypto_service(self):
+        """Get the shared QuantumResistantCrypto instance"""
+        if self._crypto_service is None:
+            from signature_wall_system import QuantumResistantCrypto
+            self._crypto_service = QuantumResistantCrypto()
+        return self._crypto_service
+
+    def _get_signature_database(self):
+        """Get the shared SignatureWallDatabase instance"""
+        if self._signature_database is None:
+            from signature_wall_system import SignatureWallDatabase
+            self._signature_database = SignatureWallDatabase()
+        return self._signature_database
+
+    def reset_crypto(self):
+        """Drop the cached crypto and signature database instances (used for test isolation)"""
+        self._crypto_service = None
+        self._signature_database = None
+
     async def process_quantum_signature(self, name: str, response: str, quantum_device: str) -> Dict[str, Any]:
         """Process quantum signature with dual device generation - main entry point"""
         try:
-            device_info = self.device_manager.get_device_info(quantum_device)
+            device_info = self.device_manager.get_device_record(quantum_device)
             if not device_info:
                 return {
                     'success': False,
@@ -420,7 +521,7 @@ class EnhancedQuantumService:
 
             # Task 2: User-selected device
             device_job_id = self.job_manager.create_job(
-                quantum_device, device_info['arn'], name, f"{response}_device"
+                quantum_device, device_info.arn, name, f"{response}_device"
             )
 
             # Process local simulator immediately
@@ -449,7 +550,7 @@ class EnhancedQuantumService:
             )
 
             # Handle user-selected device
-            if device_info.get('async_required', False):
+            if device_info.async_required:
                 # Start background task for user-selected device
                 asyncio.create_task(self._process_quantum_job_for_signature(device_job_id, quantum_device, name, response))
 
@@ -462,10 +563,10 @@ class EnhancedQuantumService:
                     'local_job_id': local_job_id,
                     'device_job_id': device_job_id,
                     'device_info': {
-                        'name': device_info['name'],
+                        'name': device_info.name,
                         'device_job_id': device_job_id,
                         'local_job_id': local_job_id,
-                        'type': device_info['type'],
+                        'type': device_info.type,
                         'estimated_completion': self._estimate_completion_time(device_info)
                     },
                     'local_result': local_result
@@ -485,8 +586,8 @@ class EnhancedQuantumService:
                 device_result = {
                     'quantum_number': device_quantum_number,
                     'entanglement_data': device_entanglement_data,
-                    'device_name': device_info['name'],
-                    'device_type': device_info['type'],
+                    'device_name': device_info.name,
+                    'device_type': device_info.type,
                     'processing_time_ms': duration_ms
                 }
 
@@ -504,7 +605,7 @@ class EnhancedQuantumService:
                     'local_job_id': local_job_id,
                     'device_job_id': device_job_id,
                     'device_info': {
-                        'name': device_info['name'],
+                        'name': device_info.name,
                         'device_job_id': device_job_id,
                         'local_job_id': local_job_id
                     },
@@ -543,7 +644,7 @@ class EnhancedQuantumService:
                 'async': True,
                 'job_id': job_id,
                 'device': device_info,
-                'estimated_completion': self._estimate_completion_time(device_info),
+                'estimated_completion': self._estimate_completion_time(self.device_manager.get_device_record(device_id)),
                 'message': f'Quantum job submitted to {device_info["name"]}. Processing will take approximately {device_info["typical_runtime"]}.'
             }
         else:
@@ -553,7 +654,7 @@ class EnhancedQuantumService:
     async def _process_quantum_job(self, job_id: str, device_id: str, name: str, message: str):
         """Process quantum job asynchronously"""
         try:
-            device_info = self.device_manager.get_device_info(device_id)
+            device_info = self.device_manager.get_device_record(device_id)
 
             # Update job status to submitted
             self.job_manager.update_job_status(
@@ -589,7 +690,7 @@ class EnhancedQuantumService:
     async def _process_quantum_job_for_signature(self, job_id: str, device_id: str, name: str, response: str):
         """Process quantum job asynchronously for signature creation"""
         try:
-            device_info = self.device_manager.get_device_info(device_id)
+            device_info = self.device_manager.get_device_record(device_id)
 
             # Update job status to submitted
             self.job_manager.update_job_status(
@@ -610,8 +711,8 @@ class EnhancedQuantumService:
             result = {
                 'quantum_number': quantum_number,
                 'entanglement_data': entanglement_data,
-                'device_name': device_info['name'],
-                'device_type': device_info['type']
+                'device_name': device_info.name,
+                'device_type': device_info.type
             }
 
             # Update job with results
@@ -624,7 +725,7 @@ class EnhancedQuantumService:
             # Update the signature database with device results
             await self._update_signature_with_device_results(job_id, quantum_number, entanglement_data)
 
-            logger.info(f"Quantum signature job {job_id} completed successfully on {device_info['name']}")
+            logger.info(f"Quantum signature job {job_id} completed successfully on {device_info.name}")
 
         except Exception as e:
             logger.error(f"Quantum signature job {job_id} failed: {str(e)}")
@@ -637,9 +738,8 @@ class EnhancedQuantumService:
     async def _update_signature_with_device_results(self, device_job_id: str, quantum_number: int, entanglement_data: list):
         """Update signature database with device quantum results and generate device signature"""
         try:
-            from signature_wall_system import SignatureWallDatabase, QuantumResistantCrypto
-            database = SignatureWallDatabase()
-            crypto_service = QuantumResistantCrypto()
+            database = self._get_signature_database()
+            crypto_service = self._get_crypto_service()
 
             # Find signature with this device_job_id
             import sqlite3
@@ -685,39 +785,43 @@ class EnhancedQuantumService:
         except Exception as e:
             logger.error(f"Failed to update signature with device results: {e}")
 
-    async def _simulate_quantum_processing(self, job_id: str, device_info: Dict[str, Any]):
+    async def _simulate_quantum_processing(self, job_id: str, device_info: DeviceInfo):
         """Simulate quantum processing delay"""
         # Update to running status
         self.job_manager.update_job_status(job_id, 'running')
 
+        if not self.simulate_waits:
+            return
+
         # Simulate processing time based on device type
-        if device_info['type'] == 'managed_simulator':
-            await asyncio.sleep(2)  # 2 seconds for AWS SV1
-        elif device_info['type'] == 'qpu':
+        delay = 0
+        if device_info.type == 'managed_simulator':
+            delay = 2  # 2 seconds for AWS SV1
+        elif device_info.type == 'qpu':
             # Simulate queue wait + execution time
-            if 'ionq' in device_info['arn']:
-                await asyncio.sleep(5)  # 5 seconds (simulated)
-            elif 'iqm' in device_info['arn']:
-                await asyncio.sleep(7)  # 7 seconds (simulated)
-            elif 'quera' in device_info['arn']:
-                await asyncio.sleep(10)  # 10 seconds (simulated)
-            elif 'rigetti' in device_info['arn']:
-                await asyncio.sleep(4)  # 4 seconds (simulated)
+            if 'ionq' in device_info.arn:
+                delay = 5  # 5 seconds (simulated)
+            elif 'iqm' in device_info.arn:
+                delay = 7  # 7 seconds (simulated)
+            elif 'quera' in device_info.arn:
+                delay = 10  # 10 seconds (simulated)
+            elif 'rigetti' in device_info.arn:
+                delay = 4  # 4 seconds (simulated)
+
+        if delay:
+            await asyncio.sleep(delay)
 
     async def _generate_signature_sync(self, device_id: str, name: str, message: str, job_id: str = None) -> Dict[str, Any]:
         """Generate signature synchronously"""
-        device_info = self.device_manager.get_device_info(device_id)
+        device_info = self.device_manager.get_device_record(device_id)
 
         # Generate quantum data with device-specific characteristics
         seed = f"{name}:{message}:{time.time()}"
         quantum_number = await self._generate_quantum_random_number(device_id, seed)
         entanglement_data = await self._create_bell_state_circuit(device_id)
 
-        # Import the rest of the signature creation logic
-        from signature_wall_system import QuantumResistantCrypto, SignatureWallDatabase, QuantumSignatureWallSystem
-
-        crypto_service = QuantumResistantCrypto()
-        database = SignatureWallDatabase()
+        crypto_service = self._get_crypto_service()
+        database = self._get_signature_database()
 
         # Generate quantum-resistant keypair
         keypair = crypto_service.generate_quantum_keypair(quantum_number)
@@ -755,7 +859,7 @@ class EnhancedQuantumService:
             'position_x': visual_props['position_x'],
             'position_y': visual_props['position_y'],
             'device_id': device_id,
-            'device_name': device_info['name'],
+            'device_name': device_info.name,
             'job_id': job_id
         }
 
@@ -766,7 +870,7 @@ class EnhancedQuantumService:
             'success': True,
             'async': False,
             'signature_id': signature_id,
-            'device': device_info,
+            'device': self.device_manager.get_device_info(device_id),
             'visual_properties': visual_props,
             **signature_data
         }
@@ -868,10 +972,10 @@ class EnhancedQuantumService:
                 # Fallback to deterministic hash
                 return hash(seed_text + str(time.time())) % 1000
 
-        device_info = self.device_manager.get_device_info(device_id)
+        device_info = self.device_manager.get_device_record(device_id)
 
         # Adjust circuit based on device capabilities
-        num_qubits = min(4 + (hash(seed_text) % 4), device_info['max_qubits'])
+        num_qubits = min(4 + (hash(seed_text) % 4), device_info.max_qubits)
 
         circuit = Circuit()
 
@@ -911,22 +1015,16 @@ class EnhancedQuantumService:
 
     async def _create_bell_state_circuit(self, device_id: str) -> List[float]:
         """Create Bell state circuit with device-specific optimizations"""
-        device_info = self.device_manager.get_device_info(device_id)
+        device_info = self.device_manager.get_device_record(device_id)
 
-        if not device_info.get('supports_bell_states', True):
+        if device_info is not None and not device_info.supports_bell_states:
             # For devices that don't support Bell states, return simulated data
             return [0.5, 0.0, 0.0, 0.5]
 
-        circuit = Circuit()
-        circuit.h(0)
-        circuit.cnot(0, 1)
-        circuit.measure(0)
-        circuit.measure(1)
-
         try:
             # Use appropriate device based on device_id
-            shots = 200 if device_info['type'] == 'simulator' else 1000
-            probabilities = await self._execute_bell_state_on_device(circuit, device_id, shots)
+            shots = 200 if device_info.type == 'simulator' else 1000
+            probabilities = await self._execute_bell_state_on_device(self._bell_circuit, device_id, shots)
             return probabilities
         except Exception as e:
             logger.error(f"Bell state execution error on {device_id}: {e}")
@@ -934,7 +1032,7 @@ class EnhancedQuantumService:
 
     def _generate_device_specific_visuals(self, device_id: str, quantum_number: int, entanglement_data: List[float]) -> Dict[str, Any]:
         """Generate visual properties with device-specific enhancements"""
-        device_info = self.device_manager.get_device_info(device_id)
+        device_info = self.device_manager.get_device_record(device_id)
 
         # Base color calculation
         hue = (quantum_number * 137.5) % 360
@@ -958,19 +1056,19 @@ class EnhancedQuantumService:
         position_x, position_y = self._generate_collision_free_position(device_id, quantum_number)
 
         return {
-            'color': f"hsl({hue:.1f}, {saturation:.1f}%, {lightness:.1f}%)",
+            # Integer HSL components are visually indistinguishable and cheaper to format
+            'color': "hsl(%d, %d%%, %d%%)" % (hue, saturation, lightness),
             'position_x': position_x,
             'position_y': position_y,
             'pulse_speed': 2 + (quantum_number % 3),
             'size_factor': 0.8 + (entanglement_data[3] * 0.4),
-            'device_indicator': device_info['type']
+            'device_indicator': device_info.type
         }
 
     def _generate_collision_free_position(self, device_id: str, quantum_number: int) -> tuple[float, float]:
         """Generate a position that doesn't collide with existing signatures and accounts for breathing state"""
         # Get existing signatures to check for collisions
-        from signature_wall_system import SignatureWallDatabase
-        database = SignatureWallDatabase()
+        database = self._get_signature_database()
         existing_signatures = database.get_all_signatures()
 
         # Calculate dynamic card dimensions based on number of signatures (matching frontend logic)
@@ -1060,8 +1158,16 @@ class EnhancedQuantumService:
         # Get device region or use default (wider for unknown devices)
         device_region = device_regions.get(device_id, {'x_range': (10, 90), 'y_range': (10, 90)})
 
+        # Mark every position already ruled out by an existing signature
+        occupancy = self._build_occupancy_grid(
+            existing_signatures,
+            effective_width_pct + spacing_pct,
+            effective_height_pct + spacing_pct
+        )
+
         # Use quantum number as deterministic seed for reproducible positioning
-        random.seed(quantum_number)
+        # (local generator so concurrent placements don't reseed the global RNG)
+        rng = random.Random(quantum_number)
 
         # Try center-biased positioning first
         max_attempts = 150
@@ -1100,8 +1206,8 @@ class EnhancedQuantumService:
                         candidate_y = effective_y_min + (grid_y / max(1, grid_size - 1)) * y_range
 
                         # Add small random offset for visual variety while staying centered
-                        candidate_x += random.uniform(-2, 2)
-                        candidate_y += random.uniform(-2, 2)
+                        candidate_x += rng.uniform(-2, 2)
+                        candidate_y += rng.uniform(-2, 2)
                     else:
                         continue
                 else:
@@ -1109,11 +1215,11 @@ class EnhancedQuantumService:
             else:
                 # Remaining attempts: random within effective zone with center bias
                 if effective_x_max - effective_x_min > effective_width_pct and effective_y_max - effective_y_min > effective_height_pct:
-                    candidate_x = random.uniform(
+                    candidate_x = rng.uniform(
                         effective_x_min,
                         effective_x_max - effective_width_pct
                     )
-                    candidate_y = random.uniform(
+                    candidate_y = rng.uniform(
                         effective_y_min,
                         effective_y_max - effective_height_pct
                     )
@@ -1124,25 +1230,60 @@ class EnhancedQuantumService:
             candidate_x = max(12, min(88 - effective_width_pct, candidate_x))
             candidate_y = max(12, min(88 - effective_height_pct, candidate_y))
 
-            # Check for collisions with existing signatures using effective (breathing) dimensions
-            collision_found = False
-            for existing in existing_signatures:
-                # Calculate distance between candidate and existing position
-                dx = abs(candidate_x - existing['position_x'])
-                dy = abs(candidate_y - existing['position_y'])
-
-                # Check if rectangles would overlap (with breathing state buffer and spacing)
-                if (dx < effective_width_pct + spacing_pct and
-                    dy < effective_height_pct + spacing_pct):
-                    collision_found = True
-                    break
-
-            if not collision_found:
+            # Check for collisions with existing signatures using the occupancy grid
+            if not occupancy[self._occupancy_cell(candidate_x), self._occupancy_cell(candidate_y)]:
                 return candidate_x, candidate_y
 
-        # Fallback: if no collision-free position found, use improved spiral placement
+        # Fallback: take the free cell closest to the center before resorting to the spiral
+        free_position = self._nearest_free_position(occupancy, effective_width_pct, effective_height_pct)
+        if free_position is not None:
+            return free_position
+
         return self._generate_center_spiral_position(len(existing_signatures), effective_width_pct, effective_height_pct)
 
+    def _occupancy_cell(self, position_pct: float) -> int:
+        """Map a wall percentage coordinate to its occupancy grid index"""
+        cell = int(position_pct / self._OCCUPANCY_RESOLUTION_PCT)
+        return min(max(cell, 0), self._OCCUPANCY_CELLS - 1)
+
+    def _build_occupancy_grid(self, existing_signatures: List[Dict[str, Any]], reach_x_pct: float, reach_y_pct: float) -> np.ndarray:
+        """Stamp every position a new card cannot take without overlapping an existing one.
+
+        A candidate collides with an existing card when |dx| < reach_x_pct and
+        |dy| < reach_y_pct, so each existing signature blocks a rectangle of that
+        half-size around its position. Lookups are then a single array index.
+        """
+        occupancy = np.zeros((self._OCCUPANCY_CELLS, self._OCCUPANCY_CELLS), dtype=bool)
+        for existing in existing_signatures:
+            x, y = existing['position_x'], existing['position_y']
+            x0 = self._occupancy_cell(x - reach_x_pct)
+            x1 = self._occupancy_cell(x + reach_x_pct) + 1
+            y0 = self._occupancy_cell(y - reach_y_pct)
+            y1 = self._occupancy_cell(y + reach_y_pct) + 1
+            occupancy[x0:x1, y0:y1] = True
+        return occupancy
+
+    def _nearest_free_position(self, occupancy: np.ndarray, effective_width_pct: float, effective_height_pct: float) -> Optional[tuple[float, float]]:
+        """Return the free in-bounds grid position closest to the wall center, if any"""
+        x_lo, x_hi = self._occupancy_cell(12), self._occupancy_cell(88 - effective_width_pct)
+        y_lo, y_hi = self._occupancy_cell(12), self._occupancy_cell(88 - effective_height_pct)
+        if x_hi < x_lo or y_hi < y_lo:
+            return None
+
+        window = occupancy[x_lo:x_hi + 1, y_lo:y_hi + 1]
+        free_x, free_y = np.nonzero(~window)
+        if free_x.size == 0:
+            return None
+
+        # Cell centers in percent, ranked by distance to the center of the wall
+        pos_x = (free_x + x_lo + 0.5) * self._OCCUPANCY_RESOLUTION_PCT
+        pos_y = (free_y + y_lo + 0.5) * self._OCCUPANCY_RESOLUTION_PCT
+        best = int(np.argmin((pos_x - 50) ** 2 + (pos_y - 50) ** 2))
+
+        candidate_x = max(12, min(88 - effective_width_pct, float(pos_x[best])))
+        candidate_y = max(12, min(88 - effective_height_pct, float(pos_y[best])))
+        return candidate_x, candidate_y
+
     def _generate_center_spiral_position(self, signature_count: int, effective_width_pct: float, effective_height_pct: float) -> tuple[float, float]:
         """Generate position using center-biased spiral pattern as fallback when collision detection fails"""
         import math
@@ -1164,21 +1305,21 @@ class EnhancedQuantumService:
 
         return spiral_x, spiral_y
 
-    def _estimate_completion_time(self, device_info: Dict[str, Any]) -> str:
+    def _estimate_completion_time(self, device_info: DeviceInfo) -> str:
         """Estimate completion time based on device"""
         base_time = datetime.now()
 
-        if device_info['type'] == 'simulator':
+        if device_info.type == 'simulator':
             minutes = 0
-        elif device_info['type'] == 'managed_simulator':
+        elif device_info.type == 'managed_simulator':
             minutes = 1
-        elif 'ionq' in device_info['arn']:
+        elif 'ionq' in device_info.arn:
             minutes = 15
-        elif 'iqm' in device_info['arn']:
+        elif 'iqm' in device_info.arn:
             minutes = 25
-        elif 'quera' in device_info['arn']:
+        elif 'quera' in device_info.arn:
             minutes = 35
-        elif 'rigetti' in device_info['arn']:
+        elif 'rigetti' in device_info.arn:
             minutes = 10
         else:
             minutes = 20
@@ -1215,7 +1356,6 @@ class EnhancedQuantumService:
                         device_region = device_info.get('region', 'us-east-1')
 
                         # Set default region environment variable for Braket
-                        import os
                         original_region = os.environ.get('AWS_DEFAULT_REGION')
                         os.environ['AWS_DEFAULT_REGION'] = device_region
 
@@ -1269,17 +1409,88 @@ class EnhancedQuantumService:
                 'task_arn': task_arn
             }
 
+    def _run_numpy_statevector(self, circuit: Circuit, shots: int) -> Optional[Counter]:
+        """Simulate a small H/CNOT/RY circuit with a NumPy statevector.
+
+        Returns measurement counts keyed by bitstring (qubit 0 first, as Braket
+        does), or None if the circuit uses anything this path doesn't support.
+        """
+        num_qubits = circuit.qubit_count
+        if num_qubits == 0 or num_qubits > NUMPY_SIM_MAX_QUBITS:
+            return None
+        if sorted(int(q) for q in circuit.qubits) != list(range(num_qubits)):
+            return None
+
+        state = np.zeros((2,) * num_qubits, dtype=np.complex128)
+        state[(0,) * num_qubits] = 1
+        measured = []
+
+        for instruction in circuit.instructions:
+            gate = instruction.operator.name
+            targets = [int(q) for q in instruction.target]
+            if instruction.control or instruction.power != 1:
+                return None
+
+            if gate == 'Measure':
+                measured.extend(targets)
+            elif gate in ('H', 'Ry'):
+                matrix = _H_GATE if gate == 'H' else _ry_gate(instruction.operator.angle)
+                q = targets[0]
+                state = np.moveaxis(np.tensordot(matrix, state, axes=([1], [q])), 0, q)
+            elif gate == 'CNot':
+                control, target = targets
+                state = np.tensordot(_CNOT_GATE, state, axes=([2, 3], [control, target]))
+                state = np.moveaxis(state, [0, 1], [control, target])
+            else:
+                return None
+
+        probabilities = np.abs(state.reshape(-1)) ** 2
+        probabilities /= probabilities.sum()
+        outcomes = self._np_rng.choice(probabilities.size, size=shots, p=probabilities)
+
+        measured = measured or list(range(num_qubits))
+        shifts = [num_qubits - 1 - q for q in measured]
+        counts = Counter()
+        for outcome in outcomes:
+            counts[''.join('1' if (outcome >> shift) & 1 else '0' for shift in shifts)] += 1
+        return counts
+
+    def _run_local_counts(self, circuit: Circuit, shots: int):
+        """Run a circuit locally, preferring the NumPy statevector for small circuits"""
+        counts = self._run_numpy_statevector(circuit, shots)
+        if counts is not None:
+            return counts
+        task = self.local_simulator.run(circuit, shots=shots)
+        return task.result().measurement_counts
+
+    def _run_local_simulator(self, circuit: Circuit, shots: int):
+        """Run a circuit on the Braket local simulator and return its measurement counts"""
+        return self.local_simulator.run(circuit, shots=shots).result().measurement_counts
+
+    async def _wait_for_result(self, task, max_wait_time: float, timeout_message: str):
+        """Await a Braket task's result, letting the SDK's own polling detect completion"""
+        try:
+            result = await asyncio.wait_for(asyncio.to_thread(task.result), timeout=max_wait_time)
+        except asyncio.TimeoutError:
+            # Best-effort cancel so the task doesn't keep running on the device
+            try:
+                await asyncio.to_thread(task.cancel)
+            except Exception:
+                pass
+            raise Exception(timeout_message)
+
+        if result is None:
+            # The SDK returns None for failed or cancelled tasks
+            raise Exception(f"Task {task.id} finished without a result")
+        return result
+
     async def _execute_on_device(self, circuit: Circuit, device_id: str, shots: int = 10) -> int:
         """Execute circuit on specified device and return quantum random number"""
-        device_info = self.device_manager.get_device_info(device_id)
-
         try:
             if device_id == 'local_simulator':
                 # Use local simulator
-                task = self.local_simulator.run(circuit, shots=shots)
-                result = task.result()
-                measurement = result.measurement_counts
-                binary_result = list(measurement.keys())[0]
+                measurement = await asyncio.to_thread(self._run_local_counts, circuit, shots)
+                binary_result = next(iter(measurement))
                 return int(binary_result, 2)
 
             elif device_id in self._aws_devices and self._aws_session:
@@ -1297,34 +1508,22 @@ class EnhancedQuantumService:
                     else:
                         raise Exception(f"Device {device_id} unavailable and no fallback available")
 
-                # Submit to AWS Braket
-                task = aws_device.run(circuit, shots=shots)
-
-                # For real devices, we need to wait for completion
-                if device_info['async_required']:
-                    # Wait for completion with timeout
-                    await asyncio.sleep(0.1)  # Small delay before checking
-                    wait_hours = 1
-                    max_wait_time = wait_hours * 60 * 60  # 1 hour max wait
-                    start_time = time.time()
-
-                    while task.state() not in ['COMPLETED', 'FAILED', 'CANCELLED']:
-                        if time.time() - start_time > max_wait_time:
-                            raise Exception(f"Task timeout after {max_wait_time} seconds")
-                        await asyncio.sleep(5)  # Check every 5 seconds
+                # Submit to AWS Braket and wait for completion
+                max_wait_time = 60 * 60  # 1 hour max wait
+                task = aws_device.run(circuit, shots=shots, poll_timeout_seconds=max_wait_time)
 
-                result = task.result()
+                result = await self._wait_for_result(
+                    task, max_wait_time, f"Task timeout after {max_wait_time} seconds"
+                )
                 measurement = result.measurement_counts
-                binary_result = list(measurement.keys())[0]
+                binary_result = next(iter(measurement))
                 return int(binary_result, 2)
 
             else:
                 # Fallback to local simulator if AWS not available
                 logger.warning(f"AWS device {device_id} not available, using local simulator")
-                task = self.local_simulator.run(circuit, shots=shots)
-                result = task.result()
-                measurement = result.measurement_counts
-                binary_result = list(measurement.keys())[0]
+                measurement = await asyncio.to_thread(self._run_local_counts, circuit, shots)
+                binary_result = next(iter(measurement))
                 return int(binary_result, 2)
 
         except Exception as e:
@@ -1335,14 +1534,10 @@ class EnhancedQuantumService:
 
     async def _execute_bell_state_on_device(self, circuit: Circuit, device_id: str, shots: int) -> List[float]:
         """Execute Bell state circuit on specified device and return probabilities"""
-        device_info = self.device_manager.get_device_info(device_id)
-
         try:
             if device_id == 'local_simulator':
                 # Use local simulator
-                task = self.local_simulator.run(circuit, shots=shots)
-                result = task.result()
-                counts = result.measurement_counts
+                counts = await asyncio.to_thread(self._run_local_simulator, circuit, shots)
 
             elif device_id in self._aws_devices and self._aws_session:
                 # Use real AWS Braket device
@@ -1359,39 +1554,23 @@ class EnhancedQuantumService:
                     else:
                         raise Exception(f"Device {device_id} unavailable and no fallback available")
 
-                # Submit to AWS Braket
-                task = aws_device.run(circuit, shots=shots)
-
-                # For real devices, wait for completion
-                if device_info['async_required']:
-                    await asyncio.sleep(0.1)
-                    wait_time_hours = 1
-                    max_wait_time = wait_time_hours * 60 * 60
-                    start_time = time.time()
+                # Submit to AWS Braket and wait for completion
+                max_wait_time = 60 * 60
+                task = aws_device.run(circuit, shots=shots, poll_timeout_seconds=max_wait_time)
 
-                    while task.state() not in ['COMPLETED', 'FAILED', 'CANCELLED']:
-                        if time.time() - start_time > max_wait_time:
-                            raise Exception(f"Bell state task timeout after {max_wait_time} seconds")
-                        await asyncio.sleep(5)
-
-                result = task.result()
+                result = await self._wait_for_result(
+                    task, max_wait_time, f"Bell state task timeout after {max_wait_time} seconds"
+                )
                 counts = result.measurement_counts
 
             else:
                 # Fallback to local simulator
                 logger.warning(f"AWS device {device_id} not available, using local simulator for Bell state")
-                task = self.local_simulator.run(circuit, shots=shots)
-                result = task.result()
-                counts = result.measurement_counts
+                counts = await asyncio.to_thread(self._run_local_simulator, circuit, shots)
 
             # Process measurement counts into probabilities
-            total_shots = sum(counts.values())
-            probabilities = []
-
-            for state in ['00', '01', '10', '11']:
-                probabilities.append(counts.get(state, 0) / total_shots)
-
-            return probabilities
+            state_counts = np.fromiter((counts.get(state, 0) for state in BELL_STATES), dtype=np.int64, count=4)
+            return (state_counts / state_counts.sum()).tolist()
 
         except Exception as e:
             logger.error(f"Bell state execution failed on {device_id}: {e}")
@@ -1399,9 +1578,26 @@ class EnhancedQuantumService:
             return [0.5, 0.0, 0.0, 0.5]
 
     async def _check_device_availability(self, device_id: str) -> Dict[str, Any]:
-        """Check if a quantum device is available"""
-        device_info = self.device_manager.get_device_info(device_id)
+        """Check if a quantum device is available, reusing recent successful checks"""
+        device_info = self.device_manager.get_device_record(device_id)
+
+        cached = self._availability_cache.get(device_id)
+        if cached:
+            checked_at, status = cached
+            is_simulator = device_info is not None and device_info.type in ['simulator', 'managed_simulator']
+            ttl = self.AVAILABILITY_TTL_SIMULATOR if is_simulator else self.AVAILABILITY_TTL_QPU
+            if time.time() - checked_at < ttl:
+                return status
+
+        status = await self._probe_device_availability(device_id, device_info)
+        if status['available']:
+            self._availability_cache[device_id] = (time.time(), status)
+        else:
+            self._availability_cache.pop(device_id, None)
+        return status
 
+    async def _probe_device_availability(self, device_id: str, device_info: Optional[DeviceInfo]) -> Dict[str, Any]:
+        """Check if a quantum device is available"""
         if device_id == 'local_simulator':
             return {'available': True, 'reason': 'Local simulator always available'}
 
@@ -1412,22 +1608,16 @@ class EnhancedQuantumService:
             aws_device = self._aws_devices[device_id]
 
             # For simulators, assume they're always available
-            if device_info['type'] in ['simulator', 'managed_simulator']:
+            if device_info.type in ['simulator', 'managed_simulator']:
                 return {'available': True, 'reason': 'Simulator device'}
 
             # For QPUs, check if they're online
             # Note: In real implementation, you would check device.is_available
             # For now, we'll do a basic connectivity check
 
-            # Simulate device availability check
-            device_status = {
-                'ionq_forte': random.choice([True, True, True, False]),  # 75% available
-                'iqm_garnet': random.choice([True, True, False]),        # 67% available
-                'quera_aquila': random.choice([True, False]),            # 50% available
-                'rigetti_ankaa': random.choice([True, True, True, False]) # 75% available
-            }
-
-            is_available = device_status.get(device_id, True)
+            # Simulate device availability check: one 8-bit draw against the device's threshold
+            threshold = self.SIMULATED_AVAILABILITY_THRESHOLDS.get(device_id, 256)
+            is_available = secrets.randbits(8) < threshold
 
             if is_available:
                 return {'available': True, 'reason': 'Device online and accepting jobs'}
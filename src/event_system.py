@@ -1,17 +1,43 @@
 import asyncio
 import hashlib
 import json
+import math
+import os
 import random
+import struct
 import time
 import sqlite3
 from datetime import datetime
-from typing import Dict, Any, List
+from typing import Dict, Any, List, Optional, Tuple
 import threading
+from collections import OrderedDict
 
-import boto3
-from braket.aws import AwsDevice
-from braket.circuits import Circuit
-from braket.devices import LocalSimulator
+import numpy as np
+
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+BELL_STATES = ('00', '01', '10', '11')
+
+# rx angle for each possible seed byte
+_ANGLE_LUT = tuple((c / 128.0) * math.pi for c in range(256))
+
+
+def _json_dumps_bytes(data: Any, sort_keys: bool = False) -> bytes:
+    """Serialize to compact JSON bytes, using orjson when it is installed"""
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(data, option=orjson.OPT_SORT_KEYS if sort_keys else 0)
+    return json.dumps(data, sort_keys=sort_keys, ensure_ascii=False, separators=(',', ':')).encode()
+
+
+def _json_loads(data: Any) -> Any:
+    """Parse JSON text or bytes, using orjson when it is installed"""
+    if ORJSON_AVAILABLE:
+        return orjson.loads(data)
+    return json.loads(data)
 
 
 class EventDatabase:
@@ -21,10 +47,15 @@ class EventDatabase:
         self.db_path = db_path
         self.lock = threading.Lock()
         self._init_database()
+        # One long-lived writer (serialized by self.lock) plus one reader per thread
+        self._writer = sqlite3.connect(self.db_path, check_same_thread=False, isolation_level=None)
+        self._writer.execute("PRAGMA synchronous=NORMAL")
+        self._readers = threading.local()
 
     def _init_database(self):
         """Initialize database with registrations table"""
         with sqlite3.connect(self.db_path) as conn:
+            conn.execute("PRAGMA journal_mode=WAL")
             conn.execute("""
                 CREATE TABLE IF NOT EXISTS registrations (
                     id INTEGER PRIMARY KEY AUTOINCREMENT,
@@ -38,82 +69,156 @@ class EventDatabase:
                     created_at DATETIME DEFAULT CURRENT_TIMESTAMP
                 )
             """)
+            conn.execute("CREATE INDEX IF NOT EXISTS idx_registrations_created_at ON registrations(created_at DESC)")
             conn.commit()
 
+    def _reader(self) -> sqlite3.Connection:
+        """Get this thread's read connection, opening it on first use"""
+        conn = getattr(self._readers, 'conn', None)
+        if conn is None:
+            conn = sqlite3.connect(self.db_path, check_same_thread=False)
+            conn.row_factory = sqlite3.Row
+            self._readers.conn = conn
+        return conn
+
+    _INSERT_REGISTRATION = """
+        INSERT INTO registrations
+        (name, message, quantum_number, entanglement_data, transaction_id, block_hash, timestamp)
+        VALUES (?, ?, ?, ?, ?, ?, ?)
+    """
+
+    @staticmethod
+    def _registration_row(registration_data: Dict[str, Any]) -> tuple:
+        return (
+            registration_data['name'],
+            registration_data['message'],
+            registration_data['quantum_number'],
+            _json_dumps_bytes(registration_data['entanglement_data']).decode(),
+            registration_data['transaction_id'],
+            registration_data['block_hash'],
+            registration_data['timestamp']
+        )
+
     def add_registration(self, registration_data: Dict[str, Any]) -> int:
         """Add a new registration and return the ID"""
         with self.lock:
-            with sqlite3.connect(self.db_path) as conn:
-                cursor = conn.execute("""
-                    INSERT INTO registrations
-                    (name, message, quantum_number, entanglement_data, transaction_id, block_hash, timestamp)
-                    VALUES (?, ?, ?, ?, ?, ?, ?)
-                """, (
-                    registration_data['name'],
-                    registration_data['message'],
-                    registration_data['quantum_number'],
-                    json.dumps(registration_data['entanglement_data']),
-                    registration_data['transaction_id'],
-                    registration_data['block_hash'],
-                    registration_data['timestamp']
-                ))
-                conn.commit()
-                return cursor.lastrowid
-
-    def get_all_registrations(self) -> List[Dict[str, Any]]:
-        """Get all registrations ordered by most recent first"""
+            cursor = self._writer.execute(self._INSERT_REGISTRATION, self._registration_row(registration_data))
+            return cursor.lastrowid
+
+    def add_registrations_batch(self, registrations: List[Dict[str, Any]]) -> List[int]:
+        """Add several registrations in one transaction and return their IDs in order"""
+        if not registrations:
+            return []
+
+        rows = [self._registration_row(registration) for registration in registrations]
         with self.lock:
-            with sqlite3.connect(self.db_path) as conn:
-                conn.row_factory = sqlite3.Row
-                cursor = conn.execute("""
-                    SELECT * FROM registrations
-                    ORDER BY created_at DESC
-                """)
-                rows = cursor.fetchall()
-
-                registrations = []
-                for row in rows:
-                    reg = dict(row)
-                    reg['entanglement_data'] = json.loads(reg['entanglement_data'])
-                    registrations.append(reg)
-
-                return registrations
+            self._writer.execute("BEGIN IMMEDIATE")
+            try:
+                self._writer.executemany(self._INSERT_REGISTRATION, rows)
+                last_id = self._writer.execute("SELECT last_insert_rowid()").fetchone()[0]
+                self._writer.execute("COMMIT")
+            except Exception:
+                self._writer.execute("ROLLBACK")
+                raise
+
+        # AUTOINCREMENT ids are contiguous inside a single write transaction
+        first_id = last_id - len(rows) + 1
+        return list(range(first_id, last_id + 1))
+
+    def get_all_registrations(self, limit: Optional[int] = None,
+                              decode_entanglement: bool = True) -> List[Dict[str, Any]]:
+        """Get registrations ordered by most recent first (all of them unless limit is given)"""
+        cursor = self._reader().execute("""
+            SELECT * FROM registrations
+            ORDER BY created_at DESC
+            LIMIT ?
+        """, (-1 if limit is None else limit,))
+        rows = cursor.fetchall()
+
+        if not decode_entanglement:
+            # Leave entanglement_data as the stored JSON text
+            return [dict(row) for row in rows]
+
+        registrations = []
+        for row in rows:
+            reg = dict(row)
+            reg['entanglement_data'] = _json_loads(reg['entanglement_data'])
+            registrations.append(reg)
+
+        return registrations
 
     def get_registration_count(self) -> int:
         """Get total number of registrations"""
+        cursor = self._reader().execute("SELECT COUNT(*) FROM registrations")
+        return cursor.fetchone()[0]
+
+    def get_registration_summary(self) -> Dict[str, Any]:
+        """Get count, average quantum number and latest timestamp in a single query"""
+        cursor = self._reader().execute("""
+            SELECT COUNT(*), AVG(quantum_number), MAX(created_at) FROM registrations
+        """)
+        count, avg_quantum_number, latest_registration = cursor.fetchone()
+        return {
+            'count': count,
+            'average_quantum_number': avg_quantum_number or 0,
+            'latest_registration': latest_registration
+        }
+
+    def close(self):
+        """Close the writer and the calling thread's reader connection"""
         with self.lock:
-            with sqlite3.connect(self.db_path) as conn:
-                cursor = conn.execute("SELECT COUNT(*) FROM registrations")
-                return cursor.fetchone()[0]
+            self._writer.close()
+        conn = getattr(self._readers, 'conn', None)
+        if conn is not None:
+            conn.close()
+            self._readers.conn = None
 
 
 class OptimizedQuantumService:
     """Optimized quantum service with caching and batching"""
 
+    CIRCUIT_CACHE_SIZE = 1024
+    # Shots per Bell state; a few dozen is plenty for the probabilities shown in the UI
+    BELL_SHOTS = int(os.getenv("BELL_SHOTS", "32"))
+
     def __init__(self):
+        # Braket is imported here rather than at module level so the database and
+        # blockchain helpers can be used without paying for the SDK import
+        from braket.circuits import Circuit
+        from braket.devices import LocalSimulator
+
+        self._circuit_class = Circuit
         self.local_simulator = LocalSimulator()
-        self._circuit_cache = {}
+        # LRU of seed digest -> base quantum number, bounded to CIRCUIT_CACHE_SIZE
+        self._circuit_cache = OrderedDict()
+        # Callers run this service from asyncio.to_thread workers, so guard the LRU
+        self._cache_lock = threading.Lock()
+        # The Bell state circuit never changes, so build it once
+        self._bell_circuit = self._circuit_class().h(0).cnot(0, 1).measure(0).measure(1)
 
     def generate_quantum_random_number(self, seed_text: str) -> int:
         """Generate quantum random number with caching for performance"""
-        # Use hash of seed as cache key
-        cache_key = hashlib.md5(seed_text.encode()).hexdigest()
-
-        if cache_key in self._circuit_cache:
+        # Use a short raw BLAKE2s digest of the seed as cache key
+        seed_bytes = seed_text.encode('utf-8')
+        cache_key = hashlib.blake2s(seed_bytes, digest_size=8).digest()
+
+        with self._cache_lock:
+            base_result = self._circuit_cache.get(cache_key)
+            if base_result is not None:
+                self._circuit_cache.move_to_end(cache_key)
+        if base_result is not None:
             # Add some randomness even for cached circuits
-            base_result = self._circuit_cache[cache_key]
             return (base_result + int(time.time())) % 1000
 
         # Create quantum circuit
-        circuit = Circuit()
+        circuit = self._circuit_class()
         num_qubits = 3 + (hash(seed_text) % 6)
 
         for i in range(num_qubits):
             circuit.h(i)
 
-        for i, char in enumerate(seed_text[:num_qubits]):
-            angle = (ord(char) / 128.0) * 3.14159
-            circuit.rx(i, angle)
+        for i, b in enumerate(seed_bytes[:num_qubits]):
+            circuit.rx(i, _ANGLE_LUT[b])
 
         for i in range(num_qubits):
             circuit.measure(i)
@@ -123,41 +228,47 @@ class OptimizedQuantumService:
             result = task.result()
             measurement = result.measurement_counts
 
-            binary_result = list(measurement.keys())[0]
+            binary_result = next(iter(measurement))
             quantum_number = int(binary_result, 2)
 
-            # Cache the base result
-            self._circuit_cache[cache_key] = quantum_number
+            # Cache the base result, evicting the least recently used entry
+            with self._cache_lock:
+                self._circuit_cache[cache_key] = quantum_number
+                if len(self._circuit_cache) > self.CIRCUIT_CACHE_SIZE:
+                    self._circuit_cache.popitem(last=False)
 
             return quantum_number
         except Exception as e:
             print(f"Quantum simulation error: {e}")
             return hash(seed_text + str(time.time())) % 1000
 
-    def create_bell_state_circuit(self) -> Dict[str, float]:
+    def create_bell_state_circuit(self, shots: Optional[int] = None) -> Dict[str, float]:
         """Create Bell state with optimized simulation"""
-        circuit = Circuit()
-        circuit.h(0)
-        circuit.cnot(0, 1)
-        circuit.measure(0)
-        circuit.measure(1)
-
         try:
-            task = self.local_simulator.run(circuit, shots=100)  # Reduced shots for speed
+            task = self.local_simulator.run(self._bell_circuit, shots=shots or self.BELL_SHOTS)
             result = task.result()
             counts = result.measurement_counts
 
-            total_shots = sum(counts.values())
-            probabilities = {}
-
-            for state in ['00', '01', '10', '11']:
-                probabilities[state] = counts.get(state, 0) / total_shots
-
-            return probabilities
+            state_counts = np.fromiter((counts.get(state, 0) for state in BELL_STATES), dtype=np.int64, count=4)
+            return dict(zip(BELL_STATES, (state_counts / state_counts.sum()).tolist()))
         except Exception as e:
             print(f"Bell state simulation error: {e}")
             return {'00': 0.5, '01': 0.0, '10': 0.0, '11': 0.5}
 
+    def create_bell_states_batch(self, count: int, shots: Optional[int] = None) -> List[Dict[str, float]]:
+        """Create Bell state probabilities for several participants from one simulator run"""
+        shots = shots or self.BELL_SHOTS
+        try:
+            # One task with count * shots shots, split into independent per-participant samples
+            task = self.local_simulator.run(self._bell_circuit, shots=count * shots)
+            measurements = np.asarray(task.result().measurements).reshape(count, shots, 2)
+            outcomes = measurements[:, :, 0] * 2 + measurements[:, :, 1]
+            state_counts = np.stack([(outcomes == index).sum(axis=1) for index in range(4)], axis=1)
+            return [dict(zip(BELL_STATES, row)) for row in (state_counts / shots).tolist()]
+        except Exception as e:
+            print(f"Bell state batch simulation error: {e}")
+            return [{'00': 0.5, '01': 0.0, '10': 0.0, '11': 0.5} for _ in range(count)]
+
 
 class OptimizedBlockchainService:
     """Optimized blockchain service with batch processing"""
@@ -168,16 +279,20 @@ class OptimizedBlockchainService:
 
     def store_quantum_result(self, name: str, message: str, quantum_number: int) -> Dict[str, Any]:
         """Store quantum result with optimized processing"""
+        # Read the clock once so the stored timestamp and the block hash agree
+        now = time.time()
         transaction_data = {
             'name': name,
             'message': message,
             'quantum_number': quantum_number,
-            'timestamp': datetime.now().isoformat(),
+            'timestamp': datetime.fromtimestamp(now).isoformat(),
             'type': 'event_registration'
         }
 
-        transaction_id = self._generate_transaction_id(transaction_data)
-        block_hash = self._generate_block_hash(transaction_data, transaction_id)
+        # Serialize once and feed the same canonical bytes to both hashes
+        payload = self._canonical_payload(transaction_data)
+        transaction_id = self._generate_transaction_id(payload)
+        block_hash = self._generate_block_hash(payload, transaction_id, now)
 
         return {
             'transaction_id': transaction_id,
@@ -185,53 +300,95 @@ class OptimizedBlockchainService:
             'timestamp': transaction_data['timestamp']
         }
 
-    def _generate_transaction_id(self, data: Dict[str, Any]) -> str:
+    def _canonical_payload(self, data: Dict[str, Any]) -> bytes:
+        """Serialize transaction data to canonical (sorted, compact) JSON bytes"""
+        return _json_dumps_bytes(data, sort_keys=True)
+
+    def _generate_transaction_id(self, payload: bytes) -> str:
         """Generate unique transaction ID"""
-        data_string = json.dumps(data, sort_keys=True)
-        return hashlib.sha256(data_string.encode()).hexdigest()[:16]
+        return hashlib.blake2b(payload, digest_size=8).hexdigest()
 
-    def _generate_block_hash(self, data: Dict[str, Any], transaction_id: str) -> str:
+    def _generate_block_hash(self, payload: bytes, transaction_id: str, timestamp: float) -> str:
         """Generate block hash"""
-        combined = f"{transaction_id}{json.dumps(data, sort_keys=True)}{time.time()}"
-        return hashlib.sha256(combined.encode()).hexdigest()
+        hasher = hashlib.blake2b(digest_size=32)
+        hasher.update(transaction_id.encode())
+        hasher.update(payload)
+        hasher.update(struct.pack('<d', timestamp))
+        return hasher.hexdigest()
 
 
 class EventRegistrationSystem:
     """Main event registration system with user management"""
 
+    # Seconds concurrent registrations wait so their Bell states share one simulator run
+    BELL_BATCH_WINDOW = 0.05
+
     def __init__(self):
         self.quantum_service = OptimizedQuantumService()
         self.blockchain_service = OptimizedBlockchainService()
         self.database = EventDatabase()
+        self._pending_bell_states: List[asyncio.Future] = []
+        self._bell_flush_task = None
+
+    async def _next_bell_state(self) -> Dict[str, float]:
+        """Queue a Bell state request and wait for the batch it lands in"""
+        future = asyncio.get_running_loop().create_future()
+        self._pending_bell_states.append(future)
+        if self._bell_flush_task is None:
+            self._bell_flush_task = asyncio.create_task(self._flush_bell_states())
+        return await future
+
+    async def _flush_bell_states(self):
+        """Run every Bell state queued during the coalescing window as one batch"""
+        await asyncio.sleep(self.BELL_BATCH_WINDOW)
+        pending, self._pending_bell_states = self._pending_bell_states, []
+        self._bell_flush_task = None
+
+        try:
+            results = await asyncio.to_thread(self.quantum_service.create_bell_states_batch, len(pending))
+        except Exception as e:
+            for future in pending:
+                if not future.done():
+                    future.set_exception(e)
+            return
+
+        for future, result in zip(pending, results):
+            if not future.done():
+                future.set_result(result)
+
+    async def _prepare_registration(self, name: str, message: str) -> Dict[str, Any]:
+        """Generate the quantum and blockchain data for a registration"""
+        # Generate quantum data (both simulations run concurrently off the event loop)
+        quantum_number, entanglement_data = await asyncio.gather(
+            asyncio.to_thread(self.quantum_service.generate_quantum_random_number, f"{name}:{message}"),
+            self._next_bell_state()
+        )
+
+        # Store in blockchain
+        blockchain_result = self.blockchain_service.store_quantum_result(name, message, quantum_number)
+
+        return {
+            'name': name,
+            'message': message,
+            'quantum_number': quantum_number,
+            'entanglement_data': [
+                entanglement_data['00'],
+                entanglement_data['01'],
+                entanglement_data['10'],
+                entanglement_data['11']
+            ],
+            'transaction_id': blockchain_result['transaction_id'],
+            'block_hash': blockchain_result['block_hash'],
+            'timestamp': blockchain_result['timestamp']
+        }
 
     async def register_participant(self, name: str, message: str) -> Dict[str, Any]:
         """Register a new event participant"""
         try:
-            # Generate quantum data
-            quantum_number = self.quantum_service.generate_quantum_random_number(f"{name}:{message}")
-            entanglement_data = self.quantum_service.create_bell_state_circuit()
-
-            # Store in blockchain
-            blockchain_result = self.blockchain_service.store_quantum_result(name, message, quantum_number)
-
-            # Prepare registration data
-            registration_data = {
-                'name': name,
-                'message': message,
-                'quantum_number': quantum_number,
-                'entanglement_data': [
-                    entanglement_data['00'],
-                    entanglement_data['01'],
-                    entanglement_data['10'],
-                    entanglement_data['11']
-                ],
-                'transaction_id': blockchain_result['transaction_id'],
-                'block_hash': blockchain_result['block_hash'],
-                'timestamp': blockchain_result['timestamp']
-            }
+            registration_data = await self._prepare_registration(name, message)
 
-            # Store in database
-            registration_id = self.database.add_registration(registration_data)
+            # Store in database (off the event loop; the writer connection is lock-guarded)
+            registration_id = await asyncio.to_thread(self.database.add_registration, registration_data)
 
             return {
                 'success': True,
@@ -244,24 +401,37 @@ class EventRegistrationSystem:
                 'error': str(e)
             }
 
-    def get_all_registrations(self) -> List[Dict[str, Any]]:
+    async def batch_register_participants(self, participants: List[Tuple[str, str]]) -> List[Dict[str, Any]]:
+        """Register several (name, message) participants concurrently and store them in one insert"""
+        prepared = await asyncio.gather(*[
+            self._prepare_registration(name, message) for name, message in participants
+        ], return_exceptions=True)
+
+        registrations = [item for item in prepared if not isinstance(item, BaseException)]
+        try:
+            registration_ids = iter(await asyncio.to_thread(self.database.add_registrations_batch, registrations))
+        except Exception as e:
+            return [{'success': False, 'error': str(e)} for _ in participants]
+
+        results = []
+        for item in prepared:
+            if isinstance(item, BaseException):
+                results.append({'success': False, 'error': str(item)})
+            else:
+                results.append({'success': True, 'registration_id': next(registration_ids), **item})
+        return results
+
+    def get_all_registrations(self, limit: Optional[int] = None,
+                              decode_entanglement: bool = True) -> List[Dict[str, Any]]:
         """Get all event registrations"""
-        return self.database.get_all_registrations()
+        return self.database.get_all_registrations(limit, decode_entanglement)
 
     def get_registration_stats(self) -> Dict[str, Any]:
         """Get registration statistics"""
-        total_registrations = self.database.get_registration_count()
-        registrations = self.database.get_all_registrations()
-
-        if registrations:
-            latest_registration = registrations[0]['created_at']
-            avg_quantum_number = sum(r['quantum_number'] for r in registrations) / len(registrations)
-        else:
-            latest_registration = None
-            avg_quantum_number = 0
+        summary = self.database.get_registration_summary()
 
         return {
-            'total_registrations': total_registrations,
-            'latest_registration': latest_registration,
-            'average_quantum_number': round(avg_quantum_number, 2)
+            'total_registrations': summary['count'],
+            'latest_registration': summary['latest_registration'],
+            'average_quantum_number': round(summary['average_quantum_number'], 2)
         }
\ No newline at end of file
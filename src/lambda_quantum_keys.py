@@ -41,22 +41,41 @@ IAM Permissions Required:
     - s3:GetObject (for amazon-braket-* buckets)
 """
 
-# Re-export all handlers from the quantum_service package
-from quantum_service.handlers import (
-    handler,
-    handler_options,
-    handler_devices,
-    handler_verify_credentials,
-    handler_status,
-    handler_health,
-    get_quantum_service,
-)
-
-# Re-export key classes for direct usage
-from quantum_service.credentials import AWSCredentialsManager, credentials_manager
-from quantum_service.devices import QuantumDeviceManager
-from quantum_service.crypto import ToyLWE, QuantumResistantCrypto
-from quantum_service.quantum_service import EnhancedQuantumService
+import importlib
+
+# Re-exports from the quantum_service package are resolved lazily (PEP 562):
+# the Lambda runtime looks the handler up with getattr, so e.g. handler_health
+# never pulls in the Braket SDK that EnhancedQuantumService needs
+_EXPORTS = {
+    # Lambda Handlers
+    'handler': 'quantum_service.handlers',
+    'handler_options': 'quantum_service.handlers',
+    'handler_devices': 'quantum_service.handlers',
+    'handler_verify_credentials': 'quantum_service.handlers',
+    'handler_status': 'quantum_service.handlers',
+    'handler_health': 'quantum_service.handlers',
+    'get_quantum_service': 'quantum_service.handlers',
+    # Key classes for direct usage
+    'AWSCredentialsManager': 'quantum_service.credentials',
+    'credentials_manager': 'quantum_service.credentials',
+    'QuantumDeviceManager': 'quantum_service.devices',
+    'ToyLWE': 'quantum_service.crypto',
+    'QuantumResistantCrypto': 'quantum_service.crypto',
+    'EnhancedQuantumService': 'quantum_service.quantum_service',
+}
+
+
+def __getattr__(name):
+    module_name = _EXPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module_name), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(list(globals()) + list(_EXPORTS))
 
 # Package metadata
 __version__ = '1.0.0'
@@ -90,6 +109,12 @@ __all__ = [
 
 if __name__ == "__main__":
     import json
+    from quantum_service.handlers import (
+        handler,
+        handler_devices,
+        handler_verify_credentials,
+        handler_status,
+    )
 
     print("=" * 60)
     print("Quantum Key Generator - Local Test")
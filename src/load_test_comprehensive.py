@@ -7,17 +7,42 @@ Tests system scalability with multiple quantum computing backends.
 
 import asyncio
 import aiohttp
+import sys
+import numpy as np
 import time
-import random
 import json
 import sqlite3
-from typing import List, Dict, Any, Tuple
+from typing import List, Dict, Any, Optional, Tuple
+from collections import Counter
+from dataclasses import dataclass
 from datetime import datetime
 
+try:
+    import uvloop
+    UVLOOP_AVAILABLE = True
+except ImportError:
+    # uvloop isn't available on Windows; fall back to the stdlib event loop
+    UVLOOP_AVAILABLE = False
+
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+try:
+    from hdrh.histogram import HdrHistogram
+    HDRH_AVAILABLE = True
+except ImportError:
+    HDRH_AVAILABLE = False
+
 # Test configuration
 BASE_URL = "http://localhost:8001"
 NUM_USERS = 8
 CONCURRENT_REQUESTS = 2  # Reduced for better stability with real quantum devices
+REQUEST_TIMEOUT = 60  # seconds per request
+BATCH_SIZE = 16  # Users per /register_batch call; 1 sends one /register per user
+BATCH_WINDOW = 0.05  # seconds to wait for more queued users before sending a partial batch
 
 # All available quantum devices with their characteristics
 QUANTUM_DEVICES = {
@@ -62,6 +87,20 @@ QUANTUM_DEVICES = {
     # }
 }
 
+# Emoji per device type for the report, and for signature progress lines
+_DEVICE_TYPE_EMOJI = {"simulator": "⚡", "managed_simulator": "☁️", "qpu": "🏭"}
+_PROGRESS_EMOJI = {"simulator": "⚡", "managed_simulator": "🔄", "qpu": "🏭"}
+_JOB_STATUS_EMOJI = {"created": "🆕", "submitted": "📤", "running": "🔄", "completed": "✅", "failed": "❌"}
+
+for _device in QUANTUM_DEVICES.values():
+    _device["emoji"] = _DEVICE_TYPE_EMOJI.get(_device["type"], "🏭")
+    _device["progress_emoji"] = _PROGRESS_EMOJI.get(_device["type"], "🏭")
+
+# Device ids and their normalised cumulative weights, for vectorised weighted sampling
+_DEVICE_IDS = np.array(list(QUANTUM_DEVICES))
+_DEVICE_CUM_WEIGHTS = np.cumsum([device["weight"] for device in QUANTUM_DEVICES.values()], dtype=np.float64)
+_DEVICE_CUM_WEIGHTS /= _DEVICE_CUM_WEIGHTS[-1]
+
 # Sample test participants with diverse backgrounds
 SAMPLE_PARTICIPANTS = [
     # Quantum researchers and scientists
@@ -135,29 +174,76 @@ SAMPLE_PARTICIPANTS = [
     ("York Filmmaker", "york@quantumcinema.film", "Quantum Documentary Producer")
 ]
 
+@dataclass(slots=True)
+class TestUser:
+    """A simulated participant and the device they registered with."""
+    name: str
+    email: str
+    title: str
+    device_id: str
+    device_info: Dict[str, Any]
+    body: bytes = b""  # Pre-serialized /register JSON payload
+
 class ComprehensiveLoadTestResults:
     def __init__(self):
         self.successful_requests = 0
         self.failed_requests = 0
         self.total_time = 0
-        self.response_times = []
+        # Running response time aggregates (seconds), updated per request
+        self.response_count = 0
+        self.response_time_sum = 0.0
+        self.min_response_time = float("inf")
+        self.max_response_time = 0.0
+        # Microsecond histogram from 1us to 1h for percentiles, when hdrhistogram is installed
+        self.response_histogram = HdrHistogram(1, 3_600_000_000, 3) if HDRH_AVAILABLE else None
         self.errors = []
+        self.error_types = Counter()
         self.created_signatures = []
         self.device_distribution = {}
         self.job_statuses = {}
         self.performance_by_device = {}
 
+    def record_response_time(self, response_time: float) -> None:
+        """Fold one response time into the running aggregates."""
+        self.response_count += 1
+        self.response_time_sum += response_time
+        self.min_response_time = min(self.min_response_time, response_time)
+        self.max_response_time = max(self.max_response_time, response_time)
+        if self.response_histogram is not None:
+            self.response_histogram.record_value(max(1, int(response_time * 1_000_000)))
+
+def select_weighted_devices(count: int) -> List[str]:
+    """Select count devices based on weighted probability distribution."""
+    indices = np.searchsorted(_DEVICE_CUM_WEIGHTS, np.random.random(count), side="right")
+    return _DEVICE_IDS[indices].tolist()
+
 def select_weighted_device() -> str:
     """Select a device based on weighted probability distribution."""
-    devices = list(QUANTUM_DEVICES.keys())
-    weights = [QUANTUM_DEVICES[device]["weight"] for device in devices]
-    return random.choices(devices, weights=weights)[0]
+    return select_weighted_devices(1)[0]
+
+JSON_HEADERS = {"Content-Type": "application/json"}
+
+def dumps_json(data: Any) -> bytes:
+    """Serialize a request body to JSON bytes, using orjson when it is installed."""
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(data)
+    return json.dumps(data, ensure_ascii=False).encode()
 
-def generate_realistic_user_distribution() -> List[Dict[str, Any]]:
+def build_signature_data(user_data: TestUser) -> Dict[str, Any]:
+    """Build the /register payload for a user."""
+    return {
+        "name": user_data.name,
+        "message": f"Quantum signature from {user_data.title}",
+        "quantum_device": user_data.device_id
+    }
+
+def generate_realistic_user_distribution() -> List[TestUser]:
     """Generate 50 users with realistic device preferences."""
     users = []
+    # Select every user's device up front based on weighted distribution
+    device_ids = select_weighted_devices(NUM_USERS)
 
-    for i in range(NUM_USERS):
+    for i, device_id in enumerate(device_ids):
         if i < len(SAMPLE_PARTICIPANTS):
             name, email, title = SAMPLE_PARTICIPANTS[i]
         else:
@@ -166,96 +252,210 @@ def generate_realistic_user_distribution() -> List[Dict[str, Any]]:
             email = f"user{i+1}@quantum.test"
             title = "Quantum Enthusiast"
 
-        # Select device based on user type and weighted distribution
-        device_id = select_weighted_device()
-
-        users.append({
-            "name": name,
-            "email": email,
-            "title": title,
-            "device_id": device_id,
-            "device_info": QUANTUM_DEVICES[device_id]
-        })
+        user = TestUser(
+            name=name,
+            email=email,
+            title=title,
+            device_id=device_id,
+            device_info=QUANTUM_DEVICES[device_id]
+        )
+        # Serialize the request body now so the request coroutines only send bytes
+        user.body = dumps_json(build_signature_data(user))
+        users.append(user)
 
     return users
 
-async def create_signature_advanced(session: aiohttp.ClientSession, user_data: Dict[str, Any],
+def create_client_session() -> aiohttp.ClientSession:
+    """Create a session whose pooled keep-alive connections are reused for every request."""
+    # HTTP/1.1 keep-alive rather than HTTP/2: BASE_URL is plain HTTP and uvicorn doesn't
+    # speak h2, so an HTTP/2 client would negotiate down to HTTP/1.1 anyway
+    connector = aiohttp.TCPConnector(
+        limit=CONCURRENT_REQUESTS * 4,
+        limit_per_host=CONCURRENT_REQUESTS * 4,
+        keepalive_timeout=75,
+        ttl_dns_cache=300,
+        enable_cleanup_closed=True
+    )
+    return aiohttp.ClientSession(
+        connector=connector,
+        timeout=aiohttp.ClientTimeout(total=REQUEST_TIMEOUT),
+        read_bufsize=4 * 1024 * 1024
+    )
+
+# Progress lines from request coroutines, drained by _log_writer while requests run
+_log_queue: Optional[asyncio.Queue] = None
+
+def log_line(line: str) -> None:
+    """Queue a progress line for the writer task, or print it when no writer is running."""
+    if _log_queue is None:
+        print(line)
+    else:
+        _log_queue.put_nowait(line + "\n")
+
+async def _log_writer(queue: asyncio.Queue) -> None:
+    """Write queued lines to stdout in batches of up to 32 until a None sentinel arrives."""
+    buffer = []
+    while True:
+        line = await queue.get()
+        if line is not None:
+            buffer.append(line)
+        if line is None or queue.empty() or len(buffer) >= 32:
+            sys.stdout.write("".join(buffer))
+            sys.stdout.flush()
+            buffer.clear()
+        if line is None:
+            return
+
+def record_request(results: ComprehensiveLoadTestResults, device_id: str, response_time: float) -> None:
+    """Track a completed request against its device."""
+    # Track device performance
+    if device_id not in results.performance_by_device:
+        results.performance_by_device[device_id] = {
+            "requests": 0,
+            "successes": 0,
+            "total_time": 0,
+            "errors": []
+        }
+
+    results.performance_by_device[device_id]["requests"] += 1
+    results.performance_by_device[device_id]["total_time"] += response_time
+
+def record_signature_result(results: ComprehensiveLoadTestResults, user_data: TestUser,
+                            result: Dict[str, Any], response_time: float) -> None:
+    """Book a single user's registration result returned by the server."""
+    device_id = user_data.device_id
+    device_info = user_data.device_info
+
+    if result.get("success"):
+        results.successful_requests += 1
+        results.performance_by_device[device_id]["successes"] += 1
+
+        # Track device distribution
+        results.device_distribution[device_id] = results.device_distribution.get(device_id, 0) + 1
+
+        signature_info = {
+            "user": user_data.name,
+            "title": user_data.title,
+            "signature_id": result.get("id") or result.get("signature_id"),
+            "device": device_id,
+            "device_name": device_info["name"],
+            "device_type": device_info["type"],
+            "response_time": response_time,
+            "job_id": result.get("job_id"),
+            "expected_completion": device_info["expected_time"]
+        }
+        results.created_signatures.append(signature_info)
+
+        log_line(f"{device_info['progress_emoji']} {user_data.name} - {device_info['name']} signature created ({response_time:.2f}s)")
+    else:
+        error_msg = result.get("error", "Unknown error")
+        record_signature_error(results, user_data, error_msg)
+        log_line(f"❌ {user_data.name} - {device_info['name']} failed: {error_msg}")
+
+def record_signature_error(results: ComprehensiveLoadTestResults, user_data: TestUser, error_msg: str) -> None:
+    """Book a failed registration."""
+    device_id = user_data.device_id
+    results.failed_requests += 1
+    results.errors.append(f"{user_data.name} ({device_id}): {error_msg}")
+    # Classify by the message's leading segment, e.g. "Exception" or "HTTP 500 - ..."
+    error_type, _, _ = error_msg.partition(":")
+    results.error_types[error_type.strip()] += 1
+    if device_id in results.performance_by_device:
+        results.performance_by_device[device_id]["errors"].append(error_msg)
+
+async def create_signature_advanced(session: aiohttp.ClientSession, user_data: TestUser,
                                   results: ComprehensiveLoadTestResults) -> None:
     """Create a quantum signature with advanced tracking."""
-    start_time = time.time()
-    device_id = user_data["device_id"]
-    device_info = user_data["device_info"]
+    start_ns = time.perf_counter_ns()
+    response_time = None
+    device_id = user_data.device_id
+    device_info = user_data.device_info
 
     try:
-        signature_data = {
-            "name": user_data["name"],
-            "message": f"Quantum signature from {user_data['title']}",
-            "quantum_device": device_id
-        }
+        async with session.post(f"{BASE_URL}/register", data=user_data.body, headers=JSON_HEADERS) as response:
+            response_time = (time.perf_counter_ns() - start_ns) * 1e-9
+            record_request(results, device_id, response_time)
 
-        async with session.post(f"{BASE_URL}/register", json=signature_data) as response:
-            response_time = time.time() - start_time
-            results.response_times.append(response_time)
+            if response.status == 200:
+                record_signature_result(results, user_data, await response.json(), response_time)
+            else:
+                error_text = await response.text()
+                record_signature_error(results, user_data, f"HTTP {response.status} - {error_text}")
+                log_line(f"❌ {user_data.name} - {device_info['name']} HTTP error: {response.status}")
 
-            # Track device performance
-            if device_id not in results.performance_by_device:
-                results.performance_by_device[device_id] = {
-                    "requests": 0,
-                    "successes": 0,
-                    "total_time": 0,
-                    "errors": []
-                }
+    except Exception as e:
+        record_signature_error(results, user_data, f"Exception: {str(e)}")
+        log_line(f"💥 {user_data.name} - {device_info['name']} exception: {str(e)}")
+    finally:
+        # Only read the clock again if the request failed before a response arrived
+        if response_time is None:
+            response_time = (time.perf_counter_ns() - start_ns) * 1e-9
+        results.record_response_time(response_time)
+
+async def create_signatures_batch(session: aiohttp.ClientSession, users: List[TestUser],
+                                  results: ComprehensiveLoadTestResults) -> None:
+    """Create several quantum signatures with one /register_batch round trip, tracked per user."""
+    start_ns = time.perf_counter_ns()
+    response_time = None
 
-            results.performance_by_device[device_id]["requests"] += 1
-            results.performance_by_device[device_id]["total_time"] += response_time
+    try:
+        # Splice the users' pre-serialized bodies into the batch payload
+        payload = b'{"signatures":[' + b",".join(user_data.body for user_data in users) + b"]}"
+
+        async with session.post(f"{BASE_URL}/register_batch", data=payload, headers=JSON_HEADERS) as response:
+            response_time = (time.perf_counter_ns() - start_ns) * 1e-9
+            for user_data in users:
+                record_request(results, user_data.device_id, response_time)
 
             if response.status == 200:
-                result = await response.json()
-                if result.get("success"):
-                    results.successful_requests += 1
-                    results.performance_by_device[device_id]["successes"] += 1
-
-                    # Track device distribution
-                    results.device_distribution[device_id] = results.device_distribution.get(device_id, 0) + 1
-
-                    signature_info = {
-                        "user": user_data["name"],
-                        "title": user_data["title"],
-                        "signature_id": result.get("id") or result.get("signature_id"),
-                        "device": device_id,
-                        "device_name": device_info["name"],
-                        "device_type": device_info["type"],
-                        "response_time": response_time,
-                        "job_id": result.get("job_id"),
-                        "expected_completion": device_info["expected_time"]
-                    }
-                    results.created_signatures.append(signature_info)
-
-                    status_emoji = "⚡" if device_info["type"] == "simulator" else "🔄" if device_info["type"] == "managed_simulator" else "🏭"
-                    print(f"{status_emoji} {user_data['name']} - {device_info['name']} signature created ({response_time:.2f}s)")
-                else:
-                    results.failed_requests += 1
-                    error_msg = result.get("error", "Unknown error")
-                    results.errors.append(f"{user_data['name']} ({device_id}): {error_msg}")
-                    results.performance_by_device[device_id]["errors"].append(error_msg)
-                    print(f"❌ {user_data['name']} - {device_info['name']} failed: {error_msg}")
+                batch_result = await response.json()
+                if not batch_result.get("success"):
+                    error_msg = batch_result.get("error", "Unknown error")
+                    for user_data in users:
+                        record_signature_error(results, user_data, error_msg)
+                    log_line(f"❌ Batch of {len(users)} failed: {error_msg}")
+                    return
+
+                # The server returns one result per submitted signature, in order
+                for user_data, result in zip(users, batch_result["results"]):
+                    record_signature_result(results, user_data, result, response_time)
             else:
-                results.failed_requests += 1
                 error_text = await response.text()
-                error_msg = f"HTTP {response.status} - {error_text}"
-                results.errors.append(f"{user_data['name']} ({device_id}): {error_msg}")
-                results.performance_by_device[device_id]["errors"].append(error_msg)
-                print(f"❌ {user_data['name']} - {device_info['name']} HTTP error: {response.status}")
+                for user_data in users:
+                    record_signature_error(results, user_data, f"HTTP {response.status} - {error_text}")
+                log_line(f"❌ Batch of {len(users)} HTTP error: {response.status}")
 
     except Exception as e:
-        response_time = time.time() - start_time
-        results.response_times.append(response_time)
-        results.failed_requests += 1
-        error_msg = f"Exception: {str(e)}"
-        results.errors.append(f"{user_data['name']} ({device_id}): {error_msg}")
-        if device_id in results.performance_by_device:
-            results.performance_by_device[device_id]["errors"].append(error_msg)
-        print(f"💥 {user_data['name']} - {device_info['name']} exception: {str(e)}")
+        for user_data in users:
+            record_signature_error(results, user_data, f"Exception: {str(e)}")
+        log_line(f"💥 Batch of {len(users)} exception: {str(e)}")
+    finally:
+        if response_time is None:
+            response_time = (time.perf_counter_ns() - start_ns) * 1e-9
+        for _ in users:
+            results.record_response_time(response_time)
+
+async def dispatch_signature_batches(session: aiohttp.ClientSession, queue: asyncio.Queue,
+                                     results: ComprehensiveLoadTestResults) -> None:
+    """Pull queued users and register them in batches of up to BATCH_SIZE until a None sentinel arrives."""
+    done = False
+    while not done:
+        batch = []
+        while len(batch) < BATCH_SIZE:
+            try:
+                # Block for the first user, then only wait briefly for more to join the batch
+                user_data = await asyncio.wait_for(queue.get(), BATCH_WINDOW) if batch else await queue.get()
+            except asyncio.TimeoutError:
+                break
+            if user_data is None:
+                done = True
+                break
+            batch.append(user_data)
+
+        if len(batch) == 1:
+            await create_signature_advanced(session, batch[0], results)
+        elif batch:
+            await create_signatures_batch(session, batch, results)
 
 async def run_comprehensive_load_test():
     """Run comprehensive load test with all quantum device types."""
@@ -269,8 +469,7 @@ async def run_comprehensive_load_test():
     # Show device overview
     print("\n🖥️  AVAILABLE QUANTUM DEVICES:")
     for device_id, info in QUANTUM_DEVICES.items():
-        device_type_emoji = "⚡" if info["type"] == "simulator" else "☁️" if info["type"] == "managed_simulator" else "🏭"
-        print(f"  {device_type_emoji} {info['name']} ({info['type']}) - Weight: {info['weight']}%")
+        print(f"  {info['emoji']} {info['name']} ({info['type']}) - Weight: {info['weight']}%")
 
     print("-" * 70)
 
@@ -283,7 +482,7 @@ async def run_comprehensive_load_test():
     # Show user distribution preview
     device_preview = {}
     for user in users:
-        device_id = user["device_id"]
+        device_id = user.device_id
         device_preview[device_id] = device_preview.get(device_id, 0) + 1
 
     print("📊 PLANNED DEVICE DISTRIBUTION:")
@@ -292,15 +491,16 @@ async def run_comprehensive_load_test():
         print(f"  {device_name}: {count} users")
     print()
 
-    # Create semaphore to limit concurrent requests
-    semaphore = asyncio.Semaphore(CONCURRENT_REQUESTS)
-
-    async def bounded_create_signature(session, user_data):
-        async with semaphore:
-            await create_signature_advanced(session, user_data, results)
+    # Queue every user, then one sentinel per dispatcher; CONCURRENT_REQUESTS dispatchers
+    # bound the number of in-flight requests
+    queue = asyncio.Queue()
+    for user in users:
+        queue.put_nowait(user)
+    for _ in range(CONCURRENT_REQUESTS):
+        queue.put_nowait(None)
 
     # Run the test
-    async with aiohttp.ClientSession() as session:
+    async with create_client_session() as session:
         # Test server connectivity first
         try:
             async with session.get(f"{BASE_URL}/") as response:
@@ -315,9 +515,22 @@ async def run_comprehensive_load_test():
         print(f"🚀 Initiating {NUM_USERS} quantum signature creation requests...")
         print("⏳ This may take a while due to quantum hardware queue times...\n")
 
-        # Execute all signature creation requests
-        tasks = [bounded_create_signature(session, user) for user in users]
-        await asyncio.gather(*tasks, return_exceptions=True)
+        # Progress lines go through one writer task instead of printing from every request
+        global _log_queue
+        _log_queue = asyncio.Queue()
+        log_writer = asyncio.create_task(_log_writer(_log_queue))
+
+        try:
+            # Execute all signature creation requests; request errors are recorded in results,
+            # so anything escaping a dispatcher is fatal and cancels the rest
+            async with asyncio.TaskGroup() as task_group:
+                for _ in range(CONCURRENT_REQUESTS):
+                    task_group.create_task(dispatch_signature_batches(session, queue, results))
+        finally:
+            # Flush whatever is still queued before the report is printed
+            _log_queue.put_nowait(None)
+            await log_writer
+            _log_queue = None
 
     results.total_time = time.time() - start_time
 
@@ -340,14 +553,16 @@ def print_comprehensive_results(results: ComprehensiveLoadTestResults):
     print(f"🏃 Requests per second: {NUM_USERS / results.total_time:.2f}")
 
     # Response time analysis
-    if results.response_times:
-        avg_response_time = sum(results.response_times) / len(results.response_times)
-        min_response_time = min(results.response_times)
-        max_response_time = max(results.response_times)
+    if results.response_count:
+        avg_response_time = results.response_time_sum / results.response_count
         print(f"\n⏱️  RESPONSE TIME ANALYSIS:")
         print(f"  📊 Average: {avg_response_time:.2f}s")
-        print(f"  ⚡ Fastest: {min_response_time:.2f}s")
-        print(f"  🐌 Slowest: {max_response_time:.2f}s")
+        print(f"  ⚡ Fastest: {results.min_response_time:.2f}s")
+        print(f"  🐌 Slowest: {results.max_response_time:.2f}s")
+        if results.response_histogram is not None:
+            for percentile in (50, 95, 99):
+                value = results.response_histogram.get_value_at_percentile(percentile) / 1_000_000
+                print(f"  📐 p{percentile}: {value:.2f}s")
 
     # Device performance breakdown
     print(f"\n🖥️  DEVICE PERFORMANCE BREAKDOWN:")
@@ -356,8 +571,7 @@ def print_comprehensive_results(results: ComprehensiveLoadTestResults):
         success_rate = (performance["successes"] / performance["requests"]) * 100 if performance["requests"] > 0 else 0
         avg_time = performance["total_time"] / performance["requests"] if performance["requests"] > 0 else 0
 
-        device_type_emoji = "⚡" if device_info["type"] == "simulator" else "☁️" if device_info["type"] == "managed_simulator" else "🏭"
-        print(f"  {device_type_emoji} {device_info['name']}:")
+        print(f"  {device_info['emoji']} {device_info['name']}:")
         print(f"    📋 Requests: {performance['requests']}")
         print(f"    ✅ Successes: {performance['successes']} ({success_rate:.1f}%)")
         print(f"    ⏱️  Avg time: {avg_time:.2f}s")
@@ -377,7 +591,7 @@ def print_comprehensive_results(results: ComprehensiveLoadTestResults):
     if results.created_signatures:
         print(f"\n✨ SAMPLE CREATED SIGNATURES:")
         for i, sig in enumerate(results.created_signatures[:10]):  # Show first 10
-            device_emoji = "⚡" if sig["device_type"] == "simulator" else "☁️" if sig["device_type"] == "managed_simulator" else "🏭"
+            device_emoji = _DEVICE_TYPE_EMOJI.get(sig["device_type"], "🏭")
             print(f"  {device_emoji} {sig['user']} ({sig['title']}) - {sig['device_name']}")
         if len(results.created_signatures) > 10:
             print(f"  ... and {len(results.created_signatures) - 10} more signatures")
@@ -385,53 +599,67 @@ def print_comprehensive_results(results: ComprehensiveLoadTestResults):
     # Error analysis
     if results.errors:
         print(f"\n❌ ERROR ANALYSIS ({len(results.errors)} total errors):")
-        error_types = {}
-        for error in results.errors:
-            error_type = error.split(":")[1].strip() if ":" in error else "Unknown"
-            error_types[error_type] = error_types.get(error_type, 0) + 1
-
-        for error_type, count in sorted(error_types.items(), key=lambda x: x[1], reverse=True)[:5]:
+        for error_type, count in results.error_types.most_common(5):
             print(f"  • {error_type}: {count} occurrences")
 
+def connect_read_only(db_path: str) -> sqlite3.Connection:
+    """Open a SQLite database read-only, memory-mapped for the analysis scans."""
+    conn = sqlite3.connect(f"file:{db_path}?mode=ro", uri=True)
+    conn.execute("PRAGMA query_only=1")
+    conn.execute("PRAGMA mmap_size=268435456")
+    return conn
+
 async def analyze_database_state():
     """Analyze the database state after load testing."""
+    # The queries are blocking, so run them off the event loop
+    await asyncio.to_thread(_analyze_database_state_sync)
+
+def _analyze_database_state_sync():
+    """Print signature and job statistics from the local databases."""
     print(f"\n🔍 DATABASE STATE ANALYSIS")
     print("-" * 70)
 
     try:
         # Analyze signature_wall.db
-        with sqlite3.connect("signature_wall.db") as conn:
-            cursor = conn.execute("SELECT COUNT(*) FROM signatures")
-            total_signatures = cursor.fetchone()[0]
-            print(f"📊 Total signatures in database: {total_signatures}")
-
+        with connect_read_only("signature_wall.db") as conn:
+            # One indexed GROUP BY pass; the total is the sum of the per-device counts
             cursor = conn.execute("SELECT device_name, COUNT(*) FROM signatures GROUP BY device_name ORDER BY COUNT(*) DESC")
             device_stats = cursor.fetchall()
+            total_signatures = sum(count for _, count in device_stats)
+            print(f"📊 Total signatures in database: {total_signatures}")
+
             print("📱 Signatures by device:")
             for device, count in device_stats:
                 print(f"  {device}: {count}")
 
             # Sample recent signatures
-            cursor = conn.execute("SELECT user_name, device_name, created_at FROM signatures ORDER BY id DESC LIMIT 5")
+            cursor = conn.execute("SELECT name, device_name, created_at FROM signatures ORDER BY id DESC LIMIT 5")
             recent_sigs = cursor.fetchall()
             print("✨ Recent signatures:")
             for user, device, created in recent_sigs:
                 print(f"  {user} - {device}")
 
         # Analyze quantum_jobs.db
-        with sqlite3.connect("quantum_jobs.db") as conn:
-            cursor = conn.execute("SELECT status, COUNT(*) FROM quantum_jobs GROUP BY status ORDER BY COUNT(*) DESC")
-            job_stats = cursor.fetchall()
+        with connect_read_only("quantum_jobs.db") as conn:
+            # Both distributions in one statement, each GROUP BY served by its index
+            cursor = conn.execute("""
+                SELECT 'status', status, COUNT(*) FROM quantum_jobs GROUP BY status
+                UNION ALL
+                SELECT 'device', device_id, COUNT(*) FROM quantum_jobs GROUP BY device_id
+                ORDER BY 1 DESC, 3 DESC
+            """)
+            job_rows = cursor.fetchall()
+
             print("\n⚙️  Job status distribution:")
-            for status, count in job_stats:
-                status_emoji = {"created": "🆕", "submitted": "📤", "running": "🔄", "completed": "✅", "failed": "❌"}.get(status, "❓")
-                print(f"  {status_emoji} {status}: {count}")
+            for kind, status, count in job_rows:
+                if kind == 'status':
+                    status_emoji = _JOB_STATUS_EMOJI.get(status, "❓")
+                    print(f"  {status_emoji} {status}: {count}")
 
-            cursor = conn.execute("SELECT device_id, COUNT(*) FROM quantum_jobs GROUP BY device_id ORDER BY COUNT(*) DESC")
-            job_devices = cursor.fetchall()
             print("🖥️  Jobs by device:")
-            for device, count in job_devices:
-                print(f"  {device}: {count}")
+            for kind, device, count in job_rows:
+                if kind == 'device':
+                    print(f"  {device}: {count}")
 
     except Exception as e:
         print(f"❌ Error analyzing database: {e}")
@@ -441,11 +669,14 @@ if __name__ == "__main__":
     print("🔬 Testing system scalability across all quantum computing platforms")
     print()
 
+    # Prefer the libuv-based loop for the many concurrent requests
+    run = uvloop.run if UVLOOP_AVAILABLE else asyncio.run
+
     # Run the comprehensive load test
-    results = asyncio.run(run_comprehensive_load_test())
+    results = run(run_comprehensive_load_test())
 
     # Analyze database state
-    asyncio.run(analyze_database_state())
+    run(analyze_database_state())
 
     print(f"\n🎉 Comprehensive load test completed!")
     print(f"🌌 {results.successful_requests} quantum signatures created across {len(results.device_distribution)} different quantum devices!")
\ No newline at end of file
@@ -3,6 +3,7 @@ from fastapi.responses import HTMLResponse
 from fastapi.staticfiles import StaticFiles
 from fastapi.templating import Jinja2Templates
 from pydantic import BaseModel
+from typing import List
 import uvicorn
 import hashlib
 import os
@@ -87,6 +88,16 @@ class SignatureRegistration(BaseModel):
     quantum_device: str = "local_simulator"
 
 
+class SignatureBatchRegistration(BaseModel):
+    signatures: List[SignatureRegistration]
+
+
+# Upper bound on signatures accepted by a single /register_batch call
+MAX_REGISTRATION_BATCH = 16
+# Signatures from one batch processed at once, so a batch cannot flood the quantum devices
+MAX_REGISTRATION_CONCURRENCY = int(os.getenv("MAX_REGISTRATION_CONCURRENCY", "2"))
+
+
 class TokenValidation(BaseModel):
     token: str
 
@@ -149,6 +160,26 @@ async def register_signature(signature_registration: SignatureRegistration):
     return result
 
 
+@app.post("/register_batch")
+async def register_signature_batch(batch: SignatureBatchRegistration):
+    """Register several quantum signatures in one round trip, a bounded number at a time"""
+    if len(batch.signatures) > MAX_REGISTRATION_BATCH:
+        return {
+            "success": False,
+            "error": f"Batch too large: at most {MAX_REGISTRATION_BATCH} signatures per request"
+        }
+
+    results = await signature_wall_system.register_signatures(
+        [
+            (registration.name, registration.message, registration.quantum_device)
+            for registration in batch.signatures
+        ],
+        max_concurrency=MAX_REGISTRATION_CONCURRENCY
+    )
+
+    return {"success": True, "results": results}
+
+
 @app.get("/signatures")
 async def get_signatures():
     """Get all signatures for the wall"""
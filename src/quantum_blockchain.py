@@ -1,63 +1,162 @@
 import asyncio
 import hashlib
+import itertools
+from concurrent.futures import ProcessPoolExecutor
 import json
+import math
+import multiprocessing
+import os
 import random
+import struct
 import time
+import weakref
 from datetime import datetime
-from typing import Dict, Any
+from typing import Dict, Any, List
+
+import numpy as np
 
 import boto3
 from braket.aws import AwsDevice
-from braket.circuits import Circuit
+from braket.circuits import Circuit, FreeParameter
 from braket.devices import LocalSimulator
 
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+# rx angle for each possible seed byte
+_ANGLE_LUT = tuple((c / 128.0) * math.pi for c in range(256))
+
+BELL_STATES = ('00', '01', '10', '11')
+
+# Worker processes for concurrent simulations; each one imports Braket, so keep it small
+SIMULATION_WORKERS = int(os.getenv("SIMULATION_WORKERS", str(min(4, os.cpu_count() or 1))))
+
+# Random number circuits use between 3 and 8 qubits
+RANDOM_CIRCUIT_QUBITS = range(3, 9)
+
+
+def _build_random_number_template(num_qubits: int) -> Circuit:
+    """Build the random number circuit for num_qubits with parameterised rx angles a0..a{n-1}"""
+    circuit = Circuit()
+
+    # Create superposition states
+    for i in range(num_qubits):
+        circuit.h(i)
+
+    # Add some rotation based on the seed
+    for i in range(num_qubits):
+        circuit.rx(i, FreeParameter(f"a{i}"))
+
+    # Measure all qubits
+    for i in range(num_qubits):
+        circuit.measure(i)
+
+    return circuit
+
+
+# Each pool worker keeps its own simulator across tasks
+_worker_simulator = None
+
+
+def _run_circuit(circuit: Circuit, shots: int, inputs: Dict[str, float]) -> np.ndarray:
+    """Run a circuit on this process' local simulator and return its (shots, qubits) measurements"""
+    global _worker_simulator
+    if _worker_simulator is None:
+        _worker_simulator = LocalSimulator()
+    return np.asarray(_worker_simulator.run(circuit, shots=shots, inputs=inputs).result().measurements)
+
+
+def _first_shot_to_int(measurements: np.ndarray) -> int:
+    """Read the first shot's measured bits as a big-endian integer"""
+    first_shot = measurements[0].astype(np.int64)
+    return int(first_shot @ (1 << np.arange(first_shot.size - 1, -1, -1, dtype=np.int64)))
+
 
 class QuantumService:
     """Service for quantum operations using AWS Braket"""
 
+    # Number of Bell state distributions sampled up front and served round-robin
+    BELL_SAMPLE_POOL = 8
+
     def __init__(self):
         self.local_simulator = LocalSimulator()
         # For production, you would use: AwsDevice("arn:aws:braket:::device/quantum-simulator/amazon/sv1")
 
-    def generate_quantum_random_number(self, seed_text: str) -> int:
-        """Generate a quantum random number based on user input"""
-        # Create a quantum circuit for random number generation
-        circuit = Circuit()
+        # Only a handful of circuit shapes exist, so build each once and bind angles per call
+        self._random_number_templates = {
+            n: _build_random_number_template(n) for n in RANDOM_CIRCUIT_QUBITS
+        }
+
+        # The Bell state distribution doesn't depend on the user, so sample it once per process
+        self._bell_samples = self._sample_bell_states(self.BELL_SAMPLE_POOL)
+        self._bell_index = itertools.count()
 
+        # Process pool for concurrent simulations. Spawned workers are safe to start from a threaded
+        # server (fork is not) and are only launched on first submit; finalize shuts them down if
+        # the owner never calls close()
+        self._pool = ProcessPoolExecutor(
+            max_workers=SIMULATION_WORKERS, mp_context=multiprocessing.get_context("spawn")
+        )
+        self._finalizer = weakref.finalize(self, self._pool.shutdown)
+
+    def _random_number_circuit(self, seed_text: str):
+        """Select the circuit template for seed_text and compute its rotation angles"""
         # Use the seed text to determine number of qubits (between 3 and 8)
         num_qubits = 3 + (hash(seed_text) % 6)
+        circuit = self._random_number_templates[num_qubits]
 
-        # Create superposition states
-        for i in range(num_qubits):
-            circuit.h(i)
+        # Rotation angles from the seed bytes; qubits past the end of a short seed get rx(0)
+        angles = {f"a{i}": 0.0 for i in range(num_qubits)}
+        for i, b in enumerate(seed_text.encode('utf-8')[:num_qubits]):
+            angles[f"a{i}"] = _ANGLE_LUT[b]
 
-        # Add some rotation based on the seed
-        for i, char in enumerate(seed_text[:num_qubits]):
-            angle = (ord(char) / 128.0) * 3.14159  # Convert char to angle
-            circuit.rx(i, angle)
+        return circuit, angles
 
-        # Measure all qubits
-        for i in range(num_qubits):
-            circuit.measure(i)
+    def generate_quantum_random_number(self, seed_text: str) -> int:
+        """Generate a quantum random number based on user input"""
+        circuit, angles = self._random_number_circuit(seed_text)
 
         try:
             # Run on local simulator for demo (replace with AWS Braket in production)
-            task = self.local_simulator.run(circuit, shots=10)
-            result = task.result()
-            measurement = result.measurement_counts
+            task = self.local_simulator.run(circuit, shots=10, inputs=angles)
+            measurements = np.asarray(task.result().measurements)
+
+            # Convert the first shot's bits to an integer
+            return _first_shot_to_int(measurements)
+        except Exception as e:
+            print(f"Quantum simulation error: {e}")
+            # Fallback to quantum-inspired random number
+            return hash(seed_text + str(time.time())) % 1000
 
-            # Convert binary result to integer
-            binary_result = list(measurement.keys())[0]
-            quantum_number = int(binary_result, 2)
+    async def generate_quantum_random_number_async(self, seed_text: str) -> int:
+        """Generate a quantum random number in the process pool so concurrent users run in parallel"""
+        circuit, angles = self._random_number_circuit(seed_text)
 
-            return quantum_number
+        try:
+            measurements = await asyncio.get_running_loop().run_in_executor(
+                self._pool, _run_circuit, circuit, 10, angles
+            )
+
+            # Convert the first shot's bits to an integer
+            return _first_shot_to_int(measurements)
         except Exception as e:
             print(f"Quantum simulation error: {e}")
             # Fallback to quantum-inspired random number
             return hash(seed_text + str(time.time())) % 1000
 
+    def close(self):
+        """Shut down the simulation process pool"""
+        self._finalizer()
+
     def create_bell_state_circuit(self) -> Dict[str, float]:
-        """Create a Bell state and measure correlations"""
+        """Return the next pre-sampled Bell state probability distribution"""
+        return dict(self._bell_samples[next(self._bell_index) % len(self._bell_samples)])
+
+    def _sample_bell_states(self, count: int, shots: int = 1000) -> List[Dict[str, float]]:
+        """Create a Bell state and measure correlations for count independent samples"""
         circuit = Circuit()
 
         # Create Bell state |00⟩ + |11⟩
@@ -69,23 +168,19 @@ class QuantumService:
         circuit.measure(1)
 
         try:
-            # Run multiple shots to get probability distribution
-            task = self.local_simulator.run(circuit, shots=1000)
-            result = task.result()
-            counts = result.measurement_counts
-
-            # Normalize to probabilities
-            total_shots = sum(counts.values())
-            probabilities = {}
-
-            for state in ['00', '01', '10', '11']:
-                probabilities[state] = counts.get(state, 0) / total_shots
-
-            return probabilities
+            # One run with count * shots shots, split into independent samples
+            task = self.local_simulator.run(circuit, shots=count * shots)
+            measurements = np.asarray(task.result().measurements).reshape(count, shots, 2)
+
+            # Normalize to probabilities: one bincount over (sample, outcome) pairs
+            outcomes = measurements.astype(np.int64) @ np.array([2, 1], dtype=np.int64)
+            offsets = np.arange(count, dtype=np.int64)[:, None] * 4
+            state_counts = np.bincount((outcomes + offsets).ravel(), minlength=count * 4).reshape(count, 4)
+            return [dict(zip(BELL_STATES, row)) for row in (state_counts / shots).tolist()]
         except Exception as e:
             print(f"Bell state simulation error: {e}")
             # Return theoretical Bell state probabilities
-            return {'00': 0.5, '01': 0.0, '10': 0.0, '11': 0.5}
+            return [{'00': 0.5, '01': 0.0, '10': 0.0, '11': 0.5}]
 
 
 class BlockchainService:
@@ -107,11 +202,14 @@ class BlockchainService:
             'type': 'quantum_generation'
         }
 
+        # Serialize once; both hashes are computed over the same canonical bytes
+        payload = self._canonical_payload(transaction_data)
+
         # Generate transaction ID
-        transaction_id = self._generate_transaction_id(transaction_data)
+        transaction_id = self._generate_transaction_id(payload)
 
         # Generate block hash (simulated)
-        block_hash = self._generate_block_hash(transaction_data, transaction_id)
+        block_hash = self._generate_block_hash(payload, transaction_id)
 
         # In production, you would insert into QLDB:
         # self._insert_to_qldb(transaction_data, transaction_id, block_hash)
@@ -122,15 +220,22 @@ class BlockchainService:
             'timestamp': transaction_data['timestamp']
         }
 
-    def _generate_transaction_id(self, data: Dict[str, Any]) -> str:
+    def _canonical_payload(self, data: Dict[str, Any]) -> bytes:
+        """Serialize transaction data to canonical (sorted-key) JSON bytes"""
+        if ORJSON_AVAILABLE:
+            return orjson.dumps(data, option=orjson.OPT_SORT_KEYS)
+        return json.dumps(data, sort_keys=True, separators=(',', ':'), ensure_ascii=False).encode()
+
+    def _generate_transaction_id(self, payload: bytes) -> str:
         """Generate unique transaction ID"""
-        data_string = json.dumps(data, sort_keys=True)
-        return hashlib.sha256(data_string.encode()).hexdigest()[:16]
+        return hashlib.sha256(payload).hexdigest()[:16]
 
-    def _generate_block_hash(self, data: Dict[str, Any], transaction_id: str) -> str:
+    def _generate_block_hash(self, payload: bytes, transaction_id: str) -> str:
         """Generate block hash"""
-        combined = f"{transaction_id}{json.dumps(data, sort_keys=True)}{time.time()}"
-        return hashlib.sha256(combined.encode()).hexdigest()
+        block_hash = hashlib.sha256(transaction_id.encode())
+        block_hash.update(payload)
+        block_hash.update(struct.pack('<d', time.time()))
+        return block_hash.hexdigest()
 
     def _insert_to_qldb(self, transaction_data: Dict[str, Any], transaction_id: str, block_hash: str):
         """Insert data to AWS QLDB (placeholder for production implementation)"""
@@ -148,11 +253,15 @@ class DemoQuantumBlockchain:
         self.quantum_service = QuantumService()
         self.blockchain_service = BlockchainService()
 
+    def close(self):
+        """Release the quantum service's worker processes; call from the app's shutdown hook"""
+        self.quantum_service.close()
+
     async def process_user_input(self, name: str, message: str) -> Dict[str, Any]:
         """Process user input and generate quantum + blockchain results"""
         try:
             # Generate quantum random number
-            quantum_number = self.quantum_service.generate_quantum_random_number(f"{name}:{message}")
+            quantum_number = await self.quantum_service.generate_quantum_random_number_async(f"{name}:{message}")
 
             # Create entanglement demonstration
             entanglement_data = self.quantum_service.create_bell_state_circuit()
@@ -13,19 +13,25 @@ Note: This package is named 'quantum_service' to avoid conflicts with
 the 'braket' package from amazon-braket-sdk.
 """
 
-from .credentials import AWSCredentialsManager, credentials_manager
-from .devices import QuantumDeviceManager
-from .crypto import ToyLWE, QuantumResistantCrypto
-from .quantum_service import EnhancedQuantumService
-from .handlers import (
-    handler,
-    handler_options,
-    handler_devices,
-    handler_verify_credentials,
-    handler_status,
-    handler_health,
-    get_quantum_service
-)
+import importlib
+
+# Exports are resolved on first access (PEP 562) so importing a single
+# submodule, e.g. for the health handler, doesn't load the Braket SDK
+_EXPORTS = {
+    'AWSCredentialsManager': '.credentials',
+    'credentials_manager': '.credentials',
+    'QuantumDeviceManager': '.devices',
+    'ToyLWE': '.crypto',
+    'QuantumResistantCrypto': '.crypto',
+    'EnhancedQuantumService': '.quantum_service',
+    'handler': '.handlers',
+    'handler_options': '.handlers',
+    'handler_devices': '.handlers',
+    'handler_verify_credentials': '.handlers',
+    'handler_status': '.handlers',
+    'handler_health': '.handlers',
+    'get_quantum_service': '.handlers',
+}
 
 __all__ = [
     # Credentials
@@ -49,3 +55,16 @@ __all__ = [
 ]
 
 __version__ = '1.0.0'
+
+
+def __getattr__(name):
+    module_name = _EXPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module_name, __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(list(globals()) + list(_EXPORTS))
@@ -14,8 +14,7 @@ Environment Variables:
 import os
 import time
 import logging
-from datetime import datetime
-from typing import Dict, Any, Optional
+from typing import Dict, Any, Optional, Tuple
 
 # Configure logging
 logger = logging.getLogger(__name__)
@@ -24,12 +23,34 @@ logger = logging.getLogger(__name__)
 try:
     import boto3
     from botocore.config import Config
+    from botocore.credentials import (
+        AssumeRoleCredentialFetcher, CredentialProvider, CredentialResolver,
+        DeferredRefreshableCredentials
+    )
+    from botocore.session import get_session as get_botocore_session
     AWS_SDK_AVAILABLE = True
 except ImportError:
     AWS_SDK_AVAILABLE = False
     logger.warning("boto3 not available, AWS features will be limited")
 
 
+if AWS_SDK_AVAILABLE:
+    class _StaticCredentialProvider(CredentialProvider):
+        """Credential provider that always hands out one (refreshable) credentials object."""
+
+        METHOD = 'sts-assume-role'
+
+        def __init__(self, credentials: Any):
+            super().__init__()
+            self._credentials = credentials
+
+        def load(self) -> Any:
+            return self._credentials
+
+# How long Braket clients and a successful permission check are reused
+BRAKET_CACHE_TTL_SECONDS = int(os.getenv("BRAKET_CACHE_TTL_SECONDS", "900"))
+
+
 class AWSCredentialsManager:
     """
     Manages AWS credentials using IAM roles or STS for Lambda execution.
@@ -45,9 +66,27 @@ class AWSCredentialsManager:
 
     def __init__(self):
         self._session = None
-        self._braket_client = None
+        self._braket_clients: Dict[str, Tuple[Any, float]] = {}
+        self._verify_cache: Optional[Tuple[Dict[str, Any], float]] = None
         self._credentials_expiry = None
         self._cached_sessions: Dict[str, Any] = {}
+        self._assumed_credentials: Dict[str, Any] = {}
+        self.refresh_env()
+
+        # Shared by all clients: pooled keep-alive connections avoid a TLS
+        # handshake per Braket call
+        self._botocore_config = Config(
+            retries={'max_attempts': 10, 'mode': 'adaptive'},
+            max_pool_connections=50,
+            tcp_keepalive=True,
+            connect_timeout=5,
+            read_timeout=30
+        ) if AWS_SDK_AVAILABLE else None
+
+    def refresh_env(self):
+        """Re-read the role settings from the environment (read once at init)."""
+        self._assume_role_arn = os.environ.get('BRAKET_ASSUME_ROLE_ARN')
+        self._external_id = os.environ.get('BRAKET_EXTERNAL_ID')
 
     def get_session(self, region: str = 'us-east-1') -> Optional[Any]:
         """
@@ -63,15 +102,14 @@ class AWSCredentialsManager:
             return None
 
         try:
-            # Check cache first
-            cache_key = f"{region}"
-            if cache_key in self._cached_sessions:
-                cached = self._cached_sessions[cache_key]
-                if cached.get('expiry') and datetime.utcnow() < cached['expiry']:
-                    return cached['session']
-
             # Check if we need to assume a specific role
-            assume_role_arn = os.environ.get('BRAKET_ASSUME_ROLE_ARN')
+            assume_role_arn = self._assume_role_arn
+
+            # Check cache first; credentials in cached sessions refresh themselves
+            cache_key = f"{region}:{assume_role_arn}" if assume_role_arn else region
+            session = self._cached_sessions.get(cache_key)
+            if session is not None:
+                return session
 
             if assume_role_arn:
                 session = self._get_session_with_assumed_role(assume_role_arn, region)
@@ -94,23 +132,16 @@ class AWSCredentialsManager:
         3. AWS config file (~/.aws/config)
         4. Container credentials (ECS)
         5. Instance profile credentials (EC2/Lambda)
-        """
-        config = Config(
-            region_name=region,
-            retries={'max_attempts': 3, 'mode': 'adaptive'},
-            connect_timeout=10,
-            read_timeout=60
-        )
 
-        self._session = boto3.Session(region_name=region)
+        One session is shared by all regions; clients pass region_name
+        explicitly, and building a session reloads the service data.
+        """
+        if self._session is None:
+            self._session = boto3.Session(region_name=region)
+            logger.info(f"Created AWS session with default credentials in region {region}")
 
         # Cache the session
-        self._cached_sessions[region] = {
-            'session': self._session,
-            'expiry': None  # Default credentials don't expire in this context
-        }
-
-        logger.info(f"Created AWS session with default credentials in region {region}")
+        self._cached_sessions[region] = self._session
         return self._session
 
     def _get_session_with_assumed_role(self, role_arn: str, region: str) -> Any:
@@ -124,65 +155,70 @@ class AWSCredentialsManager:
         Returns:
             boto3.Session with assumed role credentials
         """
-        # Check if we need to refresh credentials
-        cache_key = f"{region}:{role_arn}"
-        if cache_key in self._cached_sessions:
-            cached = self._cached_sessions[cache_key]
-            if cached.get('expiry') and datetime.utcnow() < cached['expiry']:
-                return cached['session']
-
         try:
-            # Create STS client with current credentials
-            sts_client = boto3.client('sts', region_name=region)
-
-            # Get caller identity for logging
-            try:
-                caller_identity = sts_client.get_caller_identity()
-                logger.info(f"Current identity: {caller_identity.get('Arn')}")
-            except Exception:
-                logger.debug("Could not get caller identity")
-
-            # Assume the target role
-            session_name = f"quantum-lambda-{int(time.time())}"
-            external_id = os.environ.get('BRAKET_EXTERNAL_ID')
-
-            assume_params = {
-                'RoleArn': role_arn,
-                'RoleSessionName': session_name,
-                'DurationSeconds': 3600  # 1 hour
-            }
+            credentials = self._get_assumed_role_credentials(role_arn, region)
+            # Fetch up front so a failed AssumeRole still falls back below
+            credentials.get_frozen_credentials()
 
-            if external_id:
-                assume_params['ExternalId'] = external_id
-
-            response = sts_client.assume_role(**assume_params)
-            credentials = response['Credentials']
-
-            # Create session with assumed role credentials
-            session = boto3.Session(
-                aws_access_key_id=credentials['AccessKeyId'],
-                aws_secret_access_key=credentials['SecretAccessKey'],
-                aws_session_token=credentials['SessionToken'],
-                region_name=region
+            botocore_session = get_botocore_session()
+            botocore_session.register_component(
+                'credential_provider', CredentialResolver([_StaticCredentialProvider(credentials)])
             )
-
-            # Track expiry for refresh (subtract 5 minutes for safety margin)
-            expiry = credentials['Expiration'].replace(tzinfo=None)
+            session = boto3.Session(botocore_session=botocore_session, region_name=region)
 
             # Cache the session
-            self._cached_sessions[cache_key] = {
-                'session': session,
-                'expiry': expiry
-            }
+            self._cached_sessions[f"{region}:{role_arn}"] = session
 
-            logger.info(f"Assumed role {role_arn}, expires at {expiry}")
+            logger.info(f"Assumed role {role_arn} for region {region}")
             return session
 
         except Exception as e:
             logger.error(f"Failed to assume role {role_arn}: {e}")
+            self._assumed_credentials.pop(role_arn, None)
             # Fall back to default credentials
             return self._get_default_session(region)
 
+    def _get_assumed_role_credentials(self, role_arn: str, region: str) -> Any:
+        """
+        Get botocore credentials for role_arn that re-assume the role as needed.
+
+        STS credentials are global, so one credentials object per role is
+        shared by the sessions of every region.
+        """
+        credentials = self._assumed_credentials.get(role_arn)
+        if credentials is not None:
+            return credentials
+
+        assume_params = {
+            'RoleSessionName': f"quantum-lambda-{int(time.time())}",
+            'DurationSeconds': 3600  # 1 hour
+        }
+
+        if self._external_id:
+            assume_params['ExternalId'] = self._external_id
+
+        # Older SDKs default to the global sts.amazonaws.com endpoint; regional
+        # endpoints are closer and have their own throttling limits
+        source_botocore_session = get_botocore_session()
+        source_botocore_session.set_config_variable('sts_regional_endpoints', 'regional')
+        source_session = boto3.Session(botocore_session=source_botocore_session)
+        sts_config = Config(retries={'mode': 'adaptive'})
+
+        fetcher = AssumeRoleCredentialFetcher(
+            client_creator=lambda service_name, **kwargs: source_session.client(
+                service_name, region_name=region, config=sts_config, **kwargs
+            ),
+            source_credentials=source_session.get_credentials(),
+            role_arn=role_arn,
+            extra_args=assume_params
+        )
+        credentials = DeferredRefreshableCredentials(
+            refresh_using=fetcher.fetch_credentials,
+            method='sts-assume-role'
+        )
+        self._assumed_credentials[role_arn] = credentials
+        return credentials
+
     def get_braket_client(self, region: str = 'us-east-1') -> Optional[Any]:
         """
         Get Braket client with proper credentials.
@@ -196,10 +232,20 @@ class AWSCredentialsManager:
         if not AWS_SDK_AVAILABLE:
             return None
 
+        cached = self._braket_clients.get(region)
+        if cached and time.monotonic() < cached[1]:
+            return cached[0]
+
         session = self.get_session(region)
         if session:
             try:
-                return session.client('braket', region_name=region)
+                braket_client = session.client(
+                    'braket', region_name=region, config=self._botocore_config
+                )
+                self._braket_clients[region] = (
+                    braket_client, time.monotonic() + BRAKET_CACHE_TTL_SECONDS
+                )
+                return braket_client
             except Exception as e:
                 logger.error(f"Failed to create Braket client: {e}")
         return None
@@ -217,13 +263,19 @@ class AWSCredentialsManager:
         if not AWS_SDK_AVAILABLE:
             return {'success': False, 'error': 'AWS SDK not available'}
 
+        # Device availability is stable, so a successful check is reused
+        if self._verify_cache and time.monotonic() < self._verify_cache[1]:
+            return dict(self._verify_cache[0])
+
         try:
             session = self.get_session()
             if not session:
                 return {'success': False, 'error': 'Could not create AWS session'}
 
             # Try to list devices as a permission check
-            braket_client = session.client('braket', region_name='us-east-1')
+            braket_client = self.get_braket_client('us-east-1')
+            if not braket_client:
+                return {'success': False, 'error': 'Could not create Braket client'}
 
             # List available devices (lightweight API call)
             # Note: SearchDevices API only supports 'deviceArn' as filter name
@@ -236,11 +288,13 @@ class AWSCredentialsManager:
                 maxResults=1
             )
 
-            return {
+            result = {
                 'success': True,
                 'message': 'Braket permissions verified',
                 'devices_found': len(response.get('devices', []))
             }
+            self._verify_cache = (result, time.monotonic() + BRAKET_CACHE_TTL_SECONDS)
+            return dict(result)
 
         except Exception as e:
             error_msg = str(e)
@@ -260,10 +314,12 @@ class AWSCredentialsManager:
             }
 
     def clear_cache(self):
-        """Clear all cached sessions."""
+        """Clear all cached sessions, clients and permission checks."""
         self._cached_sessions.clear()
         self._session = None
-        self._braket_client = None
+        self._braket_clients.clear()
+        self._verify_cache = None
+        self._assumed_credentials.clear()
         self._credentials_expiry = None
         logger.info("Cleared credentials cache")
 
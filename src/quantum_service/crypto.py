@@ -16,6 +16,11 @@ import hashlib
 import secrets
 from typing import Dict, List
 
+import numpy as np
+
+# Signatures are base64 of a 64-character SHA-256 hex digest
+_SIGNATURE_B64_LENGTH = 88
+
 
 def _shake256(bytes_like: bytes, outlen: int) -> bytes:
     """
@@ -56,14 +61,29 @@ def _sample_small(count: int, bound: int = 1) -> List[int]:
     Returns:
         List of sampled integers
     """
-    return [secrets.randbelow(2 * bound + 1) - bound for _ in range(count)]
-
-
-def _prng_matrix_from_seed(seed: bytes, q: int, m: int, n: int) -> List[List[int]]:
+    # One entropy read per block; rejection below a multiple of the span keeps it uniform
+    span = 2 * bound + 1
+    dtype = np.dtype(np.uint8) if span <= 256 else np.dtype("<u2")
+    cutoff = (256 ** dtype.itemsize // span) * span
+    samples = [np.empty(0, dtype=dtype)]
+    accepted = 0
+    while accepted < count:
+        words = np.frombuffer(secrets.token_bytes(2 * count * dtype.itemsize), dtype=dtype)
+        words = words[words < cutoff]
+        samples.append(words)
+        accepted += words.size
+    values = np.concatenate(samples)[:count].astype(np.int64) % span - bound
+    return values.tolist()
+
+
+def _prng_matrix_from_seed(seed: bytes, q: int, m: int, n: int) -> np.ndarray:
     """
     Generate deterministic matrix from seed using XOF.
 
     This creates a pseudorandom m x n matrix with entries in Z_q.
+    One SHAKE256 stream over seed || block counter is read as 16-bit
+    little-endian words and rejection-sampled below the largest multiple
+    of q, so entries are uniform mod q.
 
     Args:
         seed: Random seed bytes
@@ -72,37 +92,40 @@ def _prng_matrix_from_seed(seed: bytes, q: int, m: int, n: int) -> List[List[int
         n: Number of columns
 
     Returns:
-        m x n matrix of integers mod q
+        m x n int64 matrix of integers mod q
     """
-    A = []
-    counter = 0
-    while len(A) < m:
-        row = []
-        while len(row) < n:
-            block = _shake256(seed + _int_to_be(counter, 4), 2)
-            val = int.from_bytes(block, "big") % q
-            row.append(val)
-            counter += 1
-        A.append(row)
-    return A
-
-
-def _mat_vec(A: List[List[int]], s: List[int], q: int) -> List[int]:
+    count = m * n
+    cutoff = (65536 // q) * q
+    samples = []
+    accepted = 0
+    block = 0
+    while accepted < count:
+        # 2x oversampling, so a second block is only needed in rare cases
+        words = np.frombuffer(_shake256(seed + _int_to_be(block, 4), 4 * count), dtype="<u2")
+        words = words[words < cutoff]
+        samples.append(words)
+        accepted += words.size
+        block += 1
+    A = np.concatenate(samples)[:count].astype(np.int64) % q
+    return A.reshape(m, n)
+
+
+def _mat_vec(A: np.ndarray, s, q: int) -> np.ndarray:
     """
     Matrix-vector multiplication mod q.
 
     Args:
-        A: m x n matrix
+        A: m x n int64 matrix
         s: n-dimensional vector
         q: Modulus
 
     Returns:
-        m-dimensional result vector
+        m-dimensional int64 result vector
     """
-    return [sum(aij * sj for aij, sj in zip(ai, s)) % q for ai in A]
+    return (A @ np.asarray(s, dtype=np.int64)) % q
 
 
-def _vec_add(u: List[int], v: List[int], q: int) -> List[int]:
+def _vec_add(u, v, q: int) -> np.ndarray:
     """
     Vector addition mod q.
 
@@ -112,9 +135,14 @@ def _vec_add(u: List[int], v: List[int], q: int) -> List[int]:
         q: Modulus
 
     Returns:
-        Element-wise sum mod q
+        Element-wise int64 sum mod q
     """
-    return [(x + y) % q for x, y in zip(u, v)]
+    return (np.asarray(u, dtype=np.int64) + np.asarray(v, dtype=np.int64)) % q
+
+
+def _vector_dtype(q: int) -> np.dtype:
+    """Smallest little-endian unsigned dtype holding integers mod q."""
+    return np.dtype("<u2") if q <= 1 << 16 else np.dtype("<u4")
 
 
 class ToyLWE:
@@ -196,7 +224,7 @@ class ToyLWE:
 
         # Step 7: Serialize keys
         sk_obj = {
-            "version": "toy-lwe-1",
+            "version": "toy-lwe-3",
             "q": q,
             "n": n,
             "m": m,
@@ -205,12 +233,13 @@ class ToyLWE:
         }
 
         pk_obj = {
-            "version": "toy-lwe-1",
+            "version": "toy-lwe-3",
             "q": q,
             "n": n,
             "m": m,
             "A_seed": base64.b64encode(seed_A).decode(),  # Compact: store seed not A
-            "b": b,  # PUBLIC: b = A*s + e (mod q)
+            # PUBLIC: b = A*s + e (mod q), packed little-endian
+            "b": base64.b64encode(b.astype(_vector_dtype(q)).tobytes()).decode(),
         }
 
         private_key = base64.b64encode(json.dumps(sk_obj).encode()).decode()
@@ -224,8 +253,12 @@ class ToyLWE:
 
     @staticmethod
     def decode_public_key(public_key: str) -> Dict:
-        """Decode a public key from base64."""
-        return json.loads(base64.b64decode(public_key).decode())
+        """Decode a public key from base64, unpacking b to a list of ints."""
+        pk_obj = json.loads(base64.b64decode(public_key).decode())
+        if isinstance(pk_obj.get("b"), str):
+            packed = base64.b64decode(pk_obj["b"])
+            pk_obj["b"] = np.frombuffer(packed, dtype=_vector_dtype(pk_obj["q"])).tolist()
+        return pk_obj
 
     @staticmethod
     def decode_private_key(private_key: str) -> Dict:
@@ -275,15 +308,17 @@ class QuantumResistantCrypto:
             Base64-encoded signature
         """
         # Hash the message
-        message_hash = hashlib.sha256(message.encode()).hexdigest()
+        message_hash = hashlib.sha256(message.encode()).digest()
 
         # Hash the quantum entropy
-        entropy_hash = hashlib.sha256(str(quantum_entropy).encode()).hexdigest()
+        entropy_hash = hashlib.sha256(str(quantum_entropy).encode()).digest()
 
-        # Combine with private key material
-        signature_data = f"{message_hash}:{entropy_hash}:{private_key[:16]}"
-        signature_hash = hashlib.sha256(signature_data.encode()).hexdigest()
+        # Combine raw digests with private key material
+        signature_hash = hashlib.sha256(
+            message_hash + b":" + entropy_hash + b":" + private_key[:16].encode()
+        ).hexdigest()
 
+        # Hex inside base64 keeps the format verify_signature expects
         return base64.b64encode(signature_hash.encode()).decode()
 
     def verify_signature(self, message: str, signature: str, public_key: str) -> bool:
@@ -305,12 +340,14 @@ class QuantumResistantCrypto:
         # Real implementation would verify cryptographically
         if not signature or not public_key:
             return False
+        if len(signature) != _SIGNATURE_B64_LENGTH:
+            return False
 
         try:
             # Decode signature
             decoded_sig = base64.b64decode(signature).decode()
             # Check it's a valid hex string (SHA256 output)
-            int(decoded_sig, 16)
+            bytes.fromhex(decoded_sig)
             return True
         except Exception:
             return False
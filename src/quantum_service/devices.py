@@ -7,7 +7,238 @@ Manages different quantum devices and their capabilities including:
 - Quantum Processing Units (QPUs): IonQ, IQM, QuEra, Rigetti
 """
 
-from typing import Dict, Any, List
+from types import MappingProxyType
+from typing import Mapping, Dict, Any, Sequence, Tuple
+
+import numpy as np
+
+
+# Device configurations
+_DEVICE_CONFIGS: Dict[str, Dict[str, Any]] = {
+    'local_simulator': {
+        'name': 'Local Simulator',
+        'type': 'simulator',
+        'arn': 'local://simulator',
+        'region': 'local',
+        'description': 'Fast local quantum circuit simulator',
+        'advantages': [
+            'Immediate results',
+            'No cost',
+            'Always available',
+            'No AWS credentials required'
+        ],
+        'typical_runtime': '< 1 second',
+        'max_qubits': 34,
+        'supports_bell_states': True,
+        'async_required': False,
+        'cost_per_task': 0,
+        'cost_per_shot': 0
+    },
+    'aws_sv1': {
+        'name': 'AWS SV1 Simulator',
+        'type': 'managed_simulator',
+        'arn': 'arn:aws:braket:::device/quantum-simulator/amazon/sv1',
+        'region': 'us-east-1',
+        'description': 'AWS managed state vector quantum simulator',
+        'advantages': [
+            'High performance',
+            'Up to 34 qubits',
+            'Cloud scalability',
+            'No queue wait time'
+        ],
+        'typical_runtime': '1-5 seconds',
+        'max_qubits': 34,
+        'supports_bell_states': True,
+        'async_required': True,
+        'cost_per_task': 0.00,
+        'cost_per_shot': 0.00
+    },
+    'aws_dm1': {
+        'name': 'AWS DM1 Simulator',
+        'type': 'managed_simulator',
+        'arn': 'arn:aws:braket:::device/quantum-simulator/amazon/dm1',
+        'region': 'us-east-1',
+        'description': 'AWS managed density matrix quantum simulator with noise modeling',
+        'advantages': [
+            'Noise modeling',
+            'Up to 17 qubits',
+            'Mixed state simulation',
+            'No queue wait time'
+        ],
+        'typical_runtime': '1-5 seconds',
+        'max_qubits': 17,
+        'supports_bell_states': True,
+        'async_required': True,
+        'cost_per_task': 0.00,
+        'cost_per_shot': 0.00
+    },
+    'aws_tn1': {
+        'name': 'AWS TN1 Simulator',
+        'type': 'managed_simulator',
+        'arn': 'arn:aws:braket:::device/quantum-simulator/amazon/tn1',
+        'region': 'us-east-1',
+        'description': 'AWS managed tensor network simulator with GPU acceleration',
+        'advantages': [
+            'Up to 50 qubits',
+            'GPU-accelerated',
+            'Structured circuits',
+            'No queue wait time'
+        ],
+        'typical_runtime': '1-10 seconds',
+        'max_qubits': 50,
+        'supports_bell_states': True,
+        'async_required': True,
+        'cost_per_task': 0.00,
+        'cost_per_shot': 0.00
+    },
+    'ionq_aria': {
+        'name': 'IonQ Aria',
+        'type': 'qpu',
+        'arn': 'arn:aws:braket:us-east-1::device/qpu/ionq/Aria-1',
+        'region': 'us-east-1',
+        'description': 'IonQ trapped ion quantum processor',
+        'advantages': [
+            'Real quantum hardware',
+            'High fidelity gates',
+            'All-to-all qubit connectivity',
+            'Long coherence times'
+        ],
+        'typical_runtime': '5-30 minutes',
+        'max_qubits': 25,
+        'supports_bell_states': True,
+        'async_required': True,
+        'technology': 'Trapped Ion',
+        'cost_per_task': 0.30,
+        'cost_per_shot': 0.01
+    },
+    'ionq_forte': {
+        'name': 'IonQ Forte Enterprise',
+        'type': 'qpu',
+        'arn': 'arn:aws:braket:us-east-1::device/qpu/ionq/Forte-Enterprise-1',
+        'region': 'us-east-1',
+        'description': 'IonQ trapped ion quantum processor',
+        'advantages': [
+            'Real quantum hardware',
+            'High fidelity gates',
+            'All-to-all qubit connectivity',
+            'Long coherence times'
+        ],
+        'typical_runtime': '5-30 minutes',
+        'max_qubits': 32,
+        'supports_bell_states': True,
+        'async_required': True,
+        'technology': 'Trapped Ion',
+        'cost_per_task': 0.30,
+        'cost_per_shot': 0.01
+    },
+    'iqm_garnet': {
+        'name': 'IQM Garnet',
+        'type': 'qpu',
+        'arn': 'arn:aws:braket:eu-north-1::device/qpu/iqm/Emerald',
+        'region': 'eu-north-1',
+        'description': 'IQM superconducting quantum processor',
+        'advantages': [
+            'European quantum hardware',
+            'Superconducting qubits',
+            'Fast gate operations',
+            'Low latency in EU'
+        ],
+        'typical_runtime': '10-45 minutes',
+        'max_qubits': 20,
+        'supports_bell_states': True,
+        'async_required': True,
+        'technology': 'Superconducting',
+        'cost_per_task': 0.30,
+        'cost_per_shot': 0.00145
+    },
+    'aqt_ibex_q1': {
+        'name': 'AQT IBEX Q1',
+        'type': 'qpu',
+        'arn': 'arn:aws:braket:eu-central-1::device/qpu/aqt/IBEX-Q1',
+        'region': 'eu-central-1',
+        'description': 'AQT trapped ion quantum processor',
+        'advantages': [
+            'High fidelity gates',
+            'All-to-all connectivity',
+            'European technology',
+            'Compact design'
+        ],
+        'typical_runtime': '5-30 minutes',
+        'max_qubits': 12,
+        'supports_bell_states': True,
+        'async_required': True,
+        'technology': 'Trapped Ion',
+        'cost_per_task': 0.30,
+        'cost_per_shot': 0.01
+    },
+    'iqm_emerald': {
+        'name': 'IQM Emerald',
+        'type': 'qpu',
+        'arn': 'arn:aws:braket:eu-north-1::device/qpu/iqm/Emerald',
+        'region': 'eu-north-1',
+        'description': 'IQM 54-qubit superconducting quantum processor',
+        'advantages': [
+            'European quantum hardware',
+            '54 superconducting qubits',
+            'Fast gate operations',
+            'Scalable crystal lattice architecture'
+        ],
+        'typical_runtime': '10-45 minutes',
+        'max_qubits': 54,
+        'supports_bell_states': True,
+        'async_required': True,
+        'technology': 'Superconducting',
+        'cost_per_task': 0.30,
+        'cost_per_shot': 0.00145
+    },
+    'quera_aquila': {
+        'name': 'QuEra Aquila',
+        'type': 'qpu',
+        'arn': 'arn:aws:braket:us-east-1::device/qpu/quera/Aquila',
+        'region': 'us-east-1',
+        'description': 'QuEra neutral atom quantum processor',
+        'advantages': [
+            'Neutral atom technology',
+            'Programmable atom topology',
+            'Analog quantum simulation',
+            'Large qubit count (256)'
+        ],
+        'typical_runtime': '15-60 minutes',
+        'max_qubits': 256,
+        'supports_bell_states': False,  # Uses AHS paradigm
+        'async_required': True,
+        'technology': 'Neutral Atom',
+        'paradigm': 'Analog Hamiltonian Simulation (AHS)',
+        'cost_per_task': 0.30,
+        'cost_per_shot': 0.01
+    },
+    'rigetti_ankaa3': {
+        'name': 'Rigetti Ankaa-3',
+        'type': 'qpu',
+        'arn': 'arn:aws:braket:us-west-1::device/qpu/rigetti/Ankaa-3',
+        'region': 'us-west-1',
+        'description': 'Rigetti superconducting quantum processor',
+        'advantages': [
+            'Parametric gates',
+            'Fast execution',
+            'NISQ algorithm support',
+            'Active qubit reset'
+        ],
+        'typical_runtime': '5-20 minutes',
+        'max_qubits': 84,
+        'supports_bell_states': True,
+        'async_required': True,
+        'technology': 'Superconducting',
+        'cost_per_task': 0.30,
+        'cost_per_shot': 0.00035
+    }
+}
+
+# Frozen all the way down, so the catalog can be shared by every manager instance
+_DEVICES: Mapping[str, Mapping[str, Any]] = MappingProxyType({
+    device_id: MappingProxyType({**config, 'advantages': tuple(config['advantages'])})
+    for device_id, config in _DEVICE_CONFIGS.items()
+})
 
 
 class QuantumDeviceManager:
@@ -21,230 +252,47 @@ class QuantumDeviceManager:
     """
 
     def __init__(self):
-        self.devices = self._initialize_devices()
+        self.devices = _DEVICES
+        self._build_indices()
 
-    def _initialize_devices(self) -> Dict[str, Dict[str, Any]]:
-        """Initialize device configurations."""
-        return {
-            'local_simulator': {
-                'name': 'Local Simulator',
-                'type': 'simulator',
-                'arn': 'local://simulator',
-                'region': 'local',
-                'description': 'Fast local quantum circuit simulator',
-                'advantages': [
-                    'Immediate results',
-                    'No cost',
-                    'Always available',
-                    'No AWS credentials required'
-                ],
-                'typical_runtime': '< 1 second',
-                'max_qubits': 34,
-                'supports_bell_states': True,
-                'async_required': False,
-                'cost_per_task': 0,
-                'cost_per_shot': 0
-            },
-            'aws_sv1': {
-                'name': 'AWS SV1 Simulator',
-                'type': 'managed_simulator',
-                'arn': 'arn:aws:braket:::device/quantum-simulator/amazon/sv1',
-                'region': 'us-east-1',
-                'description': 'AWS managed state vector quantum simulator',
-                'advantages': [
-                    'High performance',
-                    'Up to 34 qubits',
-                    'Cloud scalability',
-                    'No queue wait time'
-                ],
-                'typical_runtime': '1-5 seconds',
-                'max_qubits': 34,
-                'supports_bell_states': True,
-                'async_required': True,
-                'cost_per_task': 0.00,
-                'cost_per_shot': 0.00
-            },
-            'aws_dm1': {
-                'name': 'AWS DM1 Simulator',
-                'type': 'managed_simulator',
-                'arn': 'arn:aws:braket:::device/quantum-simulator/amazon/dm1',
-                'region': 'us-east-1',
-                'description': 'AWS managed density matrix quantum simulator with noise modeling',
-                'advantages': [
-                    'Noise modeling',
-                    'Up to 17 qubits',
-                    'Mixed state simulation',
-                    'No queue wait time'
-                ],
-                'typical_runtime': '1-5 seconds',
-                'max_qubits': 17,
-                'supports_bell_states': True,
-                'async_required': True,
-                'cost_per_task': 0.00,
-                'cost_per_shot': 0.00
-            },
-            'aws_tn1': {
-                'name': 'AWS TN1 Simulator',
-                'type': 'managed_simulator',
-                'arn': 'arn:aws:braket:::device/quantum-simulator/amazon/tn1',
-                'region': 'us-east-1',
-                'description': 'AWS managed tensor network simulator with GPU acceleration',
-                'advantages': [
-                    'Up to 50 qubits',
-                    'GPU-accelerated',
-                    'Structured circuits',
-                    'No queue wait time'
-                ],
-                'typical_runtime': '1-10 seconds',
-                'max_qubits': 50,
-                'supports_bell_states': True,
-                'async_required': True,
-                'cost_per_task': 0.00,
-                'cost_per_shot': 0.00
-            },
-            'ionq_aria': {
-                'name': 'IonQ Aria',
-                'type': 'qpu',
-                'arn': 'arn:aws:braket:us-east-1::device/qpu/ionq/Aria-1',
-                'region': 'us-east-1',
-                'description': 'IonQ trapped ion quantum processor',
-                'advantages': [
-                    'Real quantum hardware',
-                    'High fidelity gates',
-                    'All-to-all qubit connectivity',
-                    'Long coherence times'
-                ],
-                'typical_runtime': '5-30 minutes',
-                'max_qubits': 25,
-                'supports_bell_states': True,
-                'async_required': True,
-                'technology': 'Trapped Ion',
-                'cost_per_task': 0.30,
-                'cost_per_shot': 0.01
-            },
-            'ionq_forte': {
-                'name': 'IonQ Forte Enterprise',
-                'type': 'qpu',
-                'arn': 'arn:aws:braket:us-east-1::device/qpu/ionq/Forte-Enterprise-1',
-                'region': 'us-east-1',
-                'description': 'IonQ trapped ion quantum processor',
-                'advantages': [
-                    'Real quantum hardware',
-                    'High fidelity gates',
-                    'All-to-all qubit connectivity',
-                    'Long coherence times'
-                ],
-                'typical_runtime': '5-30 minutes',
-                'max_qubits': 32,
-                'supports_bell_states': True,
-                'async_required': True,
-                'technology': 'Trapped Ion',
-                'cost_per_task': 0.30,
-                'cost_per_shot': 0.01
-            },
-            'iqm_garnet': {
-                'name': 'IQM Garnet',
-                'type': 'qpu',
-                'arn': 'arn:aws:braket:eu-north-1::device/qpu/iqm/Emerald',
-                'region': 'eu-north-1',
-                'description': 'IQM superconducting quantum processor',
-                'advantages': [
-                    'European quantum hardware',
-                    'Superconducting qubits',
-                    'Fast gate operations',
-                    'Low latency in EU'
-                ],
-                'typical_runtime': '10-45 minutes',
-                'max_qubits': 20,
-                'supports_bell_states': True,
-                'async_required': True,
-                'technology': 'Superconducting',
-                'cost_per_task': 0.30,
-                'cost_per_shot': 0.00145
-            },
-            'aqt_ibex_q1': {
-                'name': 'AQT IBEX Q1',
-                'type': 'qpu',
-                'arn': 'arn:aws:braket:eu-central-1::device/qpu/aqt/IBEX-Q1',
-                'region': 'eu-central-1',
-                'description': 'AQT trapped ion quantum processor',
-                'advantages': [
-                    'High fidelity gates',
-                    'All-to-all connectivity',
-                    'European technology',
-                    'Compact design'
-                ],
-                'typical_runtime': '5-30 minutes',
-                'max_qubits': 12,
-                'supports_bell_states': True,
-                'async_required': True,
-                'technology': 'Trapped Ion',
-                'cost_per_task': 0.30,
-                'cost_per_shot': 0.01
-            },
-            'iqm_emerald': {
-                'name': 'IQM Emerald',
-                'type': 'qpu',
-                'arn': 'arn:aws:braket:eu-north-1::device/qpu/iqm/Emerald',
-                'region': 'eu-north-1',
-                'description': 'IQM 54-qubit superconducting quantum processor',
-                'advantages': [
-                    'European quantum hardware',
-                    '54 superconducting qubits',
-                    'Fast gate operations',
-                    'Scalable crystal lattice architecture'
-                ],
-                'typical_runtime': '10-45 minutes',
-                'max_qubits': 54,
-                'supports_bell_states': True,
-                'async_required': True,
-                'technology': 'Superconducting',
-                'cost_per_task': 0.30,
-                'cost_per_shot': 0.00145
-            },
-            'quera_aquila': {
-                'name': 'QuEra Aquila',
-                'type': 'qpu',
-                'arn': 'arn:aws:braket:us-east-1::device/qpu/quera/Aquila',
-                'region': 'us-east-1',
-                'description': 'QuEra neutral atom quantum processor',
-                'advantages': [
-                    'Neutral atom technology',
-                    'Programmable atom topology',
-                    'Analog quantum simulation',
-                    'Large qubit count (256)'
-                ],
-                'typical_runtime': '15-60 minutes',
-                'max_qubits': 256,
-                'supports_bell_states': False,  # Uses AHS paradigm
-                'async_required': True,
-                'technology': 'Neutral Atom',
-                'paradigm': 'Analog Hamiltonian Simulation (AHS)',
-                'cost_per_task': 0.30,
-                'cost_per_shot': 0.01
-            },
-            'rigetti_ankaa3': {
-                'name': 'Rigetti Ankaa-3',
-                'type': 'qpu',
-                'arn': 'arn:aws:braket:us-west-1::device/qpu/rigetti/Ankaa-3',
-                'region': 'us-west-1',
-                'description': 'Rigetti superconducting quantum processor',
-                'advantages': [
-                    'Parametric gates',
-                    'Fast execution',
-                    'NISQ algorithm support',
-                    'Active qubit reset'
-                ],
-                'typical_runtime': '5-20 minutes',
-                'max_qubits': 84,
-                'supports_bell_states': True,
-                'async_required': True,
-                'technology': 'Superconducting',
-                'cost_per_task': 0.30,
-                'cost_per_shot': 0.00035
-            }
+    def _build_indices(self):
+        """Precompute the filtered device views returned by the getters."""
+        # Frozen like the catalog, since the same records are shared by every getter
+        with_id = [
+            MappingProxyType({**device, 'id': device_id}) for device_id, device in self.devices.items()
+        ]
+
+        by_type: Dict[str, list] = {}
+        for device in with_id:
+            by_type.setdefault(device['type'], []).append(device)
+        self._by_type = {device_type: tuple(group) for device_type, group in by_type.items()}
+
+        # Local devices are available from every region
+        self._local_devices = tuple(d for d in with_id if d['region'] == 'local')
+        self._by_region = {
+            region: tuple(d for d in with_id if d['region'] in (region, 'local'))
+            for region in {d['region'] for d in with_id}
         }
 
+        self._bell_capable = tuple(d for d in with_id if d.get('supports_bell_states', False))
+
+        # Cost columns (structure of arrays) for vectorized estimates
+        self._device_index = {device_id: i for i, device_id in enumerate(self.devices)}
+        self._task_costs = np.array(
+            [d.get('cost_per_task', 0) for d in self.devices.values()], dtype=np.float64
+        )
+        self._shot_costs = np.array(
+            [d.get('cost_per_shot', 0) for d in self.devices.values()], dtype=np.float64
+        )
+
+        summary_by_type: Dict[str, list] = {}
+        summary_by_region: Dict[str, list] = {}
+        for device_id, device in self.devices.items():
+            summary_by_type.setdefault(device['type'], []).append(device_id)
+            summary_by_region.setdefault(device['region'], []).append(device_id)
+        self._summary_by_type = {k: tuple(v) for k, v in summary_by_type.items()}
+        self._summary_by_region = {k: tuple(v) for k, v in summary_by_region.items()}
+
     def get_device_info(self, device_id: str) -> Dict[str, Any]:
         """
         Get information about a specific device.
@@ -253,20 +301,30 @@ class QuantumDeviceManager:
             device_id: Device identifier
 
         Returns:
-            Device configuration dict or empty dict if not found
+            Device configuration dict (a copy) or empty dict if not found
         """
-        return self.devices.get(device_id, {})
+        device = self.devices.get(device_id)
+        return dict(device) if device is not None else {}
 
     def get_available_devices(self) -> Dict[str, Dict[str, Any]]:
         """
         Get all available devices.
 
         Returns:
-            Dict mapping device_id to device configuration
+            Dict mapping device_id to a copy of its configuration, safe to modify
+        """
+        return {device_id: dict(device) for device_id, device in self.devices.items()}
+
+    def get_device_catalog(self) -> Mapping[str, Mapping[str, Any]]:
+        """
+        Get the shared device catalog without copying it.
+
+        Returns:
+            Read-only mapping of device_id to read-only device configuration
         """
-        return self.devices.copy()
+        return self.devices
 
-    def get_device_by_type(self, device_type: str) -> List[Dict[str, Any]]:
+    def get_device_by_type(self, device_type: str) -> Tuple[Mapping[str, Any], ...]:
         """
         Get devices filtered by type.
 
@@ -274,15 +332,11 @@ class QuantumDeviceManager:
             device_type: One of 'simulator', 'managed_simulator', 'qpu'
 
         Returns:
-            List of device configurations with 'id' field added
+            Shared, read-only tuple of device configurations with 'id' field added
         """
-        return [
-            {**device, 'id': device_id}
-            for device_id, device in self.devices.items()
-            if device['type'] == device_type
-        ]
+        return self._by_type.get(device_type, ())
 
-    def get_devices_by_region(self, region: str) -> List[Dict[str, Any]]:
+    def get_devices_by_region(self, region: str) -> Tuple[Mapping[str, Any], ...]:
         """
         Get devices available in a specific region.
 
@@ -290,26 +344,18 @@ class QuantumDeviceManager:
             region: AWS region name
 
         Returns:
-            List of device configurations with 'id' field added
+            Shared, read-only tuple of device configurations with 'id' field added
         """
-        return [
-            {**device, 'id': device_id}
-            for device_id, device in self.devices.items()
-            if device['region'] == region or device['region'] == 'local'
-        ]
+        return self._by_region.get(region, self._local_devices)
 
-    def get_bell_state_capable_devices(self) -> List[Dict[str, Any]]:
+    def get_bell_state_capable_devices(self) -> Tuple[Mapping[str, Any], ...]:
         """
         Get devices that support Bell state circuits.
 
         Returns:
-            List of device configurations with 'id' field added
+            Shared, read-only tuple of device configurations with 'id' field added
         """
-        return [
-            {**device, 'id': device_id}
-            for device_id, device in self.devices.items()
-            if device.get('supports_bell_states', False)
-        ]
+        return self._bell_capable
 
     def estimate_cost(self, device_id: str, shots: int) -> Dict[str, float]:
         """
@@ -322,7 +368,7 @@ class QuantumDeviceManager:
         Returns:
             Dict with cost breakdown
         """
-        device = self.get_device_info(device_id)
+        device = self.devices.get(device_id)
         if not device:
             return {'error': 'Device not found'}
 
@@ -339,6 +385,21 @@ class QuantumDeviceManager:
             'currency': 'USD'
         }
 
+    def estimate_cost_batch(self, device_ids: Sequence[str], shots) -> np.ndarray:
+        """
+        Estimate total cost for many (device, shots) pairs at once.
+
+        Args:
+            device_ids: Device identifiers (KeyError if any is unknown)
+            shots: Shot count, or array of shot counts aligned with device_ids
+
+        Returns:
+            Array of total costs in USD, aligned with device_ids
+        """
+        idx = np.fromiter((self._device_index[d] for d in device_ids),
+                          dtype=np.intp, count=len(device_ids))
+        return self._task_costs[idx] + self._shot_costs[idx] * np.asarray(shots, dtype=np.float64)
+
     def get_device_status_summary(self) -> Dict[str, Any]:
         """
         Get a summary of all device statuses.
@@ -346,23 +407,9 @@ class QuantumDeviceManager:
         Returns:
             Summary dict with counts by type
         """
-        summary = {
+        # Built from the precomputed groups; fresh lists so callers may modify them
+        return {
             'total_devices': len(self.devices),
-            'by_type': {},
-            'by_region': {}
+            'by_type': {k: list(v) for k, v in self._summary_by_type.items()},
+            'by_region': {k: list(v) for k, v in self._summary_by_region.items()}
         }
-
-        for device_id, device in self.devices.items():
-            # Count by type
-            device_type = device['type']
-            if device_type not in summary['by_type']:
-                summary['by_type'][device_type] = []
-            summary['by_type'][device_type].append(device_id)
-
-            # Count by region
-            region = device['region']
-            if region not in summary['by_region']:
-                summary['by_region'][region] = []
-            summary['by_region'][region].append(device_id)
-
-        return summary
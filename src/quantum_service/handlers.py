@@ -8,23 +8,52 @@ AWS Lambda function handlers for quantum key generation API:
 - handler_verify_credentials: Verify AWS permissions
 """
 
+import os
 import json
 import base64
 import logging
-import traceback
-from typing import Dict, Any, Optional
+from typing import Dict, Any, Optional, TYPE_CHECKING
 
 from .credentials import credentials_manager
-from .quantum_service import EnhancedQuantumService
+
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+if TYPE_CHECKING:
+    from .quantum_service import EnhancedQuantumService
 
 # Configure logging
 logger = logging.getLogger(__name__)
 
+# Include the stack trace in 500 responses (set INCLUDE_TRACE=1 when debugging)
+INCLUDE_TRACE = os.getenv("INCLUDE_TRACE", "0") == "1"
+
+# API Gateway envelope keys ignored when parameters come in the event itself
+_EXCLUDED_EVENT_KEYS = frozenset({
+    'requestContext', 'headers', 'routeKey', 'rawPath',
+    'rawQueryString', 'isBase64Encoded', 'version',
+    'pathParameters', 'stageVariables', 'multiValueHeaders'
+})
+
+# Response headers shared by every _build_response call; treat as read-only
+_DEFAULT_HEADERS = {
+    'Content-Type': 'application/json',
+    'Access-Control-Allow-Origin': '*',
+    'Access-Control-Allow-Methods': 'POST, OPTIONS, GET',
+    'Access-Control-Allow-Headers': '*',
+}
+
+# First character of a JSON object or array body, as str and as bytes
+_JSON_CONTAINER_STARTS = frozenset({'{', '[', b'{', b'['})
+
 # Global service instance (reused across Lambda invocations for performance)
-_quantum_service: Optional[EnhancedQuantumService] = None
+_quantum_service: Optional['EnhancedQuantumService'] = None
 
 
-def get_quantum_service() -> EnhancedQuantumService:
+def get_quantum_service() -> 'EnhancedQuantumService':
     """
     Get or create the quantum service instance.
 
@@ -36,12 +65,30 @@ def get_quantum_service() -> EnhancedQuantumService:
     """
     global _quantum_service
     if _quantum_service is None:
+        # Imported here so handlers that don't need it (health, options) skip the Braket SDK
+        from .quantum_service import EnhancedQuantumService
+
         logger.info("Initializing EnhancedQuantumService...")
         _quantum_service = EnhancedQuantumService()
         logger.info("EnhancedQuantumService initialized")
     return _quantum_service
 
 
+def _dumps(obj: Any, default=None) -> str:
+    """Serialize to a JSON string, using orjson when it is installed."""
+    if ORJSON_AVAILABLE:
+        option = orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY
+        return orjson.dumps(obj, default=default, option=option).decode('utf-8')
+    return json.dumps(obj, default=default)
+
+
+def _loads(data):
+    """Parse a JSON str or bytes, using orjson when it is installed."""
+    if ORJSON_AVAILABLE:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
 def _parse_request_body(event: Dict[str, Any]) -> Dict[str, Any]:
     """
     Parse request body from various Lambda event formats.
@@ -64,29 +111,30 @@ def _parse_request_body(event: Dict[str, Any]) -> Dict[str, Any]:
     # Handle base64 encoded body (Function URL / API Gateway)
     if event.get('isBase64Encoded', False) and raw_body:
         try:
-            raw_body = base64.b64decode(raw_body).decode('utf-8')
+            # Left as bytes: both JSON parsers accept them directly
+            raw_body = base64.b64decode(raw_body)
             logger.debug(f"Decoded base64 body")
         except Exception as e:
             logger.warning(f"Failed to decode base64 body: {e}")
 
     # Parse the body
     if raw_body:
-        if isinstance(raw_body, str):
-            try:
-                body = json.loads(raw_body)
-            except json.JSONDecodeError as e:
-                logger.warning(f"JSON decode error: {e}")
+        if isinstance(raw_body, (str, bytes)):
+            # Bodies that cannot be an object or array skip the parser entirely
+            if raw_body.lstrip()[:1] not in _JSON_CONTAINER_STARTS:
+                logger.warning("Request body is not a JSON object or array")
                 body = {}
+            else:
+                try:
+                    body = _loads(raw_body)
+                except ValueError as e:  # JSONDecodeError, or invalid UTF-8 bytes
+                    logger.warning(f"JSON decode error: {e}")
+                    body = {}
         elif isinstance(raw_body, dict):
             body = raw_body
     elif 'body' not in event:
         # Direct invocation - extract parameters from event
-        excluded_keys = {
-            'requestContext', 'headers', 'routeKey', 'rawPath',
-            'rawQueryString', 'isBase64Encoded', 'version',
-            'pathParameters', 'stageVariables', 'multiValueHeaders'
-        }
-        body = {k: v for k, v in event.items() if k not in excluded_keys}
+        body = {k: v for k, v in event.items() if k not in _EXCLUDED_EVENT_KEYS}
 
     return body
 
@@ -104,20 +152,15 @@ def _build_response(status_code: int, body: Dict[str, Any],
     Returns:
         Lambda response dict
     """
-    headers = {
-        'Content-Type': 'application/json',
-        'Access-Control-Allow-Origin': '*',
-        'Access-Control-Allow-Methods': 'POST, OPTIONS, GET',
-        'Access-Control-Allow-Headers': '*',
-    }
+    headers = _DEFAULT_HEADERS
 
     if extra_headers:
-        headers.update(extra_headers)
+        headers = {**_DEFAULT_HEADERS, **extra_headers}
 
     return {
         'statusCode': status_code,
         'headers': headers,
-        'body': json.dumps(body)
+        'body': _dumps(body)
     }
 
 
@@ -160,7 +203,8 @@ def handler(event: Dict[str, Any], context: Any) -> Dict[str, Any]:
         API Gateway compatible response
     """
     logger.info(f"Received event type: {type(event)}")
-    logger.debug(f"Event: {json.dumps(event, default=str)}")
+    if logger.isEnabledFor(logging.DEBUG):
+        logger.debug("Event: %s", _dumps(event, default=str))
 
     try:
         # Parse request body
@@ -198,15 +242,30 @@ def handler(event: Dict[str, Any], context: Any) -> Dict[str, Any]:
 
     except Exception as e:
         error_msg = str(e)
-        stack_trace = traceback.format_exc()
-        logger.error(f"Handler error: {error_msg}")
-        logger.error(f"Stack trace: {stack_trace}")
+        logger.exception(f"Handler error: {error_msg}")
 
-        return _build_response(500, {
+        error_body = {
             'success': False,
-            'error': error_msg,
-            'trace': stack_trace
-        })
+            'error': error_msg
+        }
+        if INCLUDE_TRACE:
+            import traceback
+            error_body['trace'] = traceback.format_exc()
+
+        return _build_response(500, error_body)
+
+
+# Preflight responses never vary, so one shared (read-only) response is returned
+_OPTIONS_RESPONSE = {
+    'statusCode': 200,
+    'headers': {
+        'Access-Control-Allow-Origin': '*',
+        'Access-Control-Allow-Methods': 'POST, OPTIONS, GET',
+        'Access-Control-Allow-Headers': '*',
+        'Access-Control-Max-Age': '86400',  # Cache preflight for 24 hours
+    },
+    'body': ''
+}
 
 
 def handler_options(event: Dict[str, Any], context: Any) -> Dict[str, Any]:
@@ -220,16 +279,7 @@ def handler_options(event: Dict[str, Any], context: Any) -> Dict[str, Any]:
     Returns:
         CORS response
     """
-    return {
-        'statusCode': 200,
-        'headers': {
-            'Access-Control-Allow-Origin': '*',
-            'Access-Control-Allow-Methods': 'POST, OPTIONS, GET',
-            'Access-Control-Allow-Headers': '*',
-            'Access-Control-Max-Age': '86400',  # Cache preflight for 24 hours
-        },
-        'body': ''
-    }
+    return _OPTIONS_RESPONSE
 
 
 def handler_devices(event: Dict[str, Any], context: Any) -> Dict[str, Any]:
@@ -247,19 +297,7 @@ def handler_devices(event: Dict[str, Any], context: Any) -> Dict[str, Any]:
     """
     try:
         service = get_quantum_service()
-        devices = service.device_manager.get_available_devices()
-
-        # Add availability status to each device
-        for device_id, device_info in devices.items():
-            if device_id == 'local_simulator':
-                device_info['status'] = 'Always Available'
-                device_info['aws_configured'] = False
-            elif device_id in service._aws_devices:
-                device_info['status'] = 'AWS Connected'
-                device_info['aws_configured'] = True
-            else:
-                device_info['status'] = 'Requires AWS Configuration'
-                device_info['aws_configured'] = False
+        devices = service.get_devices_view()
 
         return _build_response(200, {
             'success': True,
@@ -340,6 +378,13 @@ def handler_status(event: Dict[str, Any], context: Any) -> Dict[str, Any]:
         })
 
 
+# Health probes get the same pre-serialized response every time
+_HEALTH_RESPONSE = _build_response(200, {
+    'status': 'healthy',
+    'service': 'quantum-key-generator'
+})
+
+
 def handler_health(event: Dict[str, Any], context: Any) -> Dict[str, Any]:
     """
     Health check handler.
@@ -353,7 +398,13 @@ def handler_health(event: Dict[str, Any], context: Any) -> Dict[str, Any]:
     Returns:
         Health status
     """
-    return _build_response(200, {
-        'status': 'healthy',
-        'service': 'quantum-key-generator'
-    })
+    return _HEALTH_RESPONSE
+
+
+# Build the service during the init phase when it is free (SnapStart, or
+# EAGER_INIT=1 for provisioned concurrency) instead of on the first request
+if os.getenv("EAGER_INIT", "0") == "1" or os.getenv("AWS_LAMBDA_INITIALIZATION_TYPE") == "snap-start":
+    try:
+        get_quantum_service()
+    except Exception as e:
+        logger.warning(f"Eager service initialization failed, deferring to first request: {e}")
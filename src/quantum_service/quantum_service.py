@@ -16,8 +16,15 @@ import hashlib
 import secrets
 import random
 import logging
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
-from typing import Dict, Any, List, Optional
+from functools import lru_cache
+from operator import itemgetter
+from types import MappingProxyType
+from typing import Dict, Any, List, Optional, Tuple
+
+import numpy as np
 
 from .credentials import credentials_manager, AWS_SDK_AVAILABLE
 from .devices import QuantumDeviceManager
@@ -28,7 +35,7 @@ logger = logging.getLogger(__name__)
 
 # Braket SDK imports
 try:
-    from braket.aws import AwsDevice
+    from braket.aws import AwsDevice, AwsSession
     from braket.circuits import Circuit
     from braket.devices import LocalSimulator
     BRAKET_SDK_AVAILABLE = True
@@ -38,7 +45,6 @@ except ImportError:
 
 # AHS imports for QuEra Aquila
 try:
-    import numpy as np
     from braket.tasks.analog_hamiltonian_simulation_quantum_task_result import (
         AnalogHamiltonianSimulationQuantumTaskResult as AhsResult
     )
@@ -51,6 +57,114 @@ except ImportError:
     AHS_AVAILABLE = False
     logger.warning("AHS modules not available, QuEra Aquila support disabled")
 
+# Upper bound on cached circuit results (LRU eviction beyond this)
+CIRCUIT_CACHE_MAX_ENTRIES = int(os.getenv("CIRCUIT_CACHE_MAX_ENTRIES", "10000"))
+
+# AHS spin configuration byte -> bit character, in one C-level translate
+_SPIN_TO_BIT = bytes(0x31 if code == ord('r') else 0x30 for code in range(256))
+
+# One MHz as an angular frequency (rad/s), for AHS drive amplitudes
+_TWO_PI_MHZ = math.tau * 1e6
+
+_TERMINAL_TASK_STATES = frozenset({'COMPLETED', 'FAILED', 'CANCELLED'})
+_TASK_POLL_INITIAL_DELAY = 0.1
+_TASK_POLL_BACKOFF = 1.7
+
+# Read-only stand-in for unknown device ids in internal catalog lookups
+_UNKNOWN_DEVICE = MappingProxyType({})
+
+
+def _wait_for_task(task: Any, max_wait: float, max_delay: float, timeout_message: str):
+    """Poll a Braket task until it reaches a terminal state.
+
+    The delay starts at 100 ms and grows geometrically up to max_delay, so
+    fast simulator tasks return promptly without hammering GetQuantumTask
+    on long QPU runs.
+    """
+    delay = _TASK_POLL_INITIAL_DELAY
+    deadline = time.monotonic() + max_wait
+    while task.state() not in _TERMINAL_TASK_STATES:
+        if time.monotonic() > deadline:
+            raise Exception(timeout_message)
+        time.sleep(delay)
+        delay = min(delay * _TASK_POLL_BACKOFF, max_delay)
+
+
+# Big-endian bit weights for the combined circuit's 8 measured qubits
+_OUTCOME_BIT_WEIGHTS = 1 << np.arange(7, -1, -1, dtype=np.int64)
+
+# RY angle per seed character code: (code / 128) * pi
+_RY_ANGLE_SCALE = math.pi / 128.0
+_RY_ANGLE_LUT = tuple(code * _RY_ANGLE_SCALE for code in range(256))
+
+
+def _ry_angles(seed_text: str) -> List[float]:
+    """Map seed characters to RY rotation angles."""
+    return [_RY_ANGLE_LUT[code] if code < 256 else code * _RY_ANGLE_SCALE
+            for code in map(ord, seed_text)]
+
+
+_DEVICE_HUE_SHIFTS = (
+    ('ionq', 60),      # Blue-green
+    ('iqm', 120),      # Green
+    ('quera', 180),    # Red/Cyan
+    ('rigetti', 240),  # Purple
+    ('aws', 300),      # Magenta
+)
+
+
+def _device_color_shift(base_hue: float, device_id: str) -> float:
+    """Apply device-specific color shift."""
+    for key, shift in _DEVICE_HUE_SHIFTS:
+        if key in device_id:
+            return (base_hue + shift) % 360
+    return base_hue
+
+
+@lru_cache(maxsize=16)
+def _ahs_driving_field(omega_max: float) -> Any:
+    """Build the AHS global drive; only the Rabi peak varies between calls."""
+    T = 4e-6  # Total time
+    delta_span = _TWO_PI_MHZ
+
+    # Time series for Rabi frequency, detuning, phase
+    omega = TimeSeries().put(0.0, 0.0).put(T/2, omega_max).put(T, 0.0)
+    delta = TimeSeries().put(0.0, -delta_span).put(T, +delta_span)
+    phi = TimeSeries().put(0.0, 0.0).put(T, 0.0)
+
+    return DrivingField(amplitude=omega, detuning=delta, phase=phi)
+
+
+@lru_cache(maxsize=4096)
+def _visual_properties(quantum_number: int, entanglement_data: tuple,
+                       device_id: str, device_type: str) -> Dict[str, Any]:
+    """Cached core of generate_visual_properties; callers must copy the result."""
+    # Base color using golden angle for good distribution
+    hue = (quantum_number * 137.5) % 360
+
+    # Device-specific color modifications
+    hue = _device_color_shift(hue, device_id)
+
+    # Saturation and lightness from entanglement data
+    saturation = 70 + (sum(entanglement_data) * 30)
+    lightness = 45 + (entanglement_data[0] * 20 if entanglement_data else 0)
+
+    # Position based on quantum number
+    position_x = 10 + (quantum_number * 137.5 % 80)
+    position_y = 10 + ((quantum_number * 61.8) % 80)
+
+    # Size factor from entanglement
+    size_factor = 0.8 + (entanglement_data[3] * 0.4 if len(entanglement_data) > 3 else 0.2)
+
+    return {
+        'color': f"hsl({hue:.1f}, {saturation:.1f}%, {lightness:.1f}%)",
+        'position_x': position_x,
+        'position_y': position_y,
+        'pulse_speed': 2 + (quantum_number % 3),
+        'size_factor': size_factor,
+        'device_indicator': device_type
+    }
+
 
 class EnhancedQuantumService:
     """
@@ -69,9 +183,12 @@ class EnhancedQuantumService:
         """Initialize the quantum service."""
         self.device_manager = QuantumDeviceManager()
         self.crypto_service = QuantumResistantCrypto()
-        self._circuit_cache: Dict[str, int] = {}
+        self._circuit_cache: "OrderedDict[Tuple[str, str], int]" = OrderedDict()
         self._aws_devices: Dict[str, Any] = {}
+        self._aws_sessions: Dict[str, Any] = {}
         self._local_simulator = None
+        self._devices_view: Optional[Dict[str, Dict[str, Any]]] = None
+        self._devices_view_key: Optional[frozenset] = None
 
         # Initialize local simulator
         self._initialize_local_simulator()
@@ -101,10 +218,26 @@ class EnhancedQuantumService:
                 logger.warning(f"Braket permissions check failed: {perm_check.get('error')}")
                 return
 
-            # Initialize each AWS device
-            for device_id, device_info in self.device_manager.devices.items():
-                if device_info['arn'].startswith('arn:aws:braket'):
-                    self._init_single_device(device_id, device_info)
+            targets = [
+                (device_id, device_info)
+                for device_id, device_info in self.device_manager.devices.items()
+                if device_info['arn'].startswith('arn:aws:braket')
+            ]
+            if not targets:
+                return
+
+            # Build the per-region sessions up front; the credential caches
+            # are not thread-safe, the GetDevice calls below are independent
+            for region in {info.get('region', 'us-east-1') for _, info in targets}:
+                try:
+                    self._get_aws_session(region)
+                except Exception as e:
+                    logger.warning(f"Could not create Braket session for {region}: {e}")
+
+            # Each AwsDevice() blocks on a GetDevice round-trip; overlap them
+            with ThreadPoolExecutor(max_workers=min(8, len(targets))) as pool:
+                for device_id, device_info in targets:
+                    pool.submit(self._init_single_device, device_id, device_info)
 
         except Exception as e:
             logger.error(f"AWS device initialization failed: {e}")
@@ -114,28 +247,31 @@ class EnhancedQuantumService:
         try:
             device_region = device_info.get('region', 'us-east-1')
 
-            # Get session for the device's region
-            session = credentials_manager.get_session(device_region)
-            if not session:
+            aws_session = self._get_aws_session(device_region)
+            if not aws_session:
                 return
 
-            # Set region for Braket SDK
-            original_region = os.environ.get('AWS_DEFAULT_REGION')
-            os.environ['AWS_DEFAULT_REGION'] = device_region
-
-            try:
-                self._aws_devices[device_id] = AwsDevice(device_info['arn'])
-                logger.info(f"Initialized AWS device: {device_info['name']} in {device_region}")
-            finally:
-                # Restore original region
-                if original_region:
-                    os.environ['AWS_DEFAULT_REGION'] = original_region
-                elif 'AWS_DEFAULT_REGION' in os.environ:
-                    del os.environ['AWS_DEFAULT_REGION']
+            self._aws_devices[device_id] = AwsDevice(device_info['arn'], aws_session=aws_session)
+            logger.info(f"Initialized AWS device: {device_info['name']} in {device_region}")
 
         except Exception as e:
             logger.warning(f"Could not initialize {device_id}: {e}")
 
+    def _get_aws_session(self, device_region: str) -> Optional[Any]:
+        """Get a Braket AwsSession bound to device_region, shared per region."""
+        aws_session = self._aws_sessions.get(device_region)
+        if aws_session is None:
+            session = credentials_manager.get_session(device_region)
+            if not session:
+                return None
+            aws_session = AwsSession(boto_session=session)
+            # Simulator ARNs carry no region, so AwsDevice uses the session's;
+            # the default-chain boto3 session is shared across regions
+            if aws_session.region != device_region:
+                aws_session = aws_session.copy_session(region=device_region)
+            self._aws_sessions[device_region] = aws_session
+        return aws_session
+
     def _should_use_aws_device(self, device_id: str, device_info: Dict[str, Any]) -> bool:
         """
         Check if we should execute on the actual AWS device vs local simulator.
@@ -172,16 +308,19 @@ class EnhancedQuantumService:
         Returns:
             Dict mapping bitstring outcomes to counts
         """
-        counts = {}
-        for shot in range(shots):
-            shot_hash = hashlib.sha256(f"{seed}_{shot}".encode()).hexdigest()
-            result = ''
-            for i in range(num_qubits):
-                hex_part = shot_hash[i * 2:i * 2 + 2]
-                val = int(hex_part, 16)
-                result += '0' if val < 128 else '1'
-            counts[result] = counts.get(result, 0) + 1
-        return counts
+        # One XOF byte per (shot, qubit); byte >= 128 measures the qubit as 1
+        stream = hashlib.shake_128(seed.encode()).digest(shots * num_qubits)
+        shot_bytes = np.frombuffer(stream, dtype=np.uint8).reshape(shots, num_qubits)
+        weights = 1 << np.arange(num_qubits - 1, -1, -1, dtype=np.int64)
+        outcomes = (shot_bytes >= 128).astype(np.int64) @ weights
+
+        # Keep first-seen order so ties resolve as they did shot by shot
+        values, first_seen, counts = np.unique(outcomes, return_index=True, return_counts=True)
+        order = np.argsort(first_seen)
+        return {
+            format(int(values[i]), f'0{num_qubits}b'): int(counts[i])
+            for i in order
+        }
 
     # -------------------------------------------------------------------------
     # Quantum Random Number Generation
@@ -199,18 +338,19 @@ class EnhancedQuantumService:
             Quantum-derived random integer
         """
         # Check cache
-        cache_key = hashlib.md5(f"{device_id}_{seed_text}".encode()).hexdigest()
-        if cache_key in self._circuit_cache:
-            base_result = self._circuit_cache[cache_key]
+        cache_key = (device_id, seed_text)
+        base_result = self._circuit_cache.get(cache_key)
+        if base_result is not None:
+            self._circuit_cache.move_to_end(cache_key)
             return (base_result + int(time.time())) % 1000
 
-        device_info = self.device_manager.get_device_info(device_id)
+        device_info = self.device_manager.devices.get(device_id, _UNKNOWN_DEVICE)
 
         # Special handling for QuEra Aquila (AHS paradigm)
         if "quera" in device_id and AHS_AVAILABLE:
             try:
                 quantum_number = self._ahs_quantum_number(device_id, seed_text)
-                self._circuit_cache[cache_key] = quantum_number
+                self._cache_put(cache_key, quantum_number)
                 return quantum_number
             except Exception as e:
                 logger.error(f"AHS execution error: {e}")
@@ -219,7 +359,7 @@ class EnhancedQuantumService:
         if BRAKET_SDK_AVAILABLE and self._local_simulator:
             try:
                 quantum_number = self._generate_with_braket(device_id, seed_text, device_info)
-                self._circuit_cache[cache_key] = quantum_number
+                self._cache_put(cache_key, quantum_number)
                 return quantum_number
             except Exception as e:
                 logger.error(f"Braket circuit execution error: {e}")
@@ -227,6 +367,13 @@ class EnhancedQuantumService:
         # Fallback to local simulation
         return self._generate_with_local_sim(device_id, seed_text, device_info, cache_key)
 
+    def _cache_put(self, cache_key: Tuple[str, str], quantum_number: int):
+        """Store a circuit result, evicting the least recently used entry."""
+        self._circuit_cache[cache_key] = quantum_number
+        self._circuit_cache.move_to_end(cache_key)
+        if len(self._circuit_cache) > CIRCUIT_CACHE_MAX_ENTRIES:
+            self._circuit_cache.popitem(last=False)
+
     def _generate_with_braket(self, device_id: str, seed_text: str,
                                device_info: Dict[str, Any]) -> int:
         """Generate random number using Braket SDK."""
@@ -250,8 +397,7 @@ class EnhancedQuantumService:
                     circuit.cnot(i, j)
 
         # Parameterized rotations based on input
-        for i, char in enumerate(seed_text[:num_qubits]):
-            angle = (ord(char) / 128.0) * 3.14159
+        for i, angle in enumerate(_ry_angles(seed_text[:num_qubits])):
             circuit.ry(i, angle)
 
         # Measure all qubits
@@ -262,21 +408,18 @@ class EnhancedQuantumService:
         return self._execute_circuit(circuit, device_id, shots=10)
 
     def _generate_with_local_sim(self, device_id: str, seed_text: str,
-                                  device_info: Dict[str, Any], cache_key: str) -> int:
+                                  device_info: Dict[str, Any],
+                                  cache_key: Tuple[str, str]) -> int:
         """Generate random number using local simulation."""
         num_qubits = min(8, device_info.get('max_qubits', 8))
         counts = self.simulate_quantum_local(num_qubits, 100, seed_text)
 
-        # Extract most common result
-        max_count = 0
-        max_state = '0' * num_qubits
-        for state, count in counts.items():
-            if count > max_count:
-                max_count = count
-                max_state = state
+        # Extract most common result (first seen wins ties, as before)
+        max_state, _ = max(counts.items(), key=itemgetter(1),
+                           default=('0' * num_qubits, 0))
 
         quantum_number = int(max_state, 2)
-        self._circuit_cache[cache_key] = quantum_number
+        self._cache_put(cache_key, quantum_number)
         return quantum_number
 
     def _execute_circuit(self, circuit: Any, device_id: str, shots: int = 10) -> int:
@@ -292,7 +435,7 @@ class EnhancedQuantumService:
             Integer from binary measurement result
         """
         try:
-            device_info = self.device_manager.get_device_info(device_id)
+            device_info = self.device_manager.devices.get(device_id, _UNKNOWN_DEVICE)
             if self._should_use_aws_device(device_id, device_info):
                 # Use AWS managed simulator (SV1, DM1, TN1)
                 return self._execute_on_aws_device(circuit, device_id, shots)
@@ -301,7 +444,7 @@ class EnhancedQuantumService:
                 task = self._local_simulator.run(circuit, shots=shots)
                 result = task.result()
                 measurement = result.measurement_counts
-                binary_result = list(measurement.keys())[0]
+                binary_result = next(iter(measurement))
                 return int(binary_result, 2)
 
         except Exception as e:
@@ -315,20 +458,16 @@ class EnhancedQuantumService:
         aws_device = self._aws_devices[device_id]
         task = aws_device.run(circuit, shots=shots)
 
-        device_info = self.device_manager.get_device_info(device_id)
+        device_info = self.device_manager.devices.get(device_id, _UNKNOWN_DEVICE)
         if device_info.get('async_required', False):
             # Wait for completion (managed simulators typically finish in seconds)
             max_wait_time = 300  # 5 min max for simulators
-            start_time = time.time()
-
-            while task.state() not in ['COMPLETED', 'FAILED', 'CANCELLED']:
-                if time.time() - start_time > max_wait_time:
-                    raise Exception(f"Task timeout after {max_wait_time} seconds")
-                time.sleep(2)
+            _wait_for_task(task, max_wait_time, 2.0,
+                           f"Task timeout after {max_wait_time} seconds")
 
         result = task.result()
         measurement = result.measurement_counts
-        binary_result = list(measurement.keys())[0]
+        binary_result = next(iter(measurement))
         return int(binary_result, 2)
 
     # -------------------------------------------------------------------------
@@ -352,33 +491,26 @@ class EnhancedQuantumService:
         if not AHS_AVAILABLE:
             raise Exception("AHS modules not available")
 
-        STATE_TO_BIT = {"g": "0", "r": "1", "e": "0"}
-
         def create_ahs_program(seed: str, num_atoms: int = 8):
             um = 1e-6  # micrometers
 
-            # Atom register (1D chain)
+            # Atom register (1D chain); add() stores tuple(coordinate), so
+            # plain tuples skip a throwaway ndarray per atom
             register = AtomArrangement()
             for i in range(num_atoms):
-                register.add(np.array([i * 5 * um, 0.0]))
+                register.add((i * 5 * um, 0.0))
 
             # Global driving field parameters
-            T = 4e-6  # Total time
             base = 1.0 + (abs(hash(seed)) % 5)
-            omega_max = min(1580000, 2 * math.pi * base * 1e6)
-            delta_span = 2 * math.pi * 1e6
+            omega_max = min(1580000, base * _TWO_PI_MHZ)
 
-            # Time series for Rabi frequency, detuning, phase
-            omega = TimeSeries().put(0.0, 0.0).put(T/2, omega_max).put(T, 0.0)
-            delta = TimeSeries().put(0.0, -delta_span).put(T, +delta_span)
-            phi = TimeSeries().put(0.0, 0.0).put(T, 0.0)
-
-            drive = DrivingField(amplitude=omega, detuning=delta, phase=phi)
+            drive = _ahs_driving_field(omega_max)
             return AnalogHamiltonianSimulation(register=register, hamiltonian=drive)
 
         def spin_config_to_int(spin_config: str) -> int:
-            bitstr = "".join(STATE_TO_BIT.get(ch, "0") for ch in spin_config)
-            return int(bitstr, 2) if bitstr else 0
+            # Rydberg atoms are 1s; everything else (g, e, unknown) is 0
+            bits = spin_config.encode('ascii', 'replace').translate(_SPIN_TO_BIT)
+            return int(bits, 2) if bits else 0
 
         seed = f"{device_id}_{seed_text}"
         program = create_ahs_program(seed)
@@ -389,12 +521,7 @@ class EnhancedQuantumService:
             task = aquila.run(program, shots=10)
 
             # Wait for result
-            max_wait = 3600
-            start = time.time()
-            while task.state() not in ['COMPLETED', 'FAILED', 'CANCELLED']:
-                if time.time() - start > max_wait:
-                    raise Exception("AHS task timeout")
-                time.sleep(10)
+            _wait_for_task(task, 3600, 10.0, "AHS task timeout")
 
             result = task.result()
             counts = AhsResult.from_object(result).get_counts() or {}
@@ -424,7 +551,7 @@ class EnhancedQuantumService:
         Returns:
             List of probabilities [P(00), P(01), P(10), P(11)]
         """
-        device_info = self.device_manager.get_device_info(device_id)
+        device_info = self.device_manager.devices.get(device_id, _UNKNOWN_DEVICE)
 
         # QuEra doesn't support Bell states (different paradigm)
         if not device_info.get('supports_bell_states', True):
@@ -454,12 +581,7 @@ class EnhancedQuantumService:
             task = aws_device.run(circuit, shots=shots)
 
             if device_info.get('async_required', False):
-                max_wait = 3600
-                start = time.time()
-                while task.state() not in ['COMPLETED', 'FAILED', 'CANCELLED']:
-                    if time.time() - start > max_wait:
-                        raise Exception("Bell state task timeout")
-                    time.sleep(5)
+                _wait_for_task(task, 3600, 5.0, "Bell state task timeout")
         else:
             task = self._local_simulator.run(circuit, shots=shots)
 
@@ -509,49 +631,16 @@ class EnhancedQuantumService:
         Returns:
             Dict with visual properties
         """
-        device_info = self.device_manager.get_device_info(device_id)
-
-        # Base color using golden angle for good distribution
-        hue = (quantum_number * 137.5) % 360
-
-        # Device-specific color modifications
-        hue = self._apply_device_color_shift(hue, device_id)
-
-        # Saturation and lightness from entanglement data
-        saturation = 70 + (sum(entanglement_data) * 30)
-        lightness = 45 + (entanglement_data[0] * 20 if entanglement_data else 0)
-
-        # Position based on quantum number
-        position_x = 10 + (quantum_number * 137.5 % 80)
-        position_y = 10 + ((quantum_number * 61.8) % 80)
-
-        # Size factor from entanglement
-        size_factor = 0.8 + (entanglement_data[3] * 0.4 if len(entanglement_data) > 3 else 0.2)
-
-        return {
-            'color': f"hsl({hue:.1f}, {saturation:.1f}%, {lightness:.1f}%)",
-            'position_x': position_x,
-            'position_y': position_y,
-            'pulse_speed': 2 + (quantum_number % 3),
-            'size_factor': size_factor,
-            'device_indicator': device_info.get('type', 'unknown')
-        }
+        device_info = self.device_manager.devices.get(device_id, _UNKNOWN_DEVICE)
+        # Copy so callers never mutate the cached entry
+        return dict(_visual_properties(
+            quantum_number, tuple(entanglement_data), device_id,
+            device_info.get('type', 'unknown')
+        ))
 
     def _apply_device_color_shift(self, base_hue: float, device_id: str) -> float:
         """Apply device-specific color shift."""
-        shifts = {
-            'ionq': 60,      # Blue-green
-            'iqm': 120,      # Green
-            'quera': 180,    # Red/Cyan
-            'rigetti': 240,  # Purple
-            'aws': 300       # Magenta
-        }
-
-        for key, shift in shifts.items():
-            if key in device_id:
-                return (base_hue + shift) % 360
-
-        return base_hue
+        return _device_color_shift(base_hue, device_id)
 
     # -------------------------------------------------------------------------
     # Combined Quantum Operations (Single Task)
@@ -572,7 +661,7 @@ class EnhancedQuantumService:
         Returns:
             Dict with 'quantum_number' and 'entanglement_data'
         """
-        device_info = self.device_manager.get_device_info(device_id)
+        device_info = self.device_manager.devices.get(device_id, _UNKNOWN_DEVICE)
 
         # QuEra doesn't support this circuit paradigm
         if "quera" in device_id:
@@ -612,8 +701,7 @@ class EnhancedQuantumService:
             circuit.cnot(i, i + 1)
 
         # Parameterized rotations based on seed
-        for i, char in enumerate(seed_text[:num_random_qubits]):
-            angle = (ord(char) / 128.0) * 3.14159
+        for i, angle in enumerate(_ry_angles(seed_text[:num_random_qubits])):
             circuit.ry(i, angle)
 
         # === Bell State (qubits 6-7) ===
@@ -633,44 +721,26 @@ class EnhancedQuantumService:
             task = aws_device.run(circuit, shots=shots)
 
             if device_info.get('async_required', False):
-                max_wait = 300  # 5 min max for simulators
-                start = time.time()
-                while task.state() not in ['COMPLETED', 'FAILED', 'CANCELLED']:
-                    if time.time() - start > max_wait:
-                        raise Exception("Combined quantum task timeout")
-                    time.sleep(2)
+                # 5 min max for simulators
+                _wait_for_task(task, 300, 2.0, "Combined quantum task timeout")
         else:
             # Use local simulator (for QPU devices and fallback)
             task = self._local_simulator.run(circuit, shots=shots)
 
         result = task.result()
-        counts = result.measurement_counts
 
-        # Parse results
-        # Random number from qubits 0-5 (first 6 bits)
-        random_sum = 0
-        total_shots = sum(counts.values())
-
-        for bitstring, count in counts.items():
-            # Bitstring is in reverse order (qubit 7 is leftmost)
-            # Extract bits for random number (positions 2-7 in 8-bit string)
-            random_bits = bitstring[2:8] if len(bitstring) >= 8 else bitstring[-6:]
-            random_sum += int(random_bits, 2) * count
+        # Pack the raw (shots, 8) measurement matrix into one integer per
+        # shot, matching int(bitstring, 2) without building the strings
+        outcomes = result.measurements @ _OUTCOME_BIT_WEIGHTS
+        total_shots = len(outcomes)
 
+        # Random number from positions 2-7 of the bitstring (low 6 bits)
+        random_sum = int((outcomes & 0x3F).sum())
         quantum_number = int(random_sum / total_shots) % 1000
 
-        # Bell state probabilities from qubits 6-7 (first 2 bits)
-        bell_counts = {'00': 0, '01': 0, '10': 0, '11': 0}
-        for bitstring, count in counts.items():
-            bell_bits = bitstring[0:2] if len(bitstring) >= 2 else '00'
-            bell_counts[bell_bits] = bell_counts.get(bell_bits, 0) + count
-
-        entanglement_data = [
-            bell_counts['00'] / total_shots,
-            bell_counts['01'] / total_shots,
-            bell_counts['10'] / total_shots,
-            bell_counts['11'] / total_shots
-        ]
+        # Bell state probabilities from positions 0-1 (high 2 bits)
+        bell_counts = np.bincount(outcomes >> 6, minlength=4)
+        entanglement_data = (bell_counts / total_shots).tolist()
 
         return {
             'quantum_number': quantum_number,
@@ -726,7 +796,7 @@ class EnhancedQuantumService:
             Complete signature result dict
         """
         try:
-            device_info = self.device_manager.get_device_info(device_id)
+            device_info = self.device_manager.devices.get(device_id, _UNKNOWN_DEVICE)
             if not device_info:
                 return {'success': False, 'error': f'Unknown device: {device_id}'}
 
@@ -756,18 +826,24 @@ class EnhancedQuantumService:
             )
 
             # Step 6: Generate blockchain-like identifiers
-            timestamp = datetime.now().isoformat()
-            transaction_id = hashlib.sha256(
-                f"{name}{message}{timestamp}".encode()
-            ).hexdigest()[:16]
-            block_hash = hashlib.sha256(
-                f"{transaction_id}{signature}".encode()
-            ).hexdigest()
+            now = datetime.now()
+            timestamp = now.isoformat()
+            # Fed piecewise; same digests as hashing the concatenated strings
+            tx_hasher = hashlib.sha256(name.encode())
+            tx_hasher.update(message.encode())
+            tx_hasher.update(timestamp.encode())
+            transaction_id = tx_hasher.hexdigest()[:16]
+            # Chained on the transaction id, so this needs a second hash
+            block_hasher = hashlib.sha256(transaction_id.encode())
+            block_hasher.update(signature.encode())
+            block_hash = block_hasher.hexdigest()
 
             # Generate quantum ID and job ID
             num_qubits = min(8, device_info.get('max_qubits', 8))
-            quantum_id = f"{quantum_number / (2 ** num_qubits):.4f}"
-            job_id = f"QJ-{datetime.now().year}-{secrets.randbelow(9999):04d}"
+            quantum_id = f"{quantum_number / (1 << num_qubits):.4f}"
+            # One 32-bit draw; modulo bias (~2e-6) is irrelevant for a display id
+            job_number = int.from_bytes(secrets.token_bytes(4), 'big') % 9999
+            job_id = f"QJ-{now.year}-{job_number:04d}"
 
             # Determine processing method
             if self._should_use_aws_device(device_id, device_info):
@@ -799,6 +875,32 @@ class EnhancedQuantumService:
             logger.error(f"Quantum signature processing error: {e}")
             return {'success': False, 'error': str(e)}
 
+    def get_devices_view(self) -> Dict[str, Dict[str, Any]]:
+        """
+        Get all devices annotated with availability status.
+
+        The view is rebuilt only when the set of initialized AWS devices
+        changes; callers must treat it as read-only.
+
+        Returns:
+            Dict mapping device_id to device configuration with 'status'
+            and 'aws_configured' fields
+        """
+        key = frozenset(self._aws_devices)
+        if self._devices_view is None or self._devices_view_key != key:
+            devices = {}
+            for device_id, device_info in self.device_manager.get_device_catalog().items():
+                if device_id == 'local_simulator':
+                    status, aws_configured = 'Always Available', False
+                elif device_id in self._aws_devices:
+                    status, aws_configured = 'AWS Connected', True
+                else:
+                    status, aws_configured = 'Requires AWS Configuration', False
+                devices[device_id] = {**device_info, 'status': status, 'aws_configured': aws_configured}
+            self._devices_view = devices
+            self._devices_view_key = key
+        return self._devices_view
+
     def clear_cache(self):
         """Clear the circuit result cache."""
         self._circuit_cache.clear()
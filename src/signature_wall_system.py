@@ -4,13 +4,16 @@ import json
 import random
 import time
 import sqlite3
+import struct
 from datetime import datetime
-from typing import Dict, Any, List
+from functools import lru_cache
+from typing import Dict, Any, List, Optional
 import threading
 import secrets
 import base64
 
 import boto3
+import numpy as np
 from braket.aws import AwsDevice
 from braket.circuits import Circuit
 from braket.devices import LocalSimulator
@@ -29,25 +32,31 @@ def _sample_small(count: int, bound: int = 1) -> List[int]:
     # Very small entries in [-bound, bound] (toy noise/secret)
     return [secrets.randbelow(2 * bound + 1) - bound for _ in range(count)]
 
-def _prng_matrix_from_seed(seed: bytes, q: int, m: int, n: int) -> List[List[int]]:
-    # Deterministic matrix generation from seed (toy XOF expander)
-    A = []
-    counter = 0
-    while len(A) < m:
-        row = []
-        while len(row) < n:
-            block = _shake256(seed + _int_to_be(counter, 4), 2)
-            val = int.from_bytes(block, "big") % q
-            row.append(val)
-            counter += 1
-        A.append(row)
-    return A
-
-def _mat_vec(A: List[List[int]], s: List[int], q: int) -> List[int]:
-    return [sum(aij * sj for aij, sj in zip(ai, s)) % q for ai in A]
-
-def _vec_add(u: List[int], v: List[int], q: int) -> List[int]:
-    return [(x + y) % q for x, y in zip(u, v)]
+def _prng_matrix_from_seed(seed: bytes, q: int, m: int, n: int) -> np.ndarray:
+    # Deterministic matrix generation from seed (toy XOF expander), as int64.
+    # Same expansion as quantum_service.crypto: one SHAKE256 squeeze per block,
+    # 16-bit LE words rejected at/above the largest multiple of q (unbiased).
+    count = m * n
+    cutoff = (65536 // q) * q
+    samples = []
+    accepted = 0
+    block = 0
+    while accepted < count:
+        # 2x oversampling, so a second block is only needed in rare cases
+        words = np.frombuffer(_shake256(seed + _int_to_be(block, 4), 4 * count), dtype="<u2")
+        words = words[words < cutoff]
+        samples.append(words)
+        accepted += words.size
+        block += 1
+    A = np.concatenate(samples)[:count].astype(np.int64) % q
+    return A.reshape(m, n)
+
+def _mat_vec(A: np.ndarray, s: List[int], q: int) -> np.ndarray:
+    # int64 is exact here: n * (q - 1) * bound stays far below 2**63
+    return (A @ np.asarray(s, dtype=np.int64)) % q
+
+def _vec_add(u: np.ndarray, v: List[int], q: int) -> np.ndarray:
+    return (u + np.asarray(v, dtype=np.int64)) % q
 
 class ToyLWE:
     """
@@ -96,16 +105,16 @@ class ToyLWE:
 
         # ---------- 6) Serialize keys (toy format, versioned) ----------
         sk_obj = {
-            "version": "toy-lwe-1",
+            "version": "toy-lwe-2",
             "q": q, "n": n, "m": m, "small_bound": B,
             "s": s,                                  # PRIVATE: secret vector
         }
         pk_obj = {
-            "version": "toy-lwe-1",
+            "version": "toy-lwe-2",
             "q": q, "n": n, "m": m,
             # Keep public key compact: store seed for A instead of A itself
             "A_seed": base64.b64encode(seed_A).decode(),
-            "b": b,                                  # PUBLIC: b = A*s + e (mod q)
+            "b": b.tolist(),                         # PUBLIC: b = A*s + e (mod q)
         }
 
         private_key = base64.b64encode(json.dumps(sk_obj).encode()).decode()
@@ -119,11 +128,18 @@ class ToyLWE:
 
 
 
+# Opt-in: reuse the keypair for a quantum seed seen recently (0 disables).
+# Repeated seeds then share a private key, so leave this off outside load tests.
+KEYPAIR_CACHE_SIZE = int(os.getenv("KEYPAIR_CACHE_SIZE", "0"))
+
 class QuantumResistantCrypto:
     """Quantum-resistant cryptographic operations using quantum random numbers"""
 
     def __init__(self):
-        pass
+        self._lwe = ToyLWE()
+        self._lwe_keypair = self._lwe.generate_quantum_keypair
+        if KEYPAIR_CACHE_SIZE > 0:
+            self._lwe_keypair = lru_cache(maxsize=KEYPAIR_CACHE_SIZE)(self._lwe_keypair)
 
     def generate_quantum_keypair(self, quantum_seed: int) -> Dict[str, str]:
         """Generate quantum-resistant key pair using quantum random number as seed"""
@@ -146,8 +162,7 @@ class QuantumResistantCrypto:
         # private_key = base64.b64encode(private_key_bytes).decode()
         # public_key = base64.b64encode(json.dumps(public_key_data).encode()).decode()
 
-        lwe = ToyLWE()
-        keypair = lwe.generate_quantum_keypair(quantum_seed)
+        keypair = self._lwe_keypair(quantum_seed)
 
         return {
             'private_key': keypair['private_key'],
@@ -157,15 +172,15 @@ class QuantumResistantCrypto:
 
     def sign_message(self, message: str, private_key: str, quantum_entropy: int) -> str:
         """Create quantum-resistant digital signature"""
-        # Simplified signature scheme using quantum entropy
-        message_hash = hashlib.sha256(message.encode()).hexdigest()
-        entropy_hash = hashlib.sha256(str(quantum_entropy).encode()).hexdigest()
-
-        # Combine message hash with quantum entropy
-        signature_data = f"{message_hash}:{entropy_hash}:{private_key[:16]}"
-        signature_hash = hashlib.sha256(signature_data.encode()).hexdigest()
+        # Simplified signature scheme using quantum entropy: one SHA-256 over
+        # message | entropy | key prefix, base64 of the raw 32-byte digest
+        h = hashlib.sha256(message.encode())
+        h.update(b"|")
+        h.update(str(quantum_entropy).encode())
+        h.update(b"|")
+        h.update(private_key[:16].encode())
 
-        return base64.b64encode(signature_hash.encode()).decode()
+        return base64.b64encode(h.digest()).decode()
 
     def verify_signature(self, message: str, signature: str, public_key: str) -> bool:
         """Verify quantum-resistant signature (simplified)"""
@@ -173,6 +188,16 @@ class QuantumResistantCrypto:
         return len(signature) > 0 and len(public_key) > 0
 
 
+def _pack_floats(values: List[float]) -> bytes:
+    # Entanglement data is stored as a BLOB of little-endian float64s
+    return struct.pack(f"<{len(values)}d", *values)
+
+def _unpack_floats(value: Any) -> List[float]:
+    # Rows written before the BLOB format (or by other writers) hold JSON text
+    if isinstance(value, bytes):
+        return list(struct.unpack(f"<{len(value) // 8}d", value))
+    return json.loads(value)
+
 class SignatureWallDatabase:
     """Enhanced database for signature wall functionality"""
 
@@ -180,10 +205,15 @@ class SignatureWallDatabase:
         self.db_path = db_path
         self.lock = threading.Lock()
         self._init_database()
+        # One long-lived writer (serialized by self.lock) plus one reader per thread
+        self._writer = sqlite3.connect(self.db_path, check_same_thread=False, isolation_level=None)
+        self._writer.execute("PRAGMA synchronous=NORMAL")
+        self._readers = threading.local()
 
     def _init_database(self):
         """Initialize database with enhanced tables"""
         with sqlite3.connect(self.db_path) as conn:
+            conn.execute("PRAGMA journal_mode=WAL")
             conn.execute("""
                 CREATE TABLE IF NOT EXISTS signatures (
                     id INTEGER PRIMARY KEY AUTOINCREMENT,
@@ -265,111 +295,185 @@ class SignatureWallDatabase:
             except sqlite3.OperationalError:
                 pass
 
+            # Lets per-device counts be answered from the index alone
+            conn.execute("CREATE INDEX IF NOT EXISTS idx_signatures_device_name ON signatures(device_name)")
+            # Ordered wall listing and the response GROUP BY walk an index instead of sorting
+            conn.execute("CREATE INDEX IF NOT EXISTS idx_signatures_created_at ON signatures(created_at DESC)")
+            conn.execute("CREATE INDEX IF NOT EXISTS idx_signatures_response ON signatures(response)")
+
             conn.commit()
 
+    def _reader(self) -> sqlite3.Connection:
+        """Get this thread's read connection, opening it on first use"""
+        conn = getattr(self._readers, 'conn', None)
+        if conn is None:
+            conn = sqlite3.connect(self.db_path, check_same_thread=False)
+            conn.row_factory = sqlite3.Row
+            self._readers.conn = conn
+        return conn
+
+    _INSERT_SIGNATURE = """
+        INSERT INTO signatures
+        (name, response, quantum_number, entanglement_data, transaction_id,
+         block_hash, timestamp, public_key, private_key, signature,
+         signature_algorithm, visual_color, position_x, position_y,
+         device_id, device_name, local_job_id, device_job_id,
+         local_quantum_number, local_entanglement_data,
+         device_quantum_number, device_entanglement_data)
+        VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+    """
+
+    @staticmethod
+    def _signature_row(signature_data: Dict[str, Any]) -> tuple:
+        return (
+            signature_data['name'],
+            signature_data['response'],
+            signature_data['quantum_number'],
+            _pack_floats(signature_data['entanglement_data']),
+            signature_data['transaction_id'],
+            signature_data['block_hash'],
+            signature_data['timestamp'],
+            signature_data['public_key'],
+            signature_data['private_key'],
+            signature_data['signature'],
+            signature_data['signature_algorithm'],
+            signature_data['visual_color'],
+            signature_data['position_x'],
+            signature_data['position_y'],
+            signature_data.get('device_id', 'local_simulator'),
+            signature_data.get('device_name', 'Local Simulator'),
+            signature_data.get('local_job_id'),
+            signature_data.get('device_job_id'),
+            signature_data.get('local_quantum_number'),
+            _pack_floats(signature_data['local_entanglement_data']) if signature_data.get('local_entanglement_data') else None,
+            signature_data.get('device_quantum_number'),
+            _pack_floats(signature_data['device_entanglement_data']) if signature_data.get('device_entanglement_data') else None
+        )
+
     def add_signature(self, signature_data: Dict[str, Any]) -> int:
         """Add a new signature to the wall"""
         with self.lock:
-            with sqlite3.connect(self.db_path) as conn:
-                cursor = conn.execute("""
-                    INSERT INTO signatures
-                    (name, response, quantum_number, entanglement_data, transaction_id,
-                     block_hash, timestamp, public_key, private_key, signature,
-                     signature_algorithm, visual_color, position_x, position_y,
-                     device_id, device_name, local_job_id, device_job_id,
-                     local_quantum_number, local_entanglement_data,
-                     device_quantum_number, device_entanglement_data)
-                    VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-                """, (
-                    signature_data['name'],
-                    signature_data['response'],
-                    signature_data['quantum_number'],
-                    json.dumps(signature_data['entanglement_data']),
-                    signature_data['transaction_id'],
-                    signature_data['block_hash'],
-                    signature_data['timestamp'],
-                    signature_data['public_key'],
-                    signature_data['private_key'],
-                    signature_data['signature'],
-                    signature_data['signature_algorithm'],
-                    signature_data['visual_color'],
-                    signature_data['position_x'],
-                    signature_data['position_y'],
-                    signature_data.get('device_id', 'local_simulator'),
-                    signature_data.get('device_name', 'Local Simulator'),
-                    signature_data.get('local_job_id'),
-                    signature_data.get('device_job_id'),
-                    signature_data.get('local_quantum_number'),
-                    json.dumps(signature_data.get('local_entanglement_data', [])) if signature_data.get('local_entanglement_data') else None,
-                    signature_data.get('device_quantum_number'),
-                    json.dumps(signature_data.get('device_entanglement_data', [])) if signature_data.get('device_entanglement_data') else None
-                ))
-                conn.commit()
-                return cursor.lastrowid
+            cursor = self._writer.execute(self._INSERT_SIGNATURE, self._signature_row(signature_data))
+            return cursor.lastrowid
 
-    def get_all_signatures(self) -> List[Dict[str, Any]]:
-        """Get all signatures for the wall"""
-        with self.lock:
-            with sqlite3.connect(self.db_path) as conn:
-                conn.row_factory = sqlite3.Row
-                cursor = conn.execute("""
-                    SELECT * FROM signatures
-                    ORDER BY created_at DESC
-                """)
-                rows = cursor.fetchall()
-
-                signatures = []
-                for row in rows:
-                    sig = dict(row)
-                    sig['entanglement_data'] = json.loads(sig['entanglement_data'])
-
-                    # Handle new fields safely
-                    if sig.get('local_entanglement_data'):
-                        sig['local_entanglement_data'] = json.loads(sig['local_entanglement_data'])
-                    if sig.get('device_entanglement_data'):
-                        sig['device_entanglement_data'] = json.loads(sig['device_entanglement_data'])
+    def add_signatures_batch(self, signatures: List[Dict[str, Any]]) -> List[int]:
+        """Add several signatures in one transaction and return their IDs in order"""
+        if not signatures:
+            return []
 
-                    signatures.append(sig)
+        rows = [self._signature_row(signature) for signature in signatures]
+        with self.lock:
+            self._writer.execute("BEGIN IMMEDIATE")
+            try:
+                self._writer.executemany(self._INSERT_SIGNATURE, rows)
+                last_id = self._writer.execute("SELECT last_insert_rowid()").fetchone()[0]
+                self._writer.execute("COMMIT")
+            except Exception:
+                self._writer.execute("ROLLBACK")
+                raise
+
+        # AUTOINCREMENT ids are contiguous inside a single write transaction
+        first_id = last_id - len(rows) + 1
+        return list(range(first_id, last_id + 1))
+
+    def update_device_signature(self, signature_id: int, device_quantum_number: int,
+                                device_entanglement_data: List[float], device_signature: str,
+                                device_public_key: str, device_private_key: str):
+        """Store device quantum results and the device signature for a signature"""
+        with self.lock:
+            self._writer.execute("""
+                UPDATE signatures
+                SET device_quantum_number = ?, device_entanglement_data = ?,
+                    device_signature = ?, device_public_key = ?, device_private_key = ?
+                WHERE id = ?
+            """, (
+                device_quantum_number,
+                _pack_floats(device_entanglement_data),
+                device_signature,
+                device_public_key,
+                device_private_key,
+                signature_id
+            ))
 
-                return signatures
+    def get_all_signatures(self) -> List[Dict[str, Any]]:
+        """Get all signatures for the wall"""
+        cursor = self._reader().execute("""
+            SELECT * FROM signatures
+            ORDER BY created_at DESC
+        """)
+        rows = cursor.fetchall()
+
+        signatures = []
+        for row in rows:
+            sig = dict(row)
+            sig['entanglement_data'] = _unpack_floats(sig['entanglement_data'])
+
+            # Handle new fields safely
+            if sig.get('local_entanglement_data'):
+                sig['local_entanglement_data'] = _unpack_floats(sig['local_entanglement_data'])
+            if sig.get('device_entanglement_data'):
+                sig['device_entanglement_data'] = _unpack_floats(sig['device_entanglement_data'])
+
+            signatures.append(sig)
+
+        return signatures
+
+    def get_signature_by_id(self, signature_id: int) -> Optional[Dict[str, Any]]:
+        """Get the fields needed to upgrade one signature, or None if it does not exist"""
+        row = self._reader().execute(
+            "SELECT id, name, response, device_job_id FROM signatures WHERE id = ?",
+            (signature_id,)
+        ).fetchone()
+        return dict(row) if row else None
 
     def get_signature_stats(self) -> Dict[str, Any]:
         """Get signature wall statistics"""
-        with self.lock:
-            with sqlite3.connect(self.db_path) as conn:
-                # Total signatures
-                cursor = conn.execute("SELECT COUNT(*) FROM signatures")
-                total_signatures = cursor.fetchone()[0]
+        conn = self._reader()
+
+        # Total signatures
+        cursor = conn.execute("SELECT COUNT(*) FROM signatures")
+        total_signatures = cursor.fetchone()[0]
 
-                # Response distribution
-                cursor = conn.execute("SELECT response, COUNT(*) FROM signatures GROUP BY response")
-                response_distribution = dict(cursor.fetchall())
+        # Response distribution
+        cursor = conn.execute("SELECT response, COUNT(*) FROM signatures GROUP BY response")
+        response_distribution = dict(cursor.fetchall())
 
-                # Average quantum number
-                cursor = conn.execute("SELECT AVG(quantum_number) FROM signatures")
-                avg_quantum = cursor.fetchone()[0] or 0
+        # Average quantum number
+        cursor = conn.execute("SELECT AVG(quantum_number) FROM signatures")
+        avg_quantum = cursor.fetchone()[0] or 0
 
-                return {
-                    'total_signatures': total_signatures,
-                    'response_distribution': response_distribution,
-                    'average_quantum_number': round(avg_quantum, 2)
-                }
+        return {
+            'total_signatures': total_signatures,
+            'response_distribution': response_distribution,
+            'average_quantum_number': round(avg_quantum, 2)
+        }
 
     def clear_all_signatures(self) -> Dict[str, Any]:
         """Clear all signatures from the database (admin function)"""
         with self.lock:
-            with sqlite3.connect(self.db_path) as conn:
-                cursor = conn.execute("SELECT COUNT(*) FROM signatures")
-                count_before = cursor.fetchone()[0]
+            self._writer.execute("BEGIN IMMEDIATE")
+            try:
+                count_before = self._writer.execute("SELECT COUNT(*) FROM signatures").fetchone()[0]
+                self._writer.execute("DELETE FROM signatures")
+                self._writer.execute("COMMIT")
+            except Exception:
+                self._writer.execute("ROLLBACK")
+                raise
 
-                conn.execute("DELETE FROM signatures")
-                conn.commit()
+        return {
+            'success': True,
+            'message': f'Cleared {count_before} signatures from the wall',
+            'signatures_removed': count_before
+        }
 
-                return {
-                    'success': True,
-                    'message': f'Cleared {count_before} signatures from the wall',
-                    'signatures_removed': count_before
-                }
+    def close(self):
+        """Close the writer and the calling thread's reader connection"""
+        with self.lock:
+            self._writer.close()
+        conn = getattr(self._readers, 'conn', None)
+        if conn is not None:
+            conn.close()
+            self._readers.conn = None
 
 
 class QuantumSignatureWallSystem:
@@ -401,30 +505,29 @@ class QuantumSignatureWallSystem:
             local_quantum_number = local_result.get('quantum_number') or quantum_result.get('quantum_number', 0)
             local_entanglement_data = local_result.get('entanglement_data') or quantum_result.get('entanglement_data', [0.5, 0, 0, 0.5])
 
-            # Generate LOCAL signature using local quantum results
-            local_keypair = self.crypto_service.generate_quantum_keypair(local_quantum_number)
-            local_message_to_sign = f"{name}|{response}|{local_quantum_number}|local"
-            local_signature = self.crypto_service.sign_message(
-                local_message_to_sign,
-                local_keypair['private_key'],
-                local_quantum_number
-            )
-
             # Initialize device signature variables
             device_signature = None
             device_keypair = None
             device_quantum_number = device_result.get('quantum_number')
             device_entanglement_data = device_result.get('entanglement_data')
 
-            # Generate DEVICE signature if device results are available
+            # Generate LOCAL signature using local quantum results, and the
+            # DEVICE signature if device results are available. Keygen is
+            # CPU-bound, so both run off the event loop and overlap.
+            loop = asyncio.get_running_loop()
+            local_task = loop.run_in_executor(
+                None, self._generate_signature,
+                local_quantum_number, f"{name}|{response}|{local_quantum_number}|local"
+            )
             if device_quantum_number is not None:
-                device_keypair = self.crypto_service.generate_quantum_keypair(device_quantum_number)
-                device_message_to_sign = f"{name}|{response}|{device_quantum_number}|device"
-                device_signature = self.crypto_service.sign_message(
-                    device_message_to_sign,
-                    device_keypair['private_key'],
-                    device_quantum_number
+                device_task = loop.run_in_executor(
+                    None, self._generate_signature,
+                    device_quantum_number, f"{name}|{response}|{device_quantum_number}|device"
                 )
+                ((local_keypair, local_signature),
+                 (device_keypair, device_signature)) = await asyncio.gather(local_task, device_task)
+            else:
+                local_keypair, local_signature = await local_task
 
             # Use local results for visual properties and primary display
             visual_props = self.quantum_service.generate_visual_properties(
@@ -433,8 +536,14 @@ class QuantumSignatureWallSystem:
 
             # Blockchain data (using local signature for primary blockchain entry)
             timestamp = datetime.now().isoformat()
-            transaction_id = hashlib.sha256(f"{name}{response}{timestamp}".encode()).hexdigest()[:16]
-            block_hash = hashlib.sha256(f"{transaction_id}{local_signature}".encode()).hexdigest()
+            # Fed piecewise; same digests as hashing the concatenated strings
+            tx_hasher = hashlib.sha256(name.encode())
+            tx_hasher.update(response.encode())
+            tx_hasher.update(timestamp.encode())
+            transaction_id = tx_hasher.digest()[:8].hex()
+            block_hasher = hashlib.sha256(transaction_id.encode())
+            block_hasher.update(local_signature.encode())
+            block_hash = block_hasher.hexdigest()
 
             # Prepare signature data with dual signatures
             signature_data = {
@@ -501,6 +610,27 @@ class QuantumSignatureWallSystem:
                 'error': str(e)
             }
 
+    async def register_signatures(self, items: List[Tuple], max_concurrency: int = 16) -> List[Dict[str, Any]]:
+        """Register several (name, response[, quantum_device]) signatures concurrently, results in input order"""
+        # Bounded so a large batch cannot flood the quantum service and executor at once
+        semaphore = asyncio.Semaphore(max_concurrency)
+
+        async def _register(item: Tuple) -> Dict[str, Any]:
+            async with semaphore:
+                return await self.register_signature(*item)
+
+        return list(await asyncio.gather(*(_register(item) for item in items)))
+
+    def _generate_signature(self, quantum_number: int, message_to_sign: str) -> Tuple[Dict[str, str], str]:
+        """Generate a keypair from quantum_number and sign message_to_sign with it"""
+        keypair = self.crypto_service.generate_quantum_keypair(quantum_number)
+        signature = self.crypto_service.sign_message(
+            message_to_sign,
+            keypair['private_key'],
+            quantum_number
+        )
+        return keypair, signature
+
     def get_all_signatures(self) -> List[Dict[str, Any]]:
         """Get all signatures for the wall"""
         return self.database.get_all_signatures()
@@ -517,8 +647,7 @@ class QuantumSignatureWallSystem:
         """Upgrade a signature with device quantum results and generate device signature"""
         try:
             # Get the signature
-            signatures = self.database.get_all_signatures()
-            signature = next((s for s in signatures if s['id'] == signature_id), None)
+            signature = self.database.get_signature_by_id(signature_id)
 
             if not signature:
                 return {'success': False, 'error': 'Signature not found'}
@@ -560,21 +689,14 @@ class QuantumSignatureWallSystem:
             )
 
             # Update database with device results and signature
-            with sqlite3.connect(self.database.db_path) as conn:
-                conn.execute("""
-                    UPDATE signatures
-                    SET device_quantum_number = ?, device_entanglement_data = ?,
-                        device_signature = ?, device_public_key = ?, device_private_key = ?
-                    WHERE id = ?
-                """, (
-                    device_quantum_number,
-                    json.dumps(device_entanglement_data),
-                    device_signature,
-                    device_keypair['public_key'],
-                    device_keypair['private_key'],
-                    signature_id
-                ))
-                conn.commit()
+            self.database.update_device_signature(
+                signature_id,
+                device_quantum_number,
+                device_entanglement_data,
+                device_signature,
+                device_keypair['public_key'],
+                device_keypair['private_key']
+            )
 
             return {
                 'success': True,